@@ -12,8 +12,8 @@ def create_consensus_agent() -> Agent:
         api_key=config.LLM_API_KEY,
         base_url=config.LLM_BASE_URL,
         temperature=config.LLM_TEMPERATURE,
-        timeout=60,
-        max_retries=2
+        timeout=config.LLM_TIMEOUT,
+        max_retries=config.LLM_MAX_RETRIES
     )
     
     return Agent(
@@ -16,6 +16,11 @@ def fetch_financial_data(query: str) -> str:
     - Commodity like 'GOLD', 'SILVER', 'OIL'
     - Forex pair like 'EUR/USD', 'GBP/USD'
     """
+    return lookup_financial_data(query)
+
+
+def lookup_financial_data(query: str) -> str:
+    """Plain-function form of the Financial Data Fetcher tool (also used for prefetching)"""
     query_upper = query.upper().strip()
     
     if query_upper in ['GOLD', 'SILVER', 'OIL', 'PLATINUM', 'COPPER']:
@@ -45,8 +50,8 @@ def create_finance_agent() -> Agent:
         api_key=config.LLM_API_KEY,
         base_url=config.LLM_BASE_URL,
         temperature=config.LLM_TEMPERATURE,
-        timeout=300,
-        max_retries=3
+        timeout=config.LLM_TIMEOUT,
+        max_retries=config.LLM_MAX_RETRIES
     )
     
     return Agent(
@@ -3,10 +3,12 @@ from crewai.tools import tool
 from config import config
 from tools.news_api import NewsAPITool
 from tools.serp_api import SerpAPITool
+from tools.evidence_sweep import EvidenceSweepTool
 
 # Initialize clients
 news_client = NewsAPITool()
 serp_client = SerpAPITool()
+sweep_client = EvidenceSweepTool(news_client, serp_client)
 
 @tool("News Article Search")
 def search_news(query: str) -> str:
@@ -62,6 +64,18 @@ def fact_check_search(claim: str) -> str:
     return "\n".join(output)
 
 
+@tool("Evidence Sweep")
+def evidence_sweep(claim: str) -> str:
+    """Search news articles, Google, Google News and fact-checks for a claim in one call."""
+    return sweep_evidence(claim)
+
+
+def sweep_evidence(claim: str) -> str:
+    """Plain-function form of the Evidence Sweep tool (also used for prefetching)"""
+    results = sweep_client.sweep(claim)
+    return sweep_client.format_results(claim, results)
+
+
 def create_news_agent() -> Agent:
     """Create the News Agent for verifying news-related claims."""
     
@@ -70,8 +84,8 @@ def create_news_agent() -> Agent:
         api_key=config.LLM_API_KEY,
         base_url=config.LLM_BASE_URL,
         temperature=config.LLM_TEMPERATURE,
-        timeout=300,
-        max_retries=3
+        timeout=config.LLM_TIMEOUT,
+        max_retries=config.LLM_MAX_RETRIES
     )
     
     return Agent(
@@ -97,6 +111,7 @@ def create_news_agent() -> Agent:
         - Note the publication dates
         - Assess source credibility (Reuters, AP, BBC > blogs)
         - For high-profile claims (political, military): absence of coverage IS evidence""",
+        tools=[evidence_sweep],
         verbose=True,
         allow_delegation=False,
         max_iter=5,
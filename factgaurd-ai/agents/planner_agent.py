@@ -16,8 +16,8 @@ def create_planner_agent() -> Agent:
         api_key=config.LLM_API_KEY,
         base_url=config.LLM_BASE_URL,
         temperature=config.LLM_TEMPERATURE,
-        timeout=300,
-        max_retries=3
+        timeout=config.LLM_TIMEOUT,
+        max_retries=config.LLM_MAX_RETRIES
     )
     
     return Agent(
@@ -1,65 +1,160 @@
 from fastapi import FastAPI, HTTPException
+from fastapi.responses import PlainTextResponse, StreamingResponse
 from pydantic import BaseModel
-from typing import Optional
+from typing import List, Optional
 from fact_verifier import fact_verifier
+from config import config
+from core.bounded_executor import BoundedExecutor, ExecutorSaturated
+from core.metrics import registry as metrics_registry
+from core.search_cache import get_search_cache
+from core.article_cache import get_article_cache
+from core.circuit_breaker import breaker_stats
+from core.deadline import current_deadline, deadline_scope
+from core.rate_limiter import get_rate_limiter
+from core.domain_politeness import DomainPoliteness
+from core.input_router import InputRouter
+from core.url_batch import BatchRejected, UrlBatchRunner
+from tools.article_extractor import ArticleExtractorTool
 from tools.image_text_extractor import ImageTextExtractorTool
+from schemas.verdict_schema import VerdictResult
 import os
 import uvicorn
+import asyncio
 import base64
+import json
 import tempfile
 
 app = FastAPI(title="FactGuard AI Service")
 
+# Verification is synchronous (HTTP + LLM calls), so it runs here instead of on the event loop
+verification_executor = BoundedExecutor(
+    max_workers=config.VERIFY_MAX_CONCURRENCY,
+    max_queue=config.VERIFY_MAX_QUEUE
+)
+
+# Batch URL ingestion: fetches are capped globally and per publisher, verifications separately
+url_batch_runner = UrlBatchRunner(
+    verify=fact_verifier.verify_claim_detailed,
+    router=InputRouter(ArticleExtractorTool(politeness=DomainPoliteness(
+        max_concurrent=config.URL_BATCH_DOMAIN_CONCURRENCY,
+        min_interval=config.URL_BATCH_DOMAIN_DELAY
+    ))),
+    fetch_concurrency=config.URL_BATCH_FETCH_CONCURRENCY,
+    verify_concurrency=config.URL_BATCH_VERIFY_CONCURRENCY,
+    max_active=config.URL_BATCH_MAX_ACTIVE
+)
+
 class ClaimRequest(BaseModel):
     claim: Optional[str] = None
     image: Optional[str] = None
 
+class UrlBatchRequest(BaseModel):
+    urls: List[str]
+    verify: bool = True
+
 class VerificationResult(BaseModel):
     result: str
+    verdict: Optional[VerdictResult] = None
+
+def extract_claim_from_image(image: str):
+    """
+    Decode a base64 image and OCR its text
+
+    Returns:
+        (claim_text, error_message) - exactly one of them is set
+    """
+    print("Received image for verification")
+    try:
+        # Decode base64
+        if "," in image:
+            header, encoded = image.split(",", 1)
+        else:
+            encoded = image
+        
+        image_data = base64.b64decode(encoded)
+        
+        # Save to temp file
+        with tempfile.NamedTemporaryFile(delete=False, suffix=".png") as tmp:
+            tmp.write(image_data)
+            tmp_path = tmp.name
+        
+        # Extract text
+        extractor = ImageTextExtractorTool()
+        extraction_result = extractor.extract_text(tmp_path)
+        
+        # Cleanup
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        
+        if "error" in extraction_result:
+            return None, f"❌ Image Analysis Failed: {extraction_result['error']}"
+        
+        claim_text = extraction_result["extracted_text"]
+        print(f"Extracted text from image: {claim_text}")
+        return claim_text, None
+        
+    except Exception as img_error:
+        print(f"Image processing error: {img_error}")
+        return None, "❌ Failed to process image. Please try a clearer image."
+
+def is_image_or_url_input(request: ClaimRequest, claim_text: str) -> bool:
+    """Images and URLs skip strict claim validation to prevent 'incomplete claim' rejection"""
+    return bool(request.image or (claim_text and claim_text.lower().startswith(('http', 'www'))))
+
+def format_sse(event: str, data: dict) -> str:
+    """Format one server-sent event"""
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
 
 @app.get("/")
 def read_root():
     return {"status": "ok", "service": "FactGuard AI"}
 
-@app.post("/verify")
-async def verify_claim_endpoint(request: ClaimRequest):
+@app.get("/cache/stats")
+def cache_stats():
+    return fact_verifier.verdict_cache.stats()
+
+@app.get("/cache/search/stats")
+def search_cache_stats():
+    return get_search_cache().stats()
+
+@app.get("/cache/articles/stats")
+def article_cache_stats():
+    return get_article_cache().stats()
+
+@app.get("/upstreams")
+def upstream_status():
+    return breaker_stats()
+
+@app.get("/rate-limits")
+def rate_limit_status():
+    return get_rate_limiter().stats()
+
+@app.get("/executor/stats")
+def executor_stats():
+    return verification_executor.stats()
+
+@app.get("/verify/urls/stats")
+def url_batch_stats():
+    return {
+        **url_batch_runner.stats(),
+        "domains": url_batch_runner.router.article_extractor.politeness.stats()
+    }
+
+@app.get("/metrics", response_class=PlainTextResponse)
+def metrics():
+    """Latency histograms in the Prometheus text exposition format"""
+    return PlainTextResponse(metrics_registry.render(), media_type="text/plain; version=0.0.4")
+
+def run_verification_request(request: ClaimRequest) -> dict:
+    """Blocking /verify pipeline: OCR (if any), then claim verification with one retry"""
     try:
         claim_text = request.claim
         
         # Handle Image Input
         if request.image:
-            print("Received image for verification")
-            try:
-                # Decode base64
-                if "," in request.image:
-                    header, encoded = request.image.split(",", 1)
-                else:
-                    encoded = request.image
-                
-                image_data = base64.b64decode(encoded)
-                
-                # Save to temp file
-                with tempfile.NamedTemporaryFile(delete=False, suffix=".png") as tmp:
-                    tmp.write(image_data)
-                    tmp_path = tmp.name
-                
-                # Extract text
-                extractor = ImageTextExtractorTool()
-                extraction_result = extractor.extract_text(tmp_path)
-                
-                # Cleanup
-                if os.path.exists(tmp_path):
-                    os.remove(tmp_path)
-                
-                if "error" in extraction_result:
-                    return {"result": f"❌ Image Analysis Failed: {extraction_result['error']}"}
-                
-                claim_text = extraction_result["extracted_text"]
-                print(f"Extracted text from image: {claim_text}")
-                
-            except Exception as img_error:
-                print(f"Image processing error: {img_error}")
-                return {"result": "❌ Failed to process image. Please try a clearer image."}
+            claim_text, image_error = extract_claim_from_image(request.image)
+            if image_error:
+                return {"result": image_error}
 
         # Validate final input
         if not claim_text:
@@ -72,19 +167,24 @@ async def verify_claim_endpoint(request: ClaimRequest):
         count = 0
         max_retries = 1
         result = None
+        verdict = None
         
-        is_image_or_url = False
-        if request.image or (claim_text and claim_text.lower().startswith(('http', 'www'))):
-            is_image_or_url = True
+        is_image_or_url = is_image_or_url_input(request, claim_text)
 
         while count <= max_retries:
             try:
                 # Skip validation for Images and URLs to prevent "incomplete claim" rejection
-                result = fact_verifier.verify_claim(claim_text, skip_validation=is_image_or_url)
+                outcome = fact_verifier.verify_claim_detailed(claim_text, skip_validation=is_image_or_url)
+                result = outcome["result"]
+                verdict = outcome["verdict"]
                 break
             except Exception as e:
                 print(f"Attempt {count+1} failed: {str(e)}")
                 count += 1
+                deadline = current_deadline()
+                if count <= max_retries and deadline is not None and deadline.remaining() < config.DEADLINE_CONSENSUS_RESERVE:
+                    # Not enough budget left for another full attempt
+                    count = max_retries + 1
                 if count > max_retries:
                     # Fallback to Mock ONLY if real attempts fail
                     print("⚠️ All real verification attempts failed. Using simulation.")
@@ -93,11 +193,144 @@ async def verify_claim_endpoint(request: ClaimRequest):
                     else:
                          result = f"Verdict: UNVERIFIABLE\nConfidence: Low (0.0)\n\nError: {str(e)}"
         
-        return {"result": result}
+        # 'verdict' is the validated VerdictResult; None when only display text is available
+        return {
+            "result": result,
+            "verdict": verdict.model_dump() if verdict is not None else None
+        }
         
     except Exception as e:
         print(f"Error processing claim: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/verify")
+async def verify_claim_endpoint(request: ClaimRequest):
+    try:
+        # The deadline starts on arrival, so time spent queued for a worker counts against it
+        with deadline_scope(config.REQUEST_DEADLINE):
+            return await verification_executor.run(run_verification_request, request)
+    except ExecutorSaturated as e:
+        print(f"⚠️ Rejecting verification: {str(e)}")
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "5"})
+
+@app.post("/verify/stream")
+async def verify_claim_stream_endpoint(request: ClaimRequest):
+    """
+    Verify a claim and stream progress as server-sent events.
+
+    Events: started, ocr, planning, routing, evidence (one per agent, as it finishes),
+    consensus, verdict, error, done.
+    """
+    if not request.claim and not request.image:
+        raise HTTPException(status_code=400, detail="No claim text or readable image provided")
+
+    loop = asyncio.get_running_loop()
+    events = asyncio.Queue()
+
+    def publish(event: str, data: dict):
+        # Called from the worker thread
+        loop.call_soon_threadsafe(events.put_nowait, (event, data))
+
+    def run_verification():
+        try:
+            claim_text = request.claim
+            if request.image:
+                claim_text, image_error = extract_claim_from_image(request.image)
+                if image_error:
+                    publish("error", {"detail": image_error})
+                    return
+                publish("ocr", {"extracted_text": claim_text})
+
+            if not claim_text:
+                publish("error", {"detail": "No claim text or readable image provided"})
+                return
+
+            fact_verifier.verify_claim(
+                claim_text,
+                skip_validation=is_image_or_url_input(request, claim_text),
+                on_event=publish
+            )
+        except Exception as e:
+            print(f"Error streaming claim: {str(e)}")
+            publish("error", {"detail": str(e)})
+        finally:
+            publish("done", {})
+
+    # Admit before sending headers so a saturated worker answers 503, not a broken stream
+    try:
+        with deadline_scope(config.REQUEST_DEADLINE):
+            worker = verification_executor.submit(run_verification)
+    except ExecutorSaturated as e:
+        print(f"⚠️ Rejecting streamed verification: {str(e)}")
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "5"})
+
+    async def event_stream():
+        # First byte goes out immediately; the pipeline runs off the event loop
+        yield format_sse("started", {"claim": request.claim, "image": bool(request.image)})
+        while True:
+            event, data = await events.get()
+            yield format_sse(event, data)
+            if event == "done":
+                break
+        await worker
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+@app.post("/verify/urls")
+async def verify_urls_endpoint(request: UrlBatchRequest):
+    """
+    Fetch, extract and verify a batch of article URLs, streaming results as server-sent events.
+
+    Events: started, article (claims extracted from one URL), result (one per unique URL,
+    with per-claim verdicts or an error), done. Variants of the same article URL are
+    processed once and reported together in the result's 'urls'.
+    """
+    urls = [url.strip() for url in request.urls if url and url.strip()]
+    if not urls:
+        raise HTTPException(status_code=400, detail="No URLs provided")
+    if len(urls) > config.URL_BATCH_MAX_URLS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {config.URL_BATCH_MAX_URLS} URLs per batch ({len(urls)} given)"
+        )
+
+    loop = asyncio.get_running_loop()
+    events = asyncio.Queue()
+
+    def publish(event: str, data: dict):
+        # Called from the batch's worker threads
+        loop.call_soon_threadsafe(events.put_nowait, (event, data))
+
+    try:
+        batch = url_batch_runner.start(urls, publish, verify=request.verify)
+    except BatchRejected as e:
+        print(f"⚠️ Rejecting URL batch: {str(e)}")
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "30"})
+
+    async def event_stream():
+        finished = False
+        try:
+            yield format_sse("started", {"urls": len(urls), "unique": batch.unique})
+            while True:
+                event, data = await events.get()
+                yield format_sse(event, data)
+                if event == "done":
+                    finished = True
+                    break
+        finally:
+            if not finished:
+                # Client disconnected - stop work that has not started yet
+                batch.cancel()
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
 if __name__ == "__main__":
     uvicorn.run("api:app", host="0.0.0.0", port=8000, reload=True)
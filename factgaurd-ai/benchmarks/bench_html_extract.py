@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Benchmark: article HTML extraction backends - parse time and extracted-text quality
+
+Each backend extracts every page of a corpus of saved news pages. Quality is the token
+F1 of the extracted body against the page's reference text: <page>.txt next to
+<page>.html when present, otherwise what the original BeautifulSoup/html.parser
+extraction returns (so 1.00 means "same text as before").
+
+Save pages with e.g. `curl -o corpus/reuters-1.html <url>`. Without --corpus, a
+synthetic corpus of news-like pages (heavy scripts, menus, related links, comments)
+is generated with known reference text.
+
+Usage:
+    python benchmarks/bench_html_extract.py [--corpus DIR] [--pages 40] [--repeat 5]
+"""
+import argparse
+import glob
+import os
+import random
+import statistics
+import sys
+import time
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.html_extractor import HAS_LXML, LxmlExtractor, SoupExtractor
+
+WORDS = ("market shares rose fell percent central bank rate inflation investors quarter "
+         "earnings analysts said government oil gold prices growth report week data").split()
+
+
+def backends() -> Dict[str, object]:
+    available = {"soup (html.parser)": SoupExtractor("html.parser")}
+    if HAS_LXML:
+        available["soup (lxml parser)"] = SoupExtractor("lxml")
+        available["lxml single-pass"] = LxmlExtractor()
+    return available
+
+
+def _sentence(rng: random.Random, n: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(n)).capitalize() + "."
+
+
+def synthetic_page(rng: random.Random) -> Tuple[bytes, str]:
+    """One news-like page and its article text"""
+    paragraphs = [" ".join(_sentence(rng, rng.randint(8, 20)) for _ in range(rng.randint(2, 5)))
+                  for _ in range(rng.randint(8, 25))]
+    menu = "".join(f'<li><a href="/section/{i}">{_sentence(rng, 2)}</a></li>' for i in range(80))
+    related = "".join(f'<div class="card"><a href="/story/{i}"><h3>{_sentence(rng, 8)}</h3></a>'
+                      f'<p>{_sentence(rng, 15)}</p></div>' for i in range(30))
+    comments = "".join(f'<div class="comment"><p>{_sentence(rng, 25)}</p></div>' for _ in range(60))
+    script = "<script>window.__STATE__ = " + '{"k": "' + "x" * 20000 + '"};</script>'
+    body = "".join(f"<p>{p}</p>" for p in paragraphs)
+    html = (
+        f"<!DOCTYPE html><html><head><title>{_sentence(rng, 8)}</title>{script * 4}"
+        f"<style>{'.a{color:red}' * 2000}</style></head><body>"
+        f"<header><nav><ul>{menu}</ul></nav></header>"
+        f'<div class="layout"><article><h1>{_sentence(rng, 10)}</h1>{body}'
+        f'<aside>{related[:3000]}</aside></article>'
+        f'<section class="related">{related}</section><section class="comments">{comments}</section></div>'
+        f"<footer><ul>{menu}</ul></footer>{script}</body></html>"
+    )
+    return html.encode("utf-8"), " ".join(paragraphs)
+
+
+def load_corpus(path: Optional[str], pages: int) -> List[Tuple[str, bytes, Optional[str]]]:
+    """(name, html bytes, reference text or None) per page"""
+    if path:
+        corpus = []
+        for file in sorted(glob.glob(os.path.join(path, "*.htm*"))):
+            with open(file, "rb") as f:
+                html = f.read()
+            reference = None
+            gold = os.path.splitext(file)[0] + ".txt"
+            if os.path.exists(gold):
+                with open(gold, encoding="utf-8") as f:
+                    reference = f.read()
+            corpus.append((os.path.basename(file), html, reference))
+        return corpus
+
+    rng = random.Random(42)
+    return [(f"synthetic-{i}", *synthetic_page(rng)) for i in range(pages)]
+
+
+def token_f1(extracted: str, reference: str) -> float:
+    got, want = Counter(extracted.lower().split()), Counter(reference.lower().split())
+    overlap = sum((got & want).values())
+    if not overlap:
+        return 1.0 if not got and not want else 0.0
+    precision, recall = overlap / sum(got.values()), overlap / sum(want.values())
+    return 2 * precision * recall / (precision + recall)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark article HTML extraction backends")
+    parser.add_argument("--corpus", default=None, help="Directory of saved pages (*.html, optional *.txt reference)")
+    parser.add_argument("--pages", type=int, default=40, help="Synthetic pages when no corpus is given")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed passes over the corpus per backend")
+    args = parser.parse_args()
+
+    corpus = load_corpus(args.corpus, args.pages)
+    if not corpus:
+        sys.exit(f"No *.html pages in {args.corpus}")
+    reference_backend = SoupExtractor("html.parser")
+    references = [ref if ref is not None else reference_backend.extract(html)[1] for _, html, ref in corpus]
+    size = sum(len(html) for _, html, _ in corpus) / 1024 / 1024
+
+    print("=" * 80)
+    print(f"HTML extraction: {len(corpus)} pages ({size:.1f} MB), {args.repeat} passes per backend")
+    if not HAS_LXML:
+        print("lxml is not installed - only the BeautifulSoup backend is measured")
+    print("=" * 80)
+
+    baseline = None
+    for name, backend in backends().items():
+        per_page = []
+        for _ in range(args.repeat):
+            for _, html, _ in corpus:
+                start = time.perf_counter()
+                backend.extract(html)
+                per_page.append((time.perf_counter() - start) * 1000)
+
+        scores = [token_f1(backend.extract(html)[1], reference)
+                  for (_, html, _), reference in zip(corpus, references)]
+        mean = statistics.mean(per_page)
+        baseline = baseline or mean
+        p95 = sorted(per_page)[int(0.95 * (len(per_page) - 1))]
+        print(f"{name:22s} mean {mean:8.2f} ms   p95 {p95:8.2f} ms   {baseline / mean:5.1f}x   "
+              f"F1 mean {statistics.mean(scores):.3f}  min {min(scores):.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Benchmark: full single-claim verification against a recorded HTTP cassette
+
+Record once with live credentials, then replay offline as often as needed. Every
+Alpha Vantage, NewsAPI, SerpAPI and LLM exchange is served from the cassette, so
+runs are repeatable and need no network. Verdict, quote and search caches are
+bypassed so each iteration exercises the whole pipeline.
+
+Usage:
+    python benchmarks/bench_verify_replay.py record [cassette.json]
+    python benchmarks/bench_verify_replay.py replay [cassette.json] [iterations] [--latency] [--any-body]
+
+--latency sleeps for each exchange's recorded duration (end-to-end latency);
+without it only the pipeline's own overhead is measured. --any-body replays
+requests whose body drifted since recording (counted as body_mismatches).
+"""
+import os
+import statistics
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+CLAIMS = [
+    "Gold prices rose 2% today after the Federal Reserve announced a rate cut",
+    "The RBI kept the repo rate unchanged at 6.5 percent",
+]
+
+
+def configure(mode: str, cassette: str, latency: bool, any_body: bool):
+    """Select the cassette before config is imported"""
+    os.environ["HTTP_CASSETTE_MODE"] = mode
+    os.environ["HTTP_CASSETTE_PATH"] = cassette
+    os.environ["HTTP_CASSETTE_REPLAY_LATENCY"] = "true" if latency else "false"
+    os.environ["HTTP_CASSETTE_MATCH_ANY_BODY"] = "true" if any_body else "false"
+    # Every lookup must reach the cassette, both when recording and when replaying
+    os.environ["SEARCH_CACHE_MAX_ENTRIES"] = "0"
+
+
+def reset_caches(verifier):
+    from agents.finance_agent import av_client
+    verifier.verdict_cache.clear()
+    av_client.quote_cache.clear()
+
+
+def main():
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    if not args or args[0] not in ("record", "replay"):
+        print(__doc__)
+        sys.exit(1)
+
+    mode = args[0]
+    cassette = args[1] if len(args) > 1 else os.path.join(ROOT, "data", "cassettes", "bench_verify.json")
+    iterations = int(args[2]) if len(args) > 2 and mode == "replay" else 1
+    configure(mode, cassette, "--latency" in sys.argv, "--any-body" in sys.argv)
+
+    from fact_verifier import FactVerifier
+    from core.http_cassette import get_cassette
+
+    verifier = FactVerifier()
+
+    print("=" * 80)
+    print(f"Single-claim verification, {mode} ({iterations} iteration(s)) - {cassette}")
+    print("=" * 80)
+
+    for claim in CLAIMS:
+        timings = []
+        for _ in range(iterations):
+            reset_caches(verifier)
+            start = time.perf_counter()
+            verifier._verify_single_claim(claim)
+            timings.append((time.perf_counter() - start) * 1000)
+
+        print(f"{claim[:50]:52s} median {statistics.median(timings):9.1f} ms   "
+              f"min {min(timings):9.1f} ms   max {max(timings):9.1f} ms")
+
+    print("-" * 80)
+    print(f"Cassette: {get_cassette().stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Load driver: hit POST /verify at a fixed arrival rate and report throughput and latency
+
+Requests are sent open-loop (on schedule, whether or not earlier ones finished), so a
+saturated service shows up as growing latency and 503s rather than a slower send rate.
+Run the API against benchmarks/stub_server.py to size workers without external calls.
+
+Usage:
+    python benchmarks/load_test.py [--url http://127.0.0.1:8000] [--rps 2] [--duration 60]
+                                   [--claims claims.txt] [--unique]
+"""
+import argparse
+import asyncio
+import time
+from collections import Counter
+from typing import Dict, List, Optional
+
+import httpx
+
+
+CLAIMS = [
+    "Gold prices rose 2% today after the Federal Reserve announced a rate cut",
+    "Tesla stock fell more than 5% this week",
+    "The rupee fell below 84 against the dollar",
+    "Crude oil prices increased after OPEC announced output cuts",
+    "Apple shares rose 3% after earnings",
+]
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile (0 for no values)"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, int(round(pct / 100 * len(ordered))))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+async def send(client: httpx.AsyncClient, url: str, claim: str) -> Dict:
+    start = time.perf_counter()
+    try:
+        response = await client.post(url, json={"claim": claim})
+        outcome = str(response.status_code)
+    except httpx.HTTPError as e:
+        outcome = type(e).__name__
+    return {"outcome": outcome, "latency": time.perf_counter() - start}
+
+
+async def run(url: str, rps: float, duration: float, claims: List[str], unique: bool, timeout: float) -> Dict:
+    """
+    Drive the endpoint for duration seconds at rps requests per second
+
+    Returns:
+        Summary with outcome counts, throughput and latency percentiles
+    """
+    total = max(1, int(rps * duration))
+    limits = httpx.Limits(max_connections=None, max_keepalive_connections=None)
+    async with httpx.AsyncClient(timeout=timeout, limits=limits) as client:
+        started = time.perf_counter()
+        tasks = []
+        for i in range(total):
+            # Sleep until this request's slot instead of accumulating drift
+            await asyncio.sleep(max(0.0, started + i / rps - time.perf_counter()))
+            claim = claims[i % len(claims)]
+            if unique:
+                # Defeat the verdict cache so every request runs the full pipeline
+                claim = f"{claim} (load test request {i})"
+            tasks.append(asyncio.create_task(send(client, f"{url}/verify", claim)))
+
+        results = await asyncio.gather(*tasks)
+        elapsed = time.perf_counter() - started
+
+    ok = [r["latency"] for r in results if r["outcome"] == "200"]
+    return {
+        "sent": total,
+        "elapsed": elapsed,
+        "outcomes": Counter(r["outcome"] for r in results),
+        "throughput": len(ok) / elapsed,
+        "p50": percentile(ok, 50),
+        "p95": percentile(ok, 95),
+        "p99": percentile(ok, 99),
+        "max": max(ok, default=0.0)
+    }
+
+
+def load_claims(path: Optional[str]) -> List[str]:
+    if not path:
+        return CLAIMS
+    with open(path, encoding="utf-8") as f:
+        return [line.strip() for line in f if line.strip()]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test POST /verify")
+    parser.add_argument("--url", default="http://127.0.0.1:8000", help="API base URL")
+    parser.add_argument("--rps", type=float, default=2.0, help="Target requests per second")
+    parser.add_argument("--duration", type=float, default=60.0, help="Seconds to keep sending")
+    parser.add_argument("--claims", default=None, help="File with one claim per line")
+    parser.add_argument("--unique", action="store_true", help="Make every claim unique to bypass the verdict cache")
+    parser.add_argument("--timeout", type=float, default=300.0, help="Per-request timeout in seconds")
+    args = parser.parse_args()
+
+    print("=" * 80)
+    print(f"Load test {args.url}/verify at {args.rps} rps for {args.duration:.0f}s")
+    print("=" * 80)
+
+    summary = asyncio.run(run(args.url.rstrip("/"), args.rps, args.duration,
+                              load_claims(args.claims), args.unique, args.timeout))
+
+    print(f"Sent:        {summary['sent']} in {summary['elapsed']:.1f}s")
+    print(f"Outcomes:    {dict(summary['outcomes'])}")
+    print(f"Throughput:  {summary['throughput']:.2f} successful req/s")
+    print(f"Latency:     p50 {summary['p50'] * 1000:.0f} ms   p95 {summary['p95'] * 1000:.0f} ms   "
+          f"p99 {summary['p99'] * 1000:.0f} ms   max {summary['max'] * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for every upstream the verifier calls
+
+One FastAPI app serves:
+    POST /v1/chat/completions   OpenAI-compatible chat API (LLM_BASE_URL)
+    GET  /query                 Alpha Vantage GLOBAL_QUOTE / CURRENCY_EXCHANGE_RATE
+    GET  /v2/everything         NewsAPI
+    GET  /search                SerpAPI Google / Google News (tbm=nws)
+    GET  /stats                 Requests, injected errors and delay served per upstream
+
+Each upstream has its own latency distribution (log-normal around a median) and error
+rate, so load tests can reproduce slow or flaky providers without external calls.
+
+Usage:
+    python benchmarks/stub_server.py [--port 8100] [--llm 800:0.5:0.01] [--serpapi 300:0.4:0.05] ...
+
+    Profiles are median_ms[:sigma[:error_rate]]. Point the API at the stub with:
+    LLM_BASE_URL=http://127.0.0.1:8100/v1 LLM_MODEL=openai/stub LLM_API_KEY=stub
+    ALPHA_VANTAGE_BASE_URL=http://127.0.0.1:8100/query ALPHA_VANTAGE_KEY=stub
+    NEWS_API_BASE_URL=http://127.0.0.1:8100/v2/everything NEWS_API_KEY=stub
+    SERP_API_BASE_URL=http://127.0.0.1:8100/search SERP_API_KEY=stub
+"""
+import argparse
+import asyncio
+import json
+import math
+import random
+import re
+import time
+from datetime import datetime, timezone
+from typing import Dict, Optional
+
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+
+UPSTREAMS = ("llm", "alpha_vantage", "newsapi", "serpapi")
+
+DEFAULT_PROFILES = {
+    "llm": "800:0.5:0",
+    "alpha_vantage": "150:0.3:0",
+    "newsapi": "250:0.4:0",
+    "serpapi": "400:0.4:0"
+}
+
+
+class LatencyProfile:
+    """Log-normal response delay around a median, plus a probability of failing"""
+
+    def __init__(self, median_ms: float, sigma: float = 0.0, error_rate: float = 0.0):
+        """
+        Args:
+            median_ms: Median response time in milliseconds
+            sigma: Log-normal shape; 0 gives a fixed delay, ~0.5 a realistic long tail
+            error_rate: Fraction of requests answered with an upstream error (0.0 - 1.0)
+        """
+        self.median_ms = median_ms
+        self.sigma = sigma
+        self.error_rate = error_rate
+
+    @classmethod
+    def parse(cls, spec: str) -> "LatencyProfile":
+        """Build from 'median_ms[:sigma[:error_rate]]'"""
+        parts = [float(p) for p in spec.split(":")]
+        return cls(*parts[:3])
+
+    def delay(self, rng: random.Random) -> float:
+        """Seconds to wait before answering"""
+        return self.median_ms * math.exp(self.sigma * rng.gauss(0, 1)) / 1000 if self.sigma else self.median_ms / 1000
+
+    def fails(self, rng: random.Random) -> bool:
+        return rng.random() < self.error_rate
+
+
+def _claim_in(prompt: str) -> str:
+    # Backstories quote example claims too; the task prompt comes last
+    matches = re.findall(r'Claim: "(.*?)"', prompt, re.DOTALL)
+    return matches[-1] if matches else "the claim"
+
+
+def _final_answer(text: str) -> str:
+    # CrewAI accepts this in both ReAct and native function-calling modes
+    return f"Thought: I now know the final answer\nFinal Answer: {text}"
+
+
+def chat_reply(messages: list) -> str:
+    """Plausible agent output for whichever pipeline prompt this is"""
+    prompt = "\n".join(str(m.get("content", "")) for m in messages)
+    claim = _claim_in(prompt)
+
+    if "determine the verification strategy" in prompt:
+        return _final_answer(json.dumps({
+            "intent": "mixed",
+            "time_sensitive": True,
+            "required_agents": ["finance_agent", "news_agent"],
+            "reasoning": "Stub planner routes every claim to both evidence agents"
+        }))
+    if "produce final verdict" in prompt:
+        return _final_answer(json.dumps({
+            "verdict": "PARTIALLY TRUE",
+            "confidence": 0.65,
+            "summary": f"Stub consensus for: {claim}",
+            "evidence": [{"source_name": "Reuters", "source_type": "News",
+                          "content": "Stub evidence", "url": None, "date": None, "credibility": "High"}],
+            "contradictions": [],
+            "notes": "Generated by the local stub server"
+        }))
+    return _final_answer(f"Reuters and Alpha Vantage data (stub) partially support: {claim}")
+
+
+def create_app(profiles: Dict[str, LatencyProfile], seed: Optional[int] = None) -> FastAPI:
+    """
+    Build the stub app
+
+    Args:
+        profiles: LatencyProfile per upstream in UPSTREAMS
+        seed: Random seed for reproducible delays and errors
+    """
+    app = FastAPI(title="FactGuard upstream stub")
+    rng = random.Random(seed)
+    stats = {name: {"requests": 0, "errors": 0, "delay_seconds": 0.0} for name in UPSTREAMS}
+
+    async def simulate(upstream: str, error_body: dict) -> Optional[JSONResponse]:
+        """Apply the upstream's delay; return an error response if this request should fail"""
+        profile = profiles[upstream]
+        delay = profile.delay(rng)
+        stats[upstream]["requests"] += 1
+        stats[upstream]["delay_seconds"] += delay
+        await asyncio.sleep(delay)
+        if profile.fails(rng):
+            stats[upstream]["errors"] += 1
+            return JSONResponse(status_code=503, content=error_body)
+        return None
+
+    @app.post("/v1/chat/completions")
+    async def chat_completions(request: Request):
+        body = await request.json()
+        error = await simulate("llm", {"error": {"message": "Stub LLM overloaded", "type": "server_error"}})
+        if error:
+            return error
+
+        content = chat_reply(body.get("messages", []))
+        prompt_tokens = sum(len(str(m.get("content", ""))) for m in body.get("messages", [])) // 4
+        return {
+            "id": f"chatcmpl-stub-{time.monotonic_ns()}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": body.get("model", "stub"),
+            "choices": [{"index": 0, "message": {"role": "assistant", "content": content},
+                         "finish_reason": "stop"}],
+            "usage": {"prompt_tokens": prompt_tokens, "completion_tokens": len(content) // 4,
+                      "total_tokens": prompt_tokens + len(content) // 4}
+        }
+
+    @app.get("/query")
+    async def alpha_vantage(function: str = "", symbol: str = "", from_currency: str = "", to_currency: str = ""):
+        error = await simulate("alpha_vantage", {"Information": "Stub Alpha Vantage unavailable"})
+        if error:
+            return error
+
+        today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+        if function == "CURRENCY_EXCHANGE_RATE":
+            return {"Realtime Currency Exchange Rate": {
+                "1. From_Currency Code": from_currency.upper(),
+                "3. To_Currency Code": to_currency.upper(),
+                "5. Exchange Rate": "83.45000000",
+                "6. Last Refreshed": f"{today} 12:00:00"
+            }}
+        return {"Global Quote": {
+            "01. symbol": symbol.upper(),
+            "05. price": "245.1000",
+            "07. latest trading day": today,
+            "09. change": "3.2000",
+            "10. change percent": "1.3228%"
+        }}
+
+    @app.get("/v2/everything")
+    async def newsapi(q: str = ""):
+        error = await simulate("newsapi", {"status": "error", "code": "unexpectedError",
+                                           "message": "Stub NewsAPI unavailable"})
+        if error:
+            return error
+
+        published = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        return {"status": "ok", "totalResults": 2, "articles": [
+            {"source": {"id": "reuters", "name": "Reuters"}, "author": "Stub Desk",
+             "title": f"Reuters: {q}", "description": f"Coverage of {q}", "url": "https://www.reuters.com/stub-1",
+             "publishedAt": published, "content": f"Reporting on {q}."},
+            {"source": {"id": None, "name": "Economic Times"}, "author": "Stub Desk",
+             "title": f"Markets react: {q}", "description": f"Analysis of {q}",
+             "url": "https://economictimes.indiatimes.com/stub-2", "publishedAt": published,
+             "content": f"Analysts discuss {q}."}
+        ]}
+
+    @app.get("/search")
+    async def serpapi(q: str = "", tbm: str = ""):
+        error = await simulate("serpapi", {"error": "Stub SerpAPI unavailable"})
+        if error:
+            return error
+
+        if tbm == "nws":
+            return {"news_results": [
+                {"title": f"{q} - latest", "link": "https://www.reuters.com/stub-1", "snippet": f"News on {q}",
+                 "source": "Reuters", "date": "1 hour ago"}
+            ]}
+        return {"organic_results": [
+            {"position": 1, "title": f"{q} explained", "link": "https://www.bbc.com/stub-3",
+             "snippet": f"What we know about {q}", "source": "BBC"},
+            {"position": 2, "title": f"Fact check: {q}", "link": "https://factcheck.example.org/stub-4",
+             "snippet": "Rated: Partly true", "source": "Example Fact Check"}
+        ]}
+
+    @app.get("/stats")
+    async def upstream_stats():
+        return stats
+
+    return app
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Stub LLM and data-source APIs for load testing")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8100)
+    parser.add_argument("--seed", type=int, default=None)
+    for name in UPSTREAMS:
+        parser.add_argument(f"--{name.replace('_', '-')}", dest=name, default=DEFAULT_PROFILES[name],
+                            help=f"median_ms[:sigma[:error_rate]] (default {DEFAULT_PROFILES[name]})")
+    args = parser.parse_args()
+
+    profiles = {name: LatencyProfile.parse(getattr(args, name)) for name in UPSTREAMS}
+    for name, profile in profiles.items():
+        print(f"{name:14s} median {profile.median_ms:.0f}ms  sigma {profile.sigma}  errors {profile.error_rate:.1%}")
+
+    uvicorn.run(create_app(profiles, seed=args.seed), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
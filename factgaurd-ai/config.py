@@ -16,21 +16,164 @@ class Config:
     LLM_MODEL = os.getenv("LLM_MODEL", "llama3-70b-8192") # Default to a common Llama identifier
     LLM_TEMPERATURE = float(os.getenv("LLM_TEMPERATURE", "0.3"))
     LLM_BASE_URL = os.getenv("LLM_BASE_URL", "https://api.groq.com/openai/v1") # Defaulting to Groq as it's common for Llama, but user can override
+    # Per-call limits for every agent's LLM; keep timeout * (retries + 1) well inside REQUEST_DEADLINE
+    # (planner and consensus are also cut off at the deadline itself)
+    LLM_TIMEOUT = float(os.getenv("LLM_TIMEOUT", "10"))
+    LLM_MAX_RETRIES = int(os.getenv("LLM_MAX_RETRIES", "1"))
     
     # API Keys (for data sources)
     ALPHA_VANTAGE_KEY = os.getenv("ALPHA_VANTAGE_KEY", "")
     NEWS_API_KEY = os.getenv("NEWS_API_KEY", "")
     SERP_API_KEY = os.getenv("SERP_API_KEY", "")
     
-    # API Endpoints
-    ALPHA_VANTAGE_BASE_URL = "https://www.alphavantage.co/query"
-    NEWS_API_BASE_URL = "https://newsapi.org/v2/everything"
-    SERP_API_BASE_URL = "https://serpapi.com/search"
+    # API Endpoints (overridable to point at benchmarks/stub_server.py for load tests)
+    ALPHA_VANTAGE_BASE_URL = os.getenv("ALPHA_VANTAGE_BASE_URL", "https://www.alphavantage.co/query")
+    NEWS_API_BASE_URL = os.getenv("NEWS_API_BASE_URL", "https://newsapi.org/v2/everything")
+    SERP_API_BASE_URL = os.getenv("SERP_API_BASE_URL", "https://serpapi.com/search")
+    
+    # HTTP Client
+    # Shared keep-alive pools for data-source tools; pool size should cover concurrent verifications
+    HTTP_POOL_CONNECTIONS = int(os.getenv("HTTP_POOL_CONNECTIONS", "10"))
+    HTTP_POOL_MAXSIZE = int(os.getenv("HTTP_POOL_MAXSIZE", "16"))
+    HTTP_MAX_RETRIES = int(os.getenv("HTTP_MAX_RETRIES", "2"))
+    HTTP_BACKOFF_FACTOR = float(os.getenv("HTTP_BACKOFF_FACTOR", "0.5"))
+    HTTP_CONNECT_TIMEOUT = float(os.getenv("HTTP_CONNECT_TIMEOUT", "5"))
+    HTTP_READ_TIMEOUT = float(os.getenv("HTTP_READ_TIMEOUT", "30"))
+    # Per-host read timeout overrides, e.g. "www.alphavantage.co=15,serpapi.com=20"
+    HTTP_HOST_TIMEOUTS = os.getenv("HTTP_HOST_TIMEOUTS", "")
+    
+    # Article Fetch
+    # Article pages are streamed and parsed from at most this many bytes; pages declaring a
+    # larger Content-Length, or a non-HTML Content-Type, are refused before the body is read
+    ARTICLE_MAX_BYTES = int(os.getenv("ARTICLE_MAX_BYTES", str(2 * 1024 * 1024)))
+    # HTML extraction backend: "lxml" (C parser, single pass), "soup" (BeautifulSoup) or "auto"
+    HTML_EXTRACTOR = os.getenv("HTML_EXTRACTOR", "auto")
+    
+    # HTTP Cassette
+    # "record" saves every tool and LLM exchange to HTTP_CASSETTE_PATH, "replay" serves them offline
+    HTTP_CASSETTE_MODE = os.getenv("HTTP_CASSETTE_MODE", "off").lower()
+    HTTP_CASSETTE_PATH = os.getenv(
+        "HTTP_CASSETTE_PATH", os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "cassettes", "default.json")
+    )
+    # Sleep for each exchange's recorded duration on replay (realistic latency instead of pipeline overhead only)
+    HTTP_CASSETTE_REPLAY_LATENCY = os.getenv("HTTP_CASSETTE_REPLAY_LATENCY", "false").lower() == "true"
+    # Replay a request whose body was never recorded with the same URL's recordings in order
+    # (off: a changed LLM prompt is a miss instead of silently getting another prompt's reply)
+    HTTP_CASSETTE_MATCH_ANY_BODY = os.getenv("HTTP_CASSETTE_MATCH_ANY_BODY", "false").lower() == "true"
+    
+    # Circuit Breakers
+    # Consecutive failed (or slower than the slow-call limit) calls that stop traffic to an upstream;
+    # after CIRCUIT_RESET_TIMEOUT seconds one probe call decides whether it has recovered
+    CIRCUIT_FAILURE_THRESHOLD = int(os.getenv("CIRCUIT_FAILURE_THRESHOLD", "5"))
+    CIRCUIT_RESET_TIMEOUT = float(os.getenv("CIRCUIT_RESET_TIMEOUT", "30"))
+    CIRCUIT_SLOW_CALL_SECONDS = float(os.getenv("CIRCUIT_SLOW_CALL_SECONDS", "10"))
+    # LLM calls are whole agent runs, so they get a far longer slow-call limit (0 disables)
+    CIRCUIT_LLM_SLOW_CALL_SECONDS = float(os.getenv("CIRCUIT_LLM_SLOW_CALL_SECONDS", "120"))
+    
+    # Rate Limits
+    # Upstream quotas as "calls/seconds" (empty = unlimited), shared by every worker on the host
+    RATE_LIMIT_PATH = os.getenv(
+        "RATE_LIMIT_PATH", os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "rate_limits.db")
+    )
+    RATE_LIMIT_ALPHA_VANTAGE = os.getenv("RATE_LIMIT_ALPHA_VANTAGE", "5/60")
+    RATE_LIMIT_NEWSAPI = os.getenv("RATE_LIMIT_NEWSAPI", "100/86400")
+    RATE_LIMIT_SERPAPI = os.getenv("RATE_LIMIT_SERPAPI", "")
+    # LLM provider budgets, e.g. "30/60" requests and "60000/60" tokens per minute
+    RATE_LIMIT_LLM_RPM = os.getenv("RATE_LIMIT_LLM_RPM", "")
+    RATE_LIMIT_LLM_TPM = os.getenv("RATE_LIMIT_LLM_TPM", "")
+    # Calls wait up to this long (and never past the request deadline) for a slot, then fail
+    RATE_LIMIT_MAX_WAIT = float(os.getenv("RATE_LIMIT_MAX_WAIT", "10"))
+    
+    # Quote Cache
+    # Alpha Vantage quotes are reused for this long while the market trades, and up to
+    # QUOTE_CACHE_TTL_CLOSED (but never past the next open) while it is closed
+    QUOTE_CACHE_TTL_OPEN = float(os.getenv("QUOTE_CACHE_TTL_OPEN", "60"))
+    QUOTE_CACHE_TTL_CLOSED = float(os.getenv("QUOTE_CACHE_TTL_CLOSED", "3600"))
+    
+    # Search Cache
+    # SerpAPI/NewsAPI results persisted in SQLite across requests and restarts (0 entries disables)
+    SEARCH_CACHE_PATH = os.getenv(
+        "SEARCH_CACHE_PATH", os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "search_cache.db")
+    )
+    SEARCH_CACHE_MAX_ENTRIES = int(os.getenv("SEARCH_CACHE_MAX_ENTRIES", "5000"))
+    SEARCH_CACHE_TTL_WEB = float(os.getenv("SEARCH_CACHE_TTL_WEB", "86400"))
+    SEARCH_CACHE_TTL_NEWS = float(os.getenv("SEARCH_CACHE_TTL_NEWS", "3600"))
+    
+    # Article Cache
+    # Extracted articles persisted in SQLite by URL (0 entries disables); entries are served
+    # without a fetch while fresh, then revalidated with If-None-Match / If-Modified-Since
+    ARTICLE_CACHE_PATH = os.getenv(
+        "ARTICLE_CACHE_PATH", os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "article_cache.db")
+    )
+    ARTICLE_CACHE_MAX_ENTRIES = int(os.getenv("ARTICLE_CACHE_MAX_ENTRIES", "2000"))
+    # Freshness when the page sends no Cache-Control max-age, and the cap on any max-age
+    ARTICLE_CACHE_TTL = float(os.getenv("ARTICLE_CACHE_TTL", "900"))
+    ARTICLE_CACHE_MAX_TTL = float(os.getenv("ARTICLE_CACHE_MAX_TTL", "86400"))
+    # Short links resolved and AMP/canonical aliases remembered per process (LRU)
+    URL_CANONICAL_CACHE_SIZE = int(os.getenv("URL_CANONICAL_CACHE_SIZE", "10000"))
+    # Follow redirects of known link shorteners (bit.ly, t.co, ...) to key on the real article
+    URL_RESOLVE_SHORTENERS = os.getenv("URL_RESOLVE_SHORTENERS", "true").lower() == "true"
     
     # Currency Configuration
     USD_TO_INR_RATE = 83.5  # Approximate conversion rate (update as needed)
     PRIMARY_CURRENCY = "INR"
     
+    # Fast-path Routing
+    # Rule-based routing at or above this confidence skips the Planner LLM (set > 1 to disable)
+    FAST_ROUTE_MIN_CONFIDENCE = float(os.getenv("FAST_ROUTE_MIN_CONFIDENCE", "0.8"))
+    
+    # Request Deadline
+    # Total seconds a verification request may take; every stage gets what is left of it
+    REQUEST_DEADLINE = float(os.getenv("REQUEST_DEADLINE", "45"))
+    # Budget held back for the consensus stage when planning and collecting evidence
+    DEADLINE_CONSENSUS_RESERVE = float(os.getenv("DEADLINE_CONSENSUS_RESERVE", "12"))
+    # The Planner LLM is skipped (rule-based routing used) if less than this would remain
+    DEADLINE_PLANNER_MIN = float(os.getenv("DEADLINE_PLANNER_MIN", "20"))
+    
+    # Evidence Collection
+    # Each required agent runs concurrently; evidence arriving after this deadline is dropped
+    AGENT_TIMEOUT = float(os.getenv("AGENT_TIMEOUT", "120"))
+    # Call each agent's tools directly with claim-derived queries and hand it the results
+    EVIDENCE_PREFETCH = os.getenv("EVIDENCE_PREFETCH", "true").lower() == "true"
+    PREFETCH_MAX_FINANCE_QUERIES = int(os.getenv("PREFETCH_MAX_FINANCE_QUERIES", "3"))
+    
+    # API Concurrency
+    # Verifications running at once per API worker, and how many more may wait for a slot
+    VERIFY_MAX_CONCURRENCY = int(os.getenv("VERIFY_MAX_CONCURRENCY", "4"))
+    VERIFY_MAX_QUEUE = int(os.getenv("VERIFY_MAX_QUEUE", "16"))
+    
+    # Evidence Packing
+    # Token budget for evidence in the consensus prompt (~4 chars per token; 500 matches the old 2000-char cap)
+    EVIDENCE_TOKEN_BUDGET = int(os.getenv("EVIDENCE_TOKEN_BUDGET", "500"))
+    
+    # Consensus
+    # Attempts at getting a schema-valid JSON verdict before falling back to text scraping
+    CONSENSUS_MAX_ATTEMPTS = int(os.getenv("CONSENSUS_MAX_ATTEMPTS", "2"))
+    
+    # Batch Verification
+    # Claims from one URL/image are verified in parallel; keep low to respect upstream API quotas
+    BATCH_MAX_WORKERS = int(os.getenv("BATCH_MAX_WORKERS", "3"))
+    
+    # URL Batches
+    # POST /verify/urls: URLs per request, and batches running at once per API worker
+    URL_BATCH_MAX_URLS = int(os.getenv("URL_BATCH_MAX_URLS", "200"))
+    URL_BATCH_MAX_ACTIVE = int(os.getenv("URL_BATCH_MAX_ACTIVE", "2"))
+    # Article fetches and claim verifications in flight across all batches (verifications
+    # run on top of VERIFY_MAX_CONCURRENCY, so keep this within the LLM/API quotas)
+    URL_BATCH_FETCH_CONCURRENCY = int(os.getenv("URL_BATCH_FETCH_CONCURRENCY", "16"))
+    URL_BATCH_VERIFY_CONCURRENCY = int(os.getenv("URL_BATCH_VERIFY_CONCURRENCY", "2"))
+    # Politeness per publisher: concurrent fetches, and seconds between fetch starts
+    URL_BATCH_DOMAIN_CONCURRENCY = int(os.getenv("URL_BATCH_DOMAIN_CONCURRENCY", "2"))
+    URL_BATCH_DOMAIN_DELAY = float(os.getenv("URL_BATCH_DOMAIN_DELAY", "1.0"))
+    
+    # Verdict Cache
+    # TTLs in seconds - market data goes stale in minutes, news in hours, general facts in days
+    VERDICT_CACHE_SIZE = int(os.getenv("VERDICT_CACHE_SIZE", "1000"))
+    VERDICT_CACHE_TTL_FINANCE = float(os.getenv("VERDICT_CACHE_TTL_FINANCE", "600"))
+    VERDICT_CACHE_TTL_NEWS = float(os.getenv("VERDICT_CACHE_TTL_NEWS", "10800"))
+    VERDICT_CACHE_TTL_GENERAL = float(os.getenv("VERDICT_CACHE_TTL_GENERAL", "259200"))
+    VERDICT_CACHE_TTL_TIME_SENSITIVE = float(os.getenv("VERDICT_CACHE_TTL_TIME_SENSITIVE", "3600"))
+    
     # Confidence Thresholds
     HIGH_CONFIDENCE_THRESHOLD = 0.8
     MEDIUM_CONFIDENCE_THRESHOLD = 0.5
@@ -0,0 +1,224 @@
+"""
+Article Cache
+SQLite-backed cache of extracted articles keyed on canonical URL (core.url_canonicalizer)
+Fresh entries are served directly; stale ones keep their ETag / Last-Modified so the
+page can be revalidated with a conditional GET and, when unchanged, reused after a 304
+"""
+import os
+import re
+import sqlite3
+import threading
+import time
+from typing import Dict, Mapping, Optional
+
+from config import config
+from core.url_canonicalizer import normalize_url
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS article_cache (
+    url TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    content TEXT NOT NULL,
+    word_count INTEGER NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    fetched_at REAL NOT NULL,
+    expires_at REAL NOT NULL,
+    last_access REAL NOT NULL,
+    hits INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_article_cache_last_access ON article_cache (last_access);
+"""
+
+
+def freshness_lifetime(headers: Mapping[str, str], default: float, maximum: float) -> Optional[float]:
+    """
+    Seconds a response may be served without revalidation, from its Cache-Control
+
+    Returns:
+        None for 'no-store' (do not cache), 0 for 'no-cache', otherwise max-age
+        (or default when absent) capped at maximum
+    """
+    directives = {}
+    for item in (headers.get("Cache-Control") or "").lower().split(","):
+        name, _, value = item.strip().partition("=")
+        if name:
+            directives[name] = value.strip().strip('"')
+
+    if "no-store" in directives:
+        return None
+    if "no-cache" in directives:
+        return 0.0
+    for name in ("s-maxage", "max-age"):
+        if re.fullmatch(r"\d+", directives.get(name, "")):
+            return min(float(directives[name]), maximum)
+    return min(default, maximum)
+
+
+class ArticleCache:
+    """Persistent, size-capped cache of extracted articles with HTTP validators"""
+
+    def __init__(self, path: str, max_entries: int, default_ttl: float, max_ttl: float):
+        """
+        Args:
+            path: SQLite file (created if missing); ':memory:' for a private cache
+            max_entries: Rows kept before least-recently-used ones are evicted
+            default_ttl: Freshness for responses without Cache-Control max-age
+            max_ttl: Upper bound on any response's freshness
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self.max_ttl = max_ttl
+        self.hits = 0
+        self.stale = 0
+        self.revalidated = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        # One connection shared by all threads; the lock serializes access
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=5)
+        if path != ":memory:":
+            # Several API workers may share the file
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(SCHEMA)
+        self._conn.commit()
+
+    def lookup(self, url: str) -> Optional[Dict[str, any]]:
+        """
+        Return the cached entry for url (fresh or stale), or None
+
+        The entry has title, content, word_count, etag, last_modified and 'fresh'.
+        """
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT title, content, word_count, etag, last_modified, expires_at "
+                "FROM article_cache WHERE url = ?", (normalize_url(url),)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            fresh = row[5] > now
+            if fresh:
+                self._conn.execute(
+                    "UPDATE article_cache SET last_access = ?, hits = hits + 1 WHERE url = ?",
+                    (now, normalize_url(url))
+                )
+                self._conn.commit()
+                self.hits += 1
+            else:
+                self.stale += 1
+        return {
+            "title": row[0],
+            "content": row[1],
+            "word_count": row[2],
+            "etag": row[3],
+            "last_modified": row[4],
+            "fresh": fresh
+        }
+
+    @staticmethod
+    def conditional_headers(entry: Optional[Dict]) -> Dict[str, str]:
+        """If-None-Match / If-Modified-Since headers to revalidate a stale entry"""
+        headers = {}
+        if entry and entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry and entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def store(self, url: str, article: Dict, headers: Mapping[str, str]):
+        """Cache an extracted article with the validators and freshness of its response"""
+        ttl = freshness_lifetime(headers, self.default_ttl, self.max_ttl)
+        etag, last_modified = headers.get("ETag"), headers.get("Last-Modified")
+        now = time.time()
+        with self._lock:
+            if ttl is None or (ttl <= 0 and not (etag or last_modified)):
+                # Uncacheable, or stale at once with nothing to revalidate against
+                self._conn.execute("DELETE FROM article_cache WHERE url = ?", (normalize_url(url),))
+                self._conn.commit()
+                return
+            self._conn.execute(
+                "INSERT OR REPLACE INTO article_cache "
+                "(url, title, content, word_count, etag, last_modified, fetched_at, expires_at, last_access, hits) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, 0)",
+                (normalize_url(url), article["title"], article["content"], article["word_count"],
+                 etag, last_modified, now, now + ttl, now)
+            )
+            self._evict()
+            self._conn.commit()
+
+    def refresh(self, url: str, headers: Mapping[str, str]):
+        """Extend a stale entry's freshness after a 304 Not Modified"""
+        ttl = freshness_lifetime(headers, self.default_ttl, self.max_ttl)
+        now = time.time()
+        with self._lock:
+            if ttl is None:
+                self._conn.execute("DELETE FROM article_cache WHERE url = ?", (normalize_url(url),))
+            else:
+                # A 304 may carry updated validators; keep the old ones otherwise
+                self._conn.execute(
+                    "UPDATE article_cache SET expires_at = ?, last_access = ?, hits = hits + 1, "
+                    "etag = COALESCE(?, etag), last_modified = COALESCE(?, last_modified) WHERE url = ?",
+                    (now + ttl, now, headers.get("ETag"), headers.get("Last-Modified"), normalize_url(url))
+                )
+            self._conn.commit()
+            self.revalidated += 1
+
+    def _evict(self):
+        count = self._conn.execute("SELECT COUNT(*) FROM article_cache").fetchone()[0]
+        overflow = count - self.max_entries
+        if overflow > 0:
+            self.evictions += self._conn.execute(
+                "DELETE FROM article_cache WHERE url IN "
+                "(SELECT url FROM article_cache ORDER BY last_access ASC LIMIT ?)", (overflow,)
+            ).rowcount
+
+    def clear(self):
+        """Drop every cached article"""
+        with self._lock:
+            self._conn.execute("DELETE FROM article_cache")
+            self._conn.commit()
+
+    def stats(self) -> Dict[str, any]:
+        """Return size and this process's lookup outcomes (stale = revalidation attempted)"""
+        with self._lock:
+            size = self._conn.execute("SELECT COUNT(*) FROM article_cache").fetchone()[0]
+            total = self.hits + self.stale + self.misses
+            return {
+                "size": size,
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "stale": self.stale,
+                "revalidated": self.revalidated,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round((self.hits + self.revalidated) / total, 3) if total else 0.0
+            }
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+_shared_cache: Optional[ArticleCache] = None
+_shared_lock = threading.Lock()
+
+
+def get_article_cache() -> ArticleCache:
+    """Return the process-wide article cache, opening it on first use"""
+    global _shared_cache
+    with _shared_lock:
+        if _shared_cache is None:
+            _shared_cache = ArticleCache(
+                path=config.ARTICLE_CACHE_PATH,
+                max_entries=config.ARTICLE_CACHE_MAX_ENTRIES,
+                default_ttl=config.ARTICLE_CACHE_TTL,
+                max_ttl=config.ARTICLE_CACHE_MAX_TTL
+            )
+        return _shared_cache
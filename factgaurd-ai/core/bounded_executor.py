@@ -0,0 +1,97 @@
+"""
+Bounded Executor
+Runs blocking verification work off the event loop with a fixed worker pool
+and a bounded wait queue, so one uvicorn worker can serve many requests
+"""
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict
+from core.deadline import in_context
+
+
+class ExecutorSaturated(Exception):
+    """Raised when every worker is busy and the wait queue is full"""
+    pass
+
+
+class BoundedExecutor:
+    """Thread pool that rejects work instead of queueing without limit"""
+
+    def __init__(self, max_workers: int, max_queue: int, name: str = "verify"):
+        """
+        Args:
+            max_workers: Verifications allowed to run at the same time
+            max_queue: Extra verifications allowed to wait for a free worker
+            name: Thread name prefix
+        """
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=name)
+        self._slots = threading.BoundedSemaphore(max_workers + max_queue)
+        self._lock = threading.Lock()
+        self._admitted = 0
+        self.rejected = 0
+
+    async def run(self, fn: Callable, *args, **kwargs):
+        """
+        Run a blocking callable in the pool and await its result
+
+        Raises:
+            ExecutorSaturated: If no worker or queue slot is free
+        """
+        return await self.submit(fn, *args, **kwargs)
+
+    def submit(self, fn: Callable, *args, **kwargs) -> asyncio.Future:
+        """
+        Admit a blocking callable into the pool without waiting for it
+
+        Must be called from a running event loop.
+
+        Returns:
+            Awaitable asyncio future with the callable's result
+
+        Raises:
+            ExecutorSaturated: Immediately, if no worker or queue slot is free
+        """
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self.rejected += 1
+            raise ExecutorSaturated(
+                f"Verification capacity exhausted ({self.max_workers} running, {self.max_queue} waiting)"
+            )
+
+        with self._lock:
+            self._admitted += 1
+
+        try:
+            # Carry the caller's context (request deadline) into the worker thread
+            future = self._executor.submit(in_context(fn, *args, **kwargs))
+        except Exception:
+            self._release()
+            raise
+
+        # Free the slot when the work really finishes, even if the client went away
+        future.add_done_callback(lambda _: self._release())
+        return asyncio.wrap_future(future)
+
+    def _release(self):
+        with self._lock:
+            self._admitted -= 1
+        self._slots.release()
+
+    def stats(self) -> Dict[str, int]:
+        """Return current load and rejection count"""
+        with self._lock:
+            admitted = self._admitted
+            return {
+                "max_workers": self.max_workers,
+                "max_queue": self.max_queue,
+                "running": min(admitted, self.max_workers),
+                "queued": max(0, admitted - self.max_workers),
+                "rejected": self.rejected
+            }
+
+    def shutdown(self):
+        """Stop accepting work and wait for running verifications"""
+        self._executor.shutdown(wait=True)
@@ -0,0 +1,192 @@
+"""
+Circuit Breaker
+Per-upstream breakers that stop calling a degraded provider, fail fast while it is
+down and let a probe through periodically to detect recovery
+"""
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+import requests
+
+from config import config
+
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# Display names for the upstreams the verifier depends on
+UPSTREAM_NAMES = {
+    "alpha_vantage": "Alpha Vantage",
+    "newsapi": "NewsAPI",
+    "serpapi": "SerpAPI",
+    "llm": "LLM endpoint"
+}
+
+
+class CircuitOpenError(requests.exceptions.ConnectionError):
+    """Raised instead of calling an upstream whose breaker is open"""
+
+
+class CircuitBreaker:
+    """Consecutive-failure breaker; calls slower than slow_call_seconds count as failures"""
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int,
+        reset_timeout: float,
+        slow_call_seconds: float = 0,
+        half_open_max_calls: int = 1
+    ):
+        """
+        Args:
+            name: Upstream identifier (see UPSTREAM_NAMES)
+            failure_threshold: Consecutive failed or slow calls that open the circuit
+            reset_timeout: Seconds to stay open before letting a probe through
+            slow_call_seconds: Calls taking longer count as failures (0 disables the latency check)
+            half_open_max_calls: Concurrent probes allowed while half-open
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.slow_call_seconds = slow_call_seconds
+        self.half_open_max_calls = half_open_max_calls
+
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probes = 0
+        self.rejected = 0
+        self.trips = 0
+
+    @property
+    def display_name(self) -> str:
+        return UPSTREAM_NAMES.get(self.name, self.name)
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._current_state()
+
+    def is_open(self) -> bool:
+        """True while calls would be rejected outright"""
+        return self.state == OPEN
+
+    def retry_after(self) -> float:
+        """Seconds until the next probe is allowed (0 unless open)"""
+        with self._lock:
+            if self._current_state() != OPEN:
+                return 0.0
+            return max(0.0, self._opened_at + self.reset_timeout - time.monotonic())
+
+    def before_call(self):
+        """
+        Reserve a call slot
+
+        Raises:
+            CircuitOpenError: The circuit is open, or half-open with its probe already in flight
+        """
+        with self._lock:
+            state = self._current_state()
+            if state == HALF_OPEN and self._probes < self.half_open_max_calls:
+                self._probes += 1
+                return
+            if state == CLOSED:
+                return
+            self.rejected += 1
+        raise CircuitOpenError(self.unavailable_note())
+
+    def release(self):
+        """Give back a slot reserved by before_call for a call that was never sent"""
+        with self._lock:
+            if self._current_state() == HALF_OPEN and self._probes > 0:
+                self._probes -= 1
+
+    def record_success(self, elapsed: float = 0.0):
+        """Report a finished call; slow successes count against the upstream"""
+        if self.slow_call_seconds and elapsed > self.slow_call_seconds:
+            self.record_failure()
+            return
+        with self._lock:
+            self._state = CLOSED
+            self._failures = 0
+            self._probes = 0
+
+    def record_failure(self):
+        """Report a failed call, opening the circuit at the threshold or on a failed probe"""
+        with self._lock:
+            state = self._current_state()
+            self._failures += 1
+            if state == HALF_OPEN or self._failures >= self.failure_threshold:
+                if state != OPEN:
+                    self.trips += 1
+                    print(f"🔌 {self.display_name} circuit opened after {self._failures} failure(s)")
+                self._state = OPEN
+                self._opened_at = time.monotonic()
+                self._probes = 0
+
+    def call(self, fn: Callable, *args, **kwargs):
+        """Run fn through the breaker; any exception counts as a failure and is re-raised"""
+        self.before_call()
+        start = time.monotonic()
+        try:
+            result = fn(*args, **kwargs)
+        except Exception:
+            self.record_failure()
+            raise
+        self.record_success(time.monotonic() - start)
+        return result
+
+    def unavailable_note(self) -> str:
+        """Evidence-ready explanation of why this source was skipped"""
+        return (f"Source unavailable: {self.display_name} is failing "
+                f"(circuit open, next retry in {self.retry_after():.0f}s)")
+
+    def stats(self) -> Dict[str, any]:
+        with self._lock:
+            return {
+                "state": self._current_state(),
+                "consecutive_failures": self._failures,
+                "trips": self.trips,
+                "rejected": self.rejected
+            }
+
+    def _current_state(self) -> str:
+        # Caller holds the lock; an expired open circuit becomes half-open lazily
+        if self._state == OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+            self._state = HALF_OPEN
+            self._probes = 0
+        return self._state
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_breaker(name: str) -> CircuitBreaker:
+    """Return the process-wide breaker for an upstream, creating it on first use"""
+    with _breakers_lock:
+        if name not in _breakers:
+            _breakers[name] = CircuitBreaker(
+                name=name,
+                failure_threshold=config.CIRCUIT_FAILURE_THRESHOLD,
+                reset_timeout=config.CIRCUIT_RESET_TIMEOUT,
+                slow_call_seconds=config.CIRCUIT_LLM_SLOW_CALL_SECONDS if name == "llm"
+                else config.CIRCUIT_SLOW_CALL_SECONDS
+            )
+        return _breakers[name]
+
+
+def open_upstreams(names: List[str]) -> List[CircuitBreaker]:
+    """Breakers among names that are currently rejecting calls"""
+    return [breaker for breaker in map(get_breaker, names) if breaker.is_open()]
+
+
+def breaker_stats() -> Dict[str, Dict[str, any]]:
+    """State of every breaker created so far"""
+    with _breakers_lock:
+        breakers = dict(_breakers)
+    return {name: breaker.stats() for name, breaker in breakers.items()}
@@ -0,0 +1,76 @@
+"""
+Request Deadline
+One time budget per verification request, created at the entry point and visible to
+every stage (router, planner, agents, tool clients, consensus) through a context variable
+"""
+import contextvars
+import time
+from contextlib import contextmanager
+from functools import partial
+from typing import Callable, Optional
+
+import requests
+
+
+class DeadlineExceeded(requests.exceptions.Timeout):
+    """The request's time budget ran out before an upstream call could start"""
+
+
+class Deadline:
+    """Absolute point in time by which the current request must answer"""
+
+    def __init__(self, seconds: float):
+        """
+        Args:
+            seconds: Total budget from now
+        """
+        self.budget = seconds
+        self.expires_at = time.monotonic() + seconds
+
+    def remaining(self) -> float:
+        """Seconds left (0 once expired)"""
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+    def cap(self, seconds: float, reserve: float = 0.0) -> float:
+        """seconds, shortened to what is left after holding back reserve for later stages"""
+        return max(0.0, min(seconds, self.remaining() - reserve))
+
+
+_current: contextvars.ContextVar[Optional[Deadline]] = contextvars.ContextVar("request_deadline", default=None)
+
+
+def current_deadline() -> Optional[Deadline]:
+    """Deadline of the request being served by this thread/task, if any"""
+    return _current.get()
+
+
+@contextmanager
+def deadline_scope(seconds: float):
+    """
+    Run the enclosed block under a new request deadline
+
+    Nested scopes never extend an outer deadline, only shorten it.
+    """
+    outer = _current.get()
+    deadline = Deadline(seconds)
+    if outer is not None:
+        deadline.expires_at = min(deadline.expires_at, outer.expires_at)
+    token = _current.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current.reset(token)
+
+
+def remaining_or(default: float, reserve: float = 0.0) -> float:
+    """default capped by the current deadline (default itself when there is none)"""
+    deadline = _current.get()
+    return default if deadline is None else deadline.cap(default, reserve)
+
+
+def in_context(fn: Callable, *args, **kwargs) -> Callable[[], any]:
+    """Bind fn to the caller's context so worker threads see the same deadline"""
+    return partial(contextvars.copy_context().run, fn, *args, **kwargs)
@@ -0,0 +1,75 @@
+"""
+Domain Politeness
+Per-publisher limits for article fetching: at most N requests in flight to one site and
+a minimum gap between request starts, so batch ingestion does not hammer a publisher
+"""
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict
+from urllib.parse import urlsplit
+
+from core.url_canonicalizer import normalize_host
+
+
+class _DomainState:
+    __slots__ = ("active", "next_start", "requests", "waited")
+
+    def __init__(self):
+        self.active = 0
+        self.next_start = 0.0
+        self.requests = 0
+        self.waited = 0.0
+
+
+class DomainPoliteness:
+    """Blocking per-domain concurrency and request-spacing limits shared by all threads"""
+
+    def __init__(self, max_concurrent: int, min_interval: float):
+        """
+        Args:
+            max_concurrent: Requests allowed in flight to one domain at once
+            min_interval: Seconds between consecutive request starts to one domain
+        """
+        self.max_concurrent = max(1, max_concurrent)
+        self.min_interval = max(0.0, min_interval)
+        self._domains: Dict[str, _DomainState] = {}
+        self._cond = threading.Condition()
+
+    @staticmethod
+    def domain_of(url: str) -> str:
+        """Politeness key: www/mobile/AMP variants of a site share one budget"""
+        return normalize_host(urlsplit(url).hostname or "")
+
+    @contextmanager
+    def slot(self, url: str):
+        """Hold one of url's domain slots for the duration of the block, waiting for it if needed"""
+        domain = self.domain_of(url)
+        start = time.monotonic()
+        with self._cond:
+            state = self._domains.setdefault(domain, _DomainState())
+            while True:
+                now = time.monotonic()
+                if state.active < self.max_concurrent and now >= state.next_start:
+                    break
+                # Woken early when a slot frees; otherwise sleep until the spacing allows a start
+                timeout = state.next_start - now if state.active < self.max_concurrent else None
+                self._cond.wait(timeout=timeout)
+            state.active += 1
+            state.requests += 1
+            state.waited += now - start
+            state.next_start = now + self.min_interval
+        try:
+            yield
+        finally:
+            with self._cond:
+                state.active -= 1
+                self._cond.notify_all()
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """Requests, time spent waiting and in-flight count per domain"""
+        with self._cond:
+            return {
+                domain: {"requests": s.requests, "waited": round(s.waited, 3), "active": s.active}
+                for domain, s in self._domains.items()
+            }
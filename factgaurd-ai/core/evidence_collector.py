@@ -0,0 +1,87 @@
+"""
+Evidence Collector
+Runs evidence agents concurrently, each with its own deadline
+"""
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError, as_completed
+from typing import Callable, Dict, List, Optional
+from core.deadline import in_context
+
+
+class EvidenceCollector:
+    """Runs one job per required agent in parallel and gathers what finishes in time"""
+
+    def __init__(self, agent_timeout: float):
+        """
+        Args:
+            agent_timeout: Seconds each agent may run before its evidence is dropped
+        """
+        self.agent_timeout = agent_timeout
+
+    def collect(
+        self,
+        jobs: Dict[str, Callable[[], str]],
+        on_result: Optional[Callable[[Dict[str, any]], None]] = None,
+        timeout: Optional[float] = None
+    ) -> List[Dict[str, any]]:
+        """
+        Execute evidence jobs concurrently
+
+        Args:
+            jobs: Mapping of agent name to a zero-argument callable returning evidence text
+            on_result: Optional callback invoked with each result as soon as that agent
+                       finishes (or is given up on), in the calling thread
+            timeout: Deadline for this call, overriding agent_timeout (e.g. the
+                     request's remaining budget)
+
+        Returns:
+            One result dict per job, in the order the jobs were given. Each dict has
+            'agent', 'status' ('ok', 'timeout' or 'error'), 'evidence' and 'elapsed'.
+        """
+        if not jobs:
+            return []
+
+        timeout = self.agent_timeout if timeout is None else timeout
+        started = time.monotonic()
+        executor = ThreadPoolExecutor(max_workers=len(jobs), thread_name_prefix="evidence")
+        try:
+            futures = {executor.submit(in_context(self._timed, job)): name for name, job in jobs.items()}
+            results = {}
+
+            def record(name, status, evidence, elapsed):
+                results[name] = {
+                    "agent": name,
+                    "status": status,
+                    "evidence": evidence,
+                    "elapsed": round(elapsed, 3)
+                }
+                if on_result:
+                    on_result(results[name])
+
+            try:
+                # All jobs started together, so they share one deadline
+                for future in as_completed(futures, timeout=timeout):
+                    name = futures[future]
+                    try:
+                        evidence, elapsed = future.result()
+                        record(name, "ok", evidence, elapsed)
+                    except Exception as e:
+                        print(f"⚠️ {name} failed: {str(e)}")
+                        record(name, "error", "", time.monotonic() - started)
+            except FutureTimeoutError:
+                for name in jobs:
+                    if name not in results:
+                        print(f"⏱️ {name} exceeded {timeout:.0f}s deadline, skipping its evidence")
+                        record(name, "timeout", "", timeout)
+
+            return [results[name] for name in jobs]
+        finally:
+            # Do not block on agents that blew their deadline
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    @staticmethod
+    def _timed(job: Callable[[], str]):
+        """Run a job and return (result, seconds taken)"""
+        start = time.monotonic()
+        result = job()
+        return result, time.monotonic() - start
@@ -0,0 +1,272 @@
+"""
+Evidence Packer
+Splits agent output into source-attributed snippets, ranks them against the claim
+and fills the consensus prompt's token budget with the best ones from every agent
+"""
+import math
+import re
+from datetime import datetime
+from typing import Dict, List, Optional
+
+
+# Outlets and domains treated as high-trust when a snippet cites them
+TRUSTED_SOURCES = {
+    "reuters", "bbc", "associated press", "apnews", "bloomberg", "new york times", "nytimes",
+    "wall street journal", "wsj", "financial times", "ft.com", "economist", "wikipedia",
+    "the hindu", "indian express", "hindustan times", "economic times", "livemint", "pti",
+    "alpha vantage", ".gov", ".edu"
+}
+
+# Where an agent's evidence comes from when a snippet does not name its source
+AGENT_DEFAULT_SOURCES = {
+    "finance_agent": "Alpha Vantage",
+    "news_agent": "News search"
+}
+
+STOPWORDS = {"the", "a", "an", "and", "or", "of", "to", "in", "on", "for", "is", "are", "was",
+             "were", "be", "been", "by", "with", "at", "as", "that", "this", "it", "its",
+             "from", "has", "have", "had", "will", "than", "about", "into", "over", "after"}
+
+MONTHS = {"jan": 1, "feb": 2, "mar": 3, "apr": 4, "may": 5, "jun": 6, "jul": 7, "aug": 8,
+          "sep": 9, "oct": 10, "nov": 11, "dec": 12}
+
+SOURCE_PATTERN = re.compile(
+    r'(?:source|via|according to|published by|reported by)[:\s]+\**([A-Z][\w.&\- ]{1,40}?)\**(?=[,.;:()\n]|\s-|$)',
+    re.IGNORECASE
+)
+DOMAIN_PATTERN = re.compile(r'\b(?:https?://)?(?:www\.)?([a-z0-9-]+(?:\.[a-z0-9-]+)*\.(?:com|org|net|in|gov|edu|co\.uk))\b')
+ISO_DATE_PATTERN = re.compile(r'\b(20\d{2})-(\d{2})-(\d{2})\b')
+TEXT_DATE_PATTERN = re.compile(
+    r'\b(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\.?\s+(\d{1,2}),?\s+(20\d{2})\b',
+    re.IGNORECASE
+)
+OUTLET_PATTERN = re.compile(
+    r'\b(' + "|".join(re.escape(name) for name in sorted(TRUSTED_SOURCES) if not name.startswith(".")) + r')\b',
+    re.IGNORECASE
+)
+RELATIVE_RECENT_PATTERN = re.compile(r'\b(today|yesterday|hours? ago|minutes? ago|this week)\b', re.IGNORECASE)
+SENTENCE_SPLIT = re.compile(r'(?<=[.!?])\s+(?=[A-Z0-9"])')
+
+
+def _trusted_host(host: str) -> bool:
+    """Whether host belongs to a trusted outlet (reuters.com, uk.reuters.com, bbc.co.uk, x.gov)"""
+    labels = host.split('.')
+    site = labels[-3] if host.endswith('.co.uk') and len(labels) >= 3 else labels[-2]
+    for trusted in TRUSTED_SOURCES:
+        if trusted.startswith('.'):
+            if host.endswith(trusted):
+                return True
+        elif '.' in trusted:
+            if host == trusted or host.endswith('.' + trusted):
+                return True
+        elif trusted == site:
+            return True
+    return False
+
+
+def _cites_trusted(text: str) -> bool:
+    """Whether text names a trusted outlet as a whole word or links to one of its domains"""
+    lowered = text.lower()
+    if any(_trusted_host(host) for host in DOMAIN_PATTERN.findall(lowered)):
+        return True
+    # Domains were judged by host above; "reuters.com.example.net" must not pass as Reuters
+    return bool(OUTLET_PATTERN.search(DOMAIN_PATTERN.sub(' ', lowered)))
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count for Llama-family tokenizers (~4 characters per token)"""
+    return max(1, math.ceil(len(text) / 4))
+
+
+def _terms(text: str) -> set:
+    return {
+        word for word in re.findall(r"[a-z0-9]+(?:\.[0-9]+)?", text.lower())
+        if word not in STOPWORDS and (len(word) > 2 or word.isdigit())
+    }
+
+
+class EvidencePacker:
+    """Ranks evidence snippets and packs the best of them into a fixed token budget"""
+
+    def __init__(self, token_budget: int, max_snippet_chars: int = 400):
+        """
+        Args:
+            token_budget: Tokens of evidence the consensus prompt may receive
+            max_snippet_chars: Paragraphs longer than this are split at sentence boundaries
+        """
+        self.token_budget = token_budget
+        self.max_snippet_chars = max_snippet_chars
+
+    def pack(self, claim: str, evidence: Dict[str, str], time_sensitive: bool = False,
+             now: Optional[datetime] = None) -> str:
+        """
+        Build the evidence summary handed to the Consensus Agent
+
+        Args:
+            claim: The claim being verified
+            evidence: Mapping of agent name to that agent's raw output
+            time_sensitive: Weight recency higher for claims about recent events
+            now: Reference time for recency scoring (defaults to now)
+
+        Returns:
+            Snippets grouped by agent, each tagged with its source
+        """
+        selected = self.select(claim, evidence, time_sensitive, now)
+        if not selected:
+            return "No specific evidence gathered."
+
+        sections = []
+        for agent in evidence:
+            lines = [f"- [{s['source']}] {s['text']}" for s in selected if s["agent"] == agent]
+            if lines:
+                sections.append(f"{agent}:\n" + "\n".join(lines))
+        return "\n\n".join(sections)
+
+    def select(self, claim: str, evidence: Dict[str, str], time_sensitive: bool = False,
+               now: Optional[datetime] = None) -> List[Dict[str, any]]:
+        """
+        Choose the snippets that fit the budget, in their original order
+
+        Each agent's best snippet is taken first so no agent is crowded out,
+        then the remaining budget goes to the highest-scoring snippets overall.
+
+        Returns:
+            List of snippet dicts with agent, source, text, score and tokens
+        """
+        now = now or datetime.now()
+        claim_terms = _terms(claim)
+
+        snippets = []
+        for agent, text in evidence.items():
+            for snippet in self.split(agent, text):
+                snippet["score"] = self.score(snippet, claim_terms, time_sensitive, now)
+                snippet["order"] = len(snippets)
+                snippets.append(snippet)
+
+        ranked = sorted(snippets, key=lambda s: s["score"], reverse=True)
+        best_per_agent = {}
+        for snippet in ranked:
+            best_per_agent.setdefault(snippet["agent"], snippet)
+
+        chosen = {}
+        remaining = self.token_budget
+        for snippet in list(best_per_agent.values()) + ranked:
+            if snippet["order"] in chosen:
+                continue
+            if snippet["tokens"] <= remaining:
+                chosen[snippet["order"]] = snippet
+                remaining -= snippet["tokens"]
+
+        dropped = len(snippets) - len(chosen)
+        if dropped:
+            print(f"📦 Packed {len(chosen)}/{len(snippets)} evidence snippets "
+                  f"({self.token_budget - remaining}/{self.token_budget} tokens)")
+        return [chosen[order] for order in sorted(chosen)]
+
+    def split(self, agent: str, text: str) -> List[Dict[str, any]]:
+        """Break one agent's output into attributed, de-duplicated snippets"""
+        default_source = AGENT_DEFAULT_SOURCES.get(agent, agent)
+        snippets = []
+        seen = set()
+
+        for paragraph in re.split(r'\n\s*\n|\n(?=\s*(?:[-*•]|\d+\.)\s)', text or ""):
+            paragraph = " ".join(paragraph.split())
+            if len(paragraph) < 20:
+                continue
+
+            source = self._find_source(paragraph)
+            for chunk in self._chunks(paragraph):
+                key = chunk.lower()
+                if key in seen:
+                    continue
+                seen.add(key)
+                attributed = self._find_source(chunk) or source or default_source
+                snippets.append({
+                    "agent": agent,
+                    "source": attributed,
+                    "text": chunk,
+                    # Counted as rendered by pack(), including the source tag
+                    "tokens": estimate_tokens(f"- [{attributed}] {chunk}")
+                })
+        return snippets
+
+    def score(self, snippet: Dict[str, any], claim_terms: set, time_sensitive: bool,
+              now: datetime) -> float:
+        """
+        Weighted blend of lexical overlap, source trust and recency (0.0 - 1.0)
+        """
+        overlap = len(claim_terms & _terms(snippet["text"])) / len(claim_terms) if claim_terms else 0.0
+        trust = self._trust(snippet["source"], snippet["text"])
+        recency = self._recency(snippet["text"], now)
+
+        if time_sensitive:
+            return 0.5 * overlap + 0.2 * trust + 0.3 * recency
+        return 0.6 * overlap + 0.25 * trust + 0.15 * recency
+
+    def _chunks(self, paragraph: str) -> List[str]:
+        if len(paragraph) <= self.max_snippet_chars:
+            return [paragraph]
+
+        chunks, current = [], ""
+        for sentence in SENTENCE_SPLIT.split(paragraph):
+            if current and len(current) + len(sentence) + 1 > self.max_snippet_chars:
+                chunks.append(current)
+                current = ""
+            current = f"{current} {sentence}".strip()
+            while len(current) > self.max_snippet_chars:
+                chunks.append(current[:self.max_snippet_chars])
+                current = current[self.max_snippet_chars:]
+        if current:
+            chunks.append(current)
+        return chunks
+
+    @staticmethod
+    def _find_source(text: str) -> Optional[str]:
+        match = SOURCE_PATTERN.search(text)
+        if match:
+            return match.group(1).strip()
+        match = DOMAIN_PATTERN.search(text.lower())
+        if match:
+            return match.group(1)
+        match = OUTLET_PATTERN.search(text)
+        if match:
+            return match.group(1)
+        return None
+
+    @staticmethod
+    def _trust(source: str, text: str) -> float:
+        if _cites_trusted(source):
+            return 1.0
+        if _cites_trusted(text):
+            return 0.8
+        return 0.4
+
+    @staticmethod
+    def _recency(text: str, now: datetime) -> float:
+        """1.0 for today-ish evidence, decaying with age; 0.5 when undated"""
+        if RELATIVE_RECENT_PATTERN.search(text):
+            return 1.0
+
+        dates = []
+        for year, month, day in ISO_DATE_PATTERN.findall(text):
+            dates.append((int(year), int(month), int(day)))
+        for month, day, year in TEXT_DATE_PATTERN.findall(text):
+            dates.append((int(year), MONTHS[month[:3].lower()], int(day)))
+
+        ages = []
+        for year, month, day in dates:
+            try:
+                ages.append((now - datetime(year, month, day)).days)
+            except ValueError:
+                continue
+        if not ages:
+            return 0.5
+
+        age = max(0, min(ages))
+        if age <= 7:
+            return 1.0
+        if age <= 30:
+            return 0.8
+        if age <= 365:
+            return 0.5
+        return 0.2
@@ -0,0 +1,92 @@
+"""
+Evidence Prefetch
+Calls the evidence tools directly with claim-derived queries before an agent runs,
+so the agent reasons over results instead of spending LLM iterations picking tool calls
+"""
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List
+from core.deadline import in_context
+from core.pre_router import CURRENCY_CODES, find_instruments
+
+
+# Instrument names the Financial Data Fetcher expects
+COMMODITY_QUERIES = {"gold": "GOLD", "silver": "SILVER", "oil": "OIL", "crude": "OIL", "brent": "OIL",
+                     "platinum": "PLATINUM", "copper": "COPPER"}
+CURRENCY_NAME_CODES = {"rupee": "INR", "rupees": "INR", "euro": "EUR", "euros": "EUR", "pound": "GBP",
+                       "sterling": "GBP", "yen": "JPY", "yuan": "CNY", "bitcoin": "BTC", "ethereum": "ETH"}
+
+
+class EvidencePrefetcher:
+    """Fetches each agent's most likely tool results up front"""
+
+    def __init__(
+        self,
+        finance_lookup: Callable[[str], str],
+        news_sweep: Callable[[str], str],
+        max_finance_queries: int = 3
+    ):
+        """
+        Args:
+            finance_lookup: Financial Data Fetcher as a plain function (query -> text)
+            news_sweep: Evidence Sweep as a plain function (claim -> text)
+            max_finance_queries: Upper bound on market data lookups per claim
+        """
+        self.finance_lookup = finance_lookup
+        self.news_sweep = news_sweep
+        self.max_finance_queries = max_finance_queries
+
+    def prefetch(self, agent_name: str, claim: str) -> str:
+        """
+        Fetch evidence for one agent
+
+        Args:
+            agent_name: 'finance_agent' or 'news_agent'
+            claim: The factual claim to verify
+
+        Returns:
+            Tool output to inject into the agent's task, or "" if nothing could be prefetched
+        """
+        try:
+            if agent_name == "finance_agent":
+                return self._prefetch_finance(claim)
+            if agent_name == "news_agent":
+                return self.news_sweep(claim)
+        except Exception as e:
+            # The agent can still fetch for itself
+            print(f"⚠️ Prefetch for {agent_name} failed: {str(e)}")
+        return ""
+
+    def finance_queries(self, claim: str) -> List[str]:
+        """Map the claim's instruments to Financial Data Fetcher queries"""
+        queries = []
+        for instrument in find_instruments(claim):
+            if instrument in COMMODITY_QUERIES:
+                query = COMMODITY_QUERIES[instrument]
+            elif instrument in CURRENCY_NAME_CODES:
+                query = self._pair(CURRENCY_NAME_CODES[instrument])
+            elif instrument in CURRENCY_CODES:
+                # A lone code ("INR fell") is quoted against the dollar
+                query = self._pair(instrument) if instrument != "USD" else None
+            elif "/" in instrument or instrument.isupper():
+                query = instrument
+            else:
+                query = None
+
+            if query and query not in queries:
+                queries.append(query)
+        return queries[:self.max_finance_queries]
+
+    def _prefetch_finance(self, claim: str) -> str:
+        queries = self.finance_queries(claim)
+        if not queries:
+            return ""
+
+        with ThreadPoolExecutor(max_workers=len(queries), thread_name_prefix="prefetch") as pool:
+            futures = [pool.submit(in_context(self.finance_lookup, query)) for query in queries]
+            results = [future.result() for future in futures]
+
+        return "\n".join(f"[{query}] {result}" for query, result in zip(queries, results))
+
+    @staticmethod
+    def _pair(code: str) -> str:
+        return f"{code}/USD" if code in ("BTC", "ETH") else f"USD/{code}"
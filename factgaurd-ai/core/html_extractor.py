@@ -0,0 +1,201 @@
+"""
+HTML Extractor
+Pluggable backends that turn an article page into (title, body text)
+
+'soup' is the original BeautifulSoup extraction (decompose boilerplate, then try the
+content selectors in turn). 'lxml' parses with libxml2 and collects the same candidates
+in a single walk that skips boilerplate subtrees instead of deleting them.
+"""
+from typing import Dict, List, Optional, Tuple, Union
+
+from bs4 import BeautifulSoup
+
+try:
+    import lxml.etree
+    import lxml.html
+    HAS_LXML = True
+except ImportError:
+    # Optional C parser - the pure-Python 'soup' backend is used without it
+    HAS_LXML = False
+
+
+# Subtrees that never hold article text
+BOILERPLATE_TAGS = frozenset(['script', 'style', 'nav', 'footer', 'aside',
+                              'header', 'iframe', 'noscript', 'form'])
+
+# Content containers in priority order, used when the page has no <article>
+CONTENT_SELECTORS = [
+    'main', '[role="main"]', '.article-content', '.post-content',
+    '.entry-content', '.content', '#content', '.article-body'
+]
+
+Html = Union[str, bytes]
+
+
+class SoupExtractor:
+    """BeautifulSoup extraction (the reference behaviour)"""
+
+    def __init__(self, parser: str = 'html.parser'):
+        """
+        Args:
+            parser: BeautifulSoup tree builder, e.g. 'html.parser' or 'lxml'
+        """
+        self.parser = parser
+
+    def extract(self, html: Html) -> Tuple[str, str]:
+        soup = BeautifulSoup(html, self.parser)
+
+        # Remove unwanted elements
+        for element in soup(list(BOILERPLATE_TAGS)):
+            element.decompose()
+
+        title = soup.find('title')
+        title_text = title.get_text().strip() if title else "No title"
+
+        # Try semantic HTML5 tags first
+        article = soup.find('article')
+        if article:
+            return title_text, article.get_text(separator=' ', strip=True)
+
+        # Try common content class names
+        for selector in CONTENT_SELECTORS:
+            content = soup.select_one(selector)
+            if content:
+                text = content.get_text(separator=' ', strip=True)
+                if text:
+                    return title_text, text
+                break
+
+        # Fallback: get all paragraphs
+        paragraphs = soup.find_all('p')
+        return title_text, ' '.join([p.get_text(strip=True) for p in paragraphs])
+
+
+def _selector_index(element) -> Optional[int]:
+    """Index of the highest-priority CONTENT_SELECTORS entry element matches"""
+    tag = element.tag
+    classes = (element.get('class') or '').split()
+    if tag == 'main':
+        return 0
+    if element.get('role') == 'main':
+        return 1
+    for i, name in ((2, 'article-content'), (3, 'post-content'), (4, 'entry-content'), (5, 'content')):
+        if name in classes:
+            return i
+    if element.get('id') == 'content':
+        return 6
+    if 'article-body' in classes:
+        return 7
+    return None
+
+
+class LxmlExtractor:
+    """libxml2 parse plus one boilerplate-skipping walk over the tree"""
+
+    def __init__(self):
+        # Decoded text is handed to libxml2 as UTF-8; raw bytes are left to its <meta charset> sniffing
+        self._utf8_parser = lxml.html.HTMLParser(encoding='utf-8')
+
+    def extract(self, html: Html) -> Tuple[str, str]:
+        try:
+            if isinstance(html, str):
+                root = lxml.html.document_fromstring(html.encode('utf-8'), parser=self._utf8_parser)
+            else:
+                root = lxml.html.document_fromstring(html)
+        except lxml.etree.ParserError:
+            # Empty document
+            return "No title", ""
+
+        title: Optional[str] = None
+        article: Optional[List[str]] = None
+        article_element = None
+        # First match per selector, filled while it is open
+        containers: Dict[int, List[str]] = {}
+        paragraphs: List[List[str]] = []
+        # Buffers receiving text at the current point of the walk
+        open_buffers: List[List[str]] = []
+        in_paragraph = False
+
+        def add(text):
+            if text:
+                text = text.strip()
+                if text:
+                    for buffer in open_buffers:
+                        buffer.append(text)
+
+        # (element, closing, buffers it opened, whether it opened a paragraph)
+        stack = [(root, False, 0, False)]
+        while stack:
+            element, closing, opened, paragraph = stack.pop()
+            if closing:
+                del open_buffers[len(open_buffers) - opened:]
+                if paragraph:
+                    in_paragraph = False
+                if element is article_element and title is not None:
+                    # Nothing after the first article can change the result
+                    break
+                add(element.tail)
+                continue
+
+            tag = element.tag
+            if not isinstance(tag, str) or tag in BOILERPLATE_TAGS:
+                # Comments, processing instructions and skipped subtrees: only the tail is text
+                add(element.tail)
+                continue
+
+            opened, paragraph = 0, False
+            if tag == 'title':
+                if title is None:
+                    title = element.text_content().strip()
+            else:
+                if tag == 'article' and article is None:
+                    article = []
+                    article_element = element
+                    open_buffers.append(article)
+                    opened += 1
+                index = _selector_index(element)
+                if index is not None and index not in containers:
+                    containers[index] = []
+                    open_buffers.append(containers[index])
+                    opened += 1
+                if tag == 'p' and not in_paragraph:
+                    paragraphs.append([])
+                    open_buffers.append(paragraphs[-1])
+                    opened += 1
+                    paragraph = in_paragraph = True
+                add(element.text)
+
+            stack.append((element, True, opened, paragraph))
+            stack.extend((child, False, 0, False) for child in reversed(element))
+
+        title_text = title or "No title"
+        if article is not None:
+            return title_text, ' '.join(article)
+        if containers:
+            text = ' '.join(containers[min(containers)])
+            if text:
+                return title_text, text
+        return title_text, ' '.join(''.join(p) for p in paragraphs)
+
+
+EXTRACTORS = {
+    'soup': SoupExtractor,
+    'lxml': LxmlExtractor
+}
+
+
+def get_extractor(name: str = 'auto'):
+    """
+    Build an extraction backend by name
+
+    Args:
+        name: 'lxml', 'soup', or 'auto' (lxml when installed, else soup)
+    """
+    if name == 'auto':
+        name = 'lxml' if HAS_LXML else 'soup'
+    elif name == 'lxml' and not HAS_LXML:
+        print("⚠️  lxml is not installed - using the BeautifulSoup HTML extractor")
+        name = 'soup'
+    if name not in EXTRACTORS:
+        raise ValueError(f"Unknown HTML extractor: {name} (expected one of {', '.join(EXTRACTORS)} or auto)")
+    return EXTRACTORS[name]()
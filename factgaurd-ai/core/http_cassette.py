@@ -0,0 +1,300 @@
+"""
+HTTP Cassette
+Records every outbound HTTP exchange (data-source tools via requests, LLM client via httpx)
+into a JSON cassette and replays it offline for reproducible runs and latency benchmarks
+"""
+import base64
+import hashlib
+import json
+import os
+import threading
+import time
+from io import BytesIO
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import httpx
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from config import config
+
+
+MODES = ("off", "record", "replay")
+
+# Credentials are never written to a cassette or used for matching
+SECRET_PARAMS = {"apikey", "api_key", "key", "token", "access_token"}
+
+# Bodies are stored decoded, so the original framing headers no longer apply
+DROPPED_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "set-cookie", "connection"}
+
+
+class CassetteMiss(requests.exceptions.ConnectionError):
+    """Replay found no recorded exchange for a request"""
+
+
+def _redact_url(url: str) -> str:
+    """URL with secret query parameters removed and the rest sorted"""
+    parts = urlsplit(url)
+    query = sorted((k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+                   if k.lower() not in SECRET_PARAMS)
+    return urlunsplit((parts.scheme, parts.netloc.lower(), parts.path, urlencode(query), ""))
+
+
+def _body_hash(body) -> str:
+    """Stable digest of a request body (JSON bodies are compared by content, not key order)"""
+    if not body:
+        return ""
+    if isinstance(body, str):
+        body = body.encode("utf-8")
+    try:
+        body = json.dumps(json.loads(body), sort_keys=True).encode("utf-8")
+    except (ValueError, UnicodeDecodeError):
+        pass
+    return hashlib.sha256(body).hexdigest()
+
+
+class Cassette:
+    """A recorded set of HTTP exchanges, matched by method, redacted URL and body"""
+
+    def __init__(self, path: str, mode: str, replay_latency: bool = False, match_any_body: bool = False):
+        """
+        Args:
+            path: JSON cassette file
+            mode: 'record' appends live exchanges, 'replay' serves them without network
+            replay_latency: Sleep for each exchange's recorded duration when replaying
+            match_any_body: When no recorded body matches, replay the same method and URL
+                            in order instead of failing (every LLM call shares one URL, so
+                            this can answer a changed prompt with another prompt's reply)
+        """
+        if mode not in MODES[1:]:
+            raise ValueError(f"Cassette mode must be 'record' or 'replay', got '{mode}'")
+
+        self.path = path
+        self.mode = mode
+        self.replay_latency = replay_latency
+        self.match_any_body = match_any_body
+        self._lock = threading.Lock()
+        self._interactions: List[Dict] = []
+        self._served: Dict[Tuple, int] = {}
+        self.hits = 0
+        self.misses = 0
+        # Requests whose URL was recorded but whose body was not (prompt drift)
+        self.body_mismatches = 0
+
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                self._interactions = json.load(f).get("interactions", [])
+        elif mode == "replay":
+            raise FileNotFoundError(f"Cassette not found: {path}")
+
+    def __len__(self) -> int:
+        return len(self._interactions)
+
+    def record(self, method: str, url: str, body, status: int, reason: str,
+               headers: Dict[str, str], content: bytes, elapsed: float):
+        """Store one live exchange and flush the cassette to disk"""
+        try:
+            stored_body, encoding = content.decode("utf-8"), "utf-8"
+        except UnicodeDecodeError:
+            stored_body, encoding = base64.b64encode(content).decode("ascii"), "base64"
+
+        interaction = {
+            "request": {"method": method.upper(), "url": _redact_url(url), "body_sha256": _body_hash(body)},
+            "response": {
+                "status": status,
+                "reason": reason,
+                "headers": {k: v for k, v in headers.items() if k.lower() not in DROPPED_HEADERS},
+                "body": stored_body,
+                "encoding": encoding
+            },
+            "elapsed": round(elapsed, 4)
+        }
+        with self._lock:
+            self._interactions.append(interaction)
+            self._save()
+
+    def play(self, method: str, url: str, body) -> Dict:
+        """
+        Recorded response for a request
+
+        Repeated identical requests cycle through their recordings in order, so a cassette
+        recorded once can be replayed for any number of benchmark iterations.
+
+        Raises:
+            CassetteMiss: Nothing was recorded for this method, URL and body (or, with
+                          match_any_body, for this method and URL)
+        """
+        method, url, digest = method.upper(), _redact_url(url), _body_hash(body)
+        with self._lock:
+            candidates = [i for i in self._interactions
+                          if i["request"]["method"] == method and i["request"]["url"] == url]
+            exact = [i for i in candidates if i["request"]["body_sha256"] == digest]
+            matches, key = exact, (method, url, digest)
+            if not exact and candidates:
+                self.body_mismatches += 1
+                if self.match_any_body:
+                    # Bodies can drift (timestamps in prompts); fall back to the same endpoint in order
+                    print(f"⚠️ Cassette body mismatch for {method} {url} - replaying by URL order")
+                    matches, key = candidates, (method, url)
+            if not matches:
+                self.misses += 1
+                detail = " with this body" if candidates else ""
+                raise CassetteMiss(f"No recorded response for {method} {url}{detail} in {self.path}")
+
+            served = self._served.get(key, 0)
+            self._served[key] = served + 1
+            self.hits += 1
+            interaction = matches[served % len(matches)]
+
+        if self.replay_latency:
+            time.sleep(interaction["elapsed"])
+
+        response = dict(interaction["response"])
+        if response["encoding"] == "base64":
+            response["content"] = base64.b64decode(response["body"])
+        else:
+            response["content"] = response["body"].encode("utf-8")
+        return response
+
+    def stats(self) -> Dict[str, any]:
+        with self._lock:
+            return {"mode": self.mode, "path": self.path, "interactions": len(self._interactions),
+                    "hits": self.hits, "misses": self.misses, "body_mismatches": self.body_mismatches}
+
+    def _save(self):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"version": 1, "interactions": self._interactions}, f, indent=1)
+        os.replace(tmp_path, self.path)
+
+
+class CassetteAdapter(BaseAdapter):
+    """requests transport adapter that records through, or replays instead of, a real adapter"""
+
+    def __init__(self, adapter: BaseAdapter, cassette: Cassette):
+        super().__init__()
+        self.adapter = adapter
+        self.cassette = cassette
+
+    def send(self, request: requests.PreparedRequest, **kwargs) -> requests.Response:
+        if self.cassette.mode == "replay":
+            return self._build_response(request, self.cassette.play(request.method, request.url, request.body))
+
+        start = time.monotonic()
+        response = self.adapter.send(request, **kwargs)
+        content = response.content
+        self.cassette.record(request.method, request.url, request.body, response.status_code,
+                             response.reason or "", dict(response.headers), content, time.monotonic() - start)
+        return response
+
+    def close(self):
+        self.adapter.close()
+
+    @staticmethod
+    def _build_response(request: requests.PreparedRequest, recorded: Dict) -> requests.Response:
+        response = requests.Response()
+        response.status_code = recorded["status"]
+        response.reason = recorded["reason"]
+        response.headers = CaseInsensitiveDict(recorded["headers"])
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.url = request.url
+        response.request = request
+        response.raw = BytesIO(recorded["content"])
+        response._content = recorded["content"]
+        response._content_consumed = True
+        return response
+
+
+_original_httpx_send = httpx.HTTPTransport.handle_request
+_original_httpx_async_send = httpx.AsyncHTTPTransport.handle_async_request
+_active_cassette: Optional[Cassette] = None
+
+
+def _httpx_response(request: httpx.Request, recorded: Dict) -> httpx.Response:
+    return httpx.Response(recorded["status"], headers=recorded["headers"],
+                          content=recorded["content"], request=request)
+
+
+def _handle_request(transport, request: httpx.Request) -> httpx.Response:
+    cassette = _active_cassette
+    if cassette is None:
+        return _original_httpx_send(transport, request)
+
+    body = request.read()
+    if cassette.mode == "replay":
+        try:
+            return _httpx_response(request, cassette.play(request.method, str(request.url), body))
+        except CassetteMiss as e:
+            raise httpx.ConnectError(str(e), request=request) from e
+
+    start = time.monotonic()
+    response = _original_httpx_send(transport, request)
+    content = response.read()
+    cassette.record(request.method, str(request.url), body, response.status_code, response.reason_phrase,
+                    dict(response.headers), content, time.monotonic() - start)
+    return response
+
+
+async def _handle_async_request(transport, request: httpx.Request) -> httpx.Response:
+    cassette = _active_cassette
+    if cassette is None:
+        return await _original_httpx_async_send(transport, request)
+
+    body = await request.aread()
+    if cassette.mode == "replay":
+        try:
+            return _httpx_response(request, cassette.play(request.method, str(request.url), body))
+        except CassetteMiss as e:
+            raise httpx.ConnectError(str(e), request=request) from e
+
+    start = time.monotonic()
+    response = await _original_httpx_async_send(transport, request)
+    content = await response.aread()
+    cassette.record(request.method, str(request.url), body, response.status_code, response.reason_phrase,
+                    dict(response.headers), content, time.monotonic() - start)
+    return response
+
+
+def install_httpx(cassette: Optional[Cassette]):
+    """Route every httpx transport (the OpenAI/LiteLLM clients behind CrewAI) through cassette; None restores"""
+    global _active_cassette
+    _active_cassette = cassette
+    if cassette is None:
+        httpx.HTTPTransport.handle_request = _original_httpx_send
+        httpx.AsyncHTTPTransport.handle_async_request = _original_httpx_async_send
+    else:
+        httpx.HTTPTransport.handle_request = _handle_request
+        httpx.AsyncHTTPTransport.handle_async_request = _handle_async_request
+
+
+_shared_cassette: Optional[Cassette] = None
+_shared_loaded = False
+_shared_lock = threading.Lock()
+
+
+def get_cassette() -> Optional[Cassette]:
+    """
+    Return the process-wide cassette selected by HTTP_CASSETTE_MODE, or None when off
+
+    The first call also hooks httpx, so LLM traffic is covered before any agent runs.
+    """
+    global _shared_cassette, _shared_loaded
+    with _shared_lock:
+        if not _shared_loaded:
+            _shared_loaded = True
+            if config.HTTP_CASSETTE_MODE != "off":
+                _shared_cassette = Cassette(
+                    path=config.HTTP_CASSETTE_PATH,
+                    mode=config.HTTP_CASSETTE_MODE,
+                    replay_latency=config.HTTP_CASSETTE_REPLAY_LATENCY,
+                    match_any_body=config.HTTP_CASSETTE_MATCH_ANY_BODY
+                )
+                install_httpx(_shared_cassette)
+                print(f"📼 HTTP cassette {_shared_cassette.mode}: {_shared_cassette.path}")
+        return _shared_cassette
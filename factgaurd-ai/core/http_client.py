@@ -0,0 +1,257 @@
+"""
+HTTP Client
+One shared, thread-safe requests session for every data-source tool
+Keeps connections alive per host, retries rate limits / server errors with backoff
+and fails fast through a circuit breaker when a known upstream is degraded
+"""
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional, Tuple, Union
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from config import config
+from core.http_cassette import Cassette, CassetteAdapter, CassetteMiss, get_cassette
+from core.circuit_breaker import CircuitBreaker, get_breaker
+from core.deadline import DeadlineExceeded, current_deadline
+from core.rate_limiter import TokenBucket, get_bucket
+
+
+# Responses worth retrying - rate limits and transient server/gateway failures
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+# Longest single wait between attempts (backoff or Retry-After) when no deadline applies
+MAX_RETRY_DELAY = 120.0
+
+Timeout = Union[float, Tuple[float, float]]
+
+
+class HttpClient:
+    """Pooled HTTP client with retries and per-host timeouts"""
+
+    def __init__(
+        self,
+        pool_connections: int,
+        pool_maxsize: int,
+        max_retries: int,
+        backoff_factor: float,
+        connect_timeout: float,
+        read_timeout: float,
+        host_timeouts: Optional[Dict[str, float]] = None,
+        cassette: Optional[Cassette] = None,
+        breakers: Optional[Dict[str, CircuitBreaker]] = None,
+        rate_limits: Optional[Dict[str, TokenBucket]] = None
+    ):
+        """
+        Args:
+            pool_connections: Number of hosts to keep a connection pool for
+            pool_maxsize: Keep-alive connections per host (match the number of concurrent callers)
+            max_retries: Retries on connection errors, timeouts and RETRY_STATUSES responses
+            backoff_factor: Exponential backoff base in seconds (Retry-After is honoured when sent);
+                            a wait that would outlast the request deadline ends the retries
+            connect_timeout: Seconds to establish a connection
+            read_timeout: Default seconds to wait for a response
+            host_timeouts: Read timeout overrides keyed by hostname
+            cassette: Record or replay every exchange through this cassette
+            breakers: Circuit breakers keyed by hostname; other hosts are not guarded
+            rate_limits: Quota buckets keyed by hostname; other hosts are not limited
+        """
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.host_timeouts = dict(host_timeouts or {})
+        self.breakers = dict(breakers or {})
+        self.rate_limits = dict(rate_limits or {})
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+
+        # Retries happen in get(), where every attempt and wait is checked against the deadline
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=0
+        )
+        if cassette is not None:
+            adapter = CassetteAdapter(adapter, cassette)
+
+        self.session = requests.Session()
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def timeout_for(self, url: str) -> Tuple[float, float]:
+        """(connect, read) timeout for the host in url"""
+        host = (urlparse(url).hostname or "").lower()
+        return (self.connect_timeout, self.host_timeouts.get(host, self.read_timeout))
+
+    def get(self, url: str, timeout: Optional[Timeout] = None, **kwargs) -> requests.Response:
+        """
+        GET through the shared pool
+
+        Args:
+            url: Request URL
+            timeout: Explicit timeout; defaults to the host's configured timeout
+            **kwargs: Passed through to requests (params, headers, ...)
+        
+        Raises:
+            DeadlineExceeded: The request deadline has passed (a requests Timeout)
+            RateLimitExceeded: The host's quota has no slot within the allowed wait
+            CircuitOpenError: The host's breaker is open (a requests ConnectionError)
+        """
+        host = (urlparse(url).hostname or "").lower()
+        timeout = timeout or self.timeout_for(url)
+        configured = timeout if isinstance(timeout, tuple) else (timeout, timeout)
+        # Fail fast on a spent deadline or an open circuit before queueing for quota,
+        # so only requests that will actually be sent take a token
+        self._within_deadline(url, configured)
+        breaker = self.breakers.get(host)
+        if breaker is not None:
+            breaker.before_call()
+
+        bucket = self.rate_limits.get(host)
+        try:
+            if bucket is not None:
+                bucket.acquire()
+        except Exception:
+            if breaker is not None:
+                breaker.release()
+            raise
+
+        start = time.monotonic()
+        capped = False
+        attempt = 0
+        while True:
+            try:
+                # Each attempt (after any quota wait or backoff) gets what is left of the deadline
+                timeout = self._within_deadline(url, configured)
+                capped = timeout != configured
+                response = self.session.get(url, timeout=timeout, **kwargs)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                if not isinstance(e, (DeadlineExceeded, CassetteMiss)) and self._wait_for_retry(attempt):
+                    attempt += 1
+                    continue
+                if breaker is not None:
+                    if isinstance(e, DeadlineExceeded) or (isinstance(e, requests.exceptions.Timeout) and capped):
+                        # Cut short by the caller's deadline, not the upstream's configured
+                        # timeout - says nothing about the upstream's health
+                        breaker.release()
+                    else:
+                        breaker.record_failure()
+                raise
+            except Exception:
+                if breaker is not None:
+                    breaker.record_failure()
+                raise
+
+            if response.status_code in RETRY_STATUSES and self._wait_for_retry(
+                attempt, response.headers.get("Retry-After")
+            ):
+                response.close()
+                attempt += 1
+                continue
+            break
+
+        if breaker is None:
+            return response
+        # Retries are exhausted by now, so one rate-limited/5xx response is one failure
+        if response.status_code in RETRY_STATUSES:
+            breaker.record_failure()
+        else:
+            breaker.record_success(time.monotonic() - start)
+        return response
+
+    def _wait_for_retry(self, attempt: int, retry_after: Optional[str] = None) -> bool:
+        """
+        Sleep before the next attempt if one is left and the wait fits the request deadline
+
+        The first retry is immediate, later ones back off exponentially; a Retry-After
+        header lengthens the wait. Returns False (give up now) when no retry is left or
+        the wait would outlast the deadline.
+        """
+        if attempt >= self.max_retries:
+            return False
+        delay = 0.0 if attempt == 0 else self.backoff_factor * (2 ** attempt)
+        requested = parse_retry_after(retry_after)
+        if requested is not None:
+            delay = max(delay, requested)
+        delay = min(delay, MAX_RETRY_DELAY)
+
+        deadline = current_deadline()
+        if deadline is not None and delay >= deadline.remaining():
+            return False
+        if delay > 0:
+            time.sleep(delay)
+        return True
+
+    @staticmethod
+    def _within_deadline(url: str, timeout: Timeout) -> Timeout:
+        """Shorten timeout to the current request's remaining budget"""
+        deadline = current_deadline()
+        if deadline is None:
+            return timeout
+        remaining = deadline.remaining()
+        if remaining <= 0:
+            raise DeadlineExceeded(f"Request deadline exceeded before calling {urlparse(url).hostname}")
+        connect, read = timeout if isinstance(timeout, tuple) else (timeout, timeout)
+        return (min(connect, remaining), min(read, remaining))
+
+    def close(self):
+        """Close every pooled connection"""
+        self.session.close()
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds requested by a Retry-After header (delta-seconds or HTTP date), None if absent/invalid"""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def parse_host_timeouts(spec: str) -> Dict[str, float]:
+    """Parse 'host=seconds,host=seconds' into a mapping"""
+    timeouts = {}
+    for item in spec.split(","):
+        host, _, seconds = item.partition("=")
+        if host.strip() and seconds.strip():
+            timeouts[host.strip().lower()] = float(seconds)
+    return timeouts
+
+
+_shared_client: Optional[HttpClient] = None
+_shared_lock = threading.Lock()
+
+
+def get_http_client() -> HttpClient:
+    """Return the process-wide client, creating it on first use"""
+    global _shared_client
+    with _shared_lock:
+        if _shared_client is None:
+            _shared_client = HttpClient(
+                pool_connections=config.HTTP_POOL_CONNECTIONS,
+                pool_maxsize=config.HTTP_POOL_MAXSIZE,
+                max_retries=config.HTTP_MAX_RETRIES,
+                backoff_factor=config.HTTP_BACKOFF_FACTOR,
+                connect_timeout=config.HTTP_CONNECT_TIMEOUT,
+                read_timeout=config.HTTP_READ_TIMEOUT,
+                host_timeouts=parse_host_timeouts(config.HTTP_HOST_TIMEOUTS),
+                cassette=get_cassette(),
+                breakers={
+                    urlparse(config.ALPHA_VANTAGE_BASE_URL).hostname: get_breaker("alpha_vantage"),
+                    urlparse(config.NEWS_API_BASE_URL).hostname: get_breaker("newsapi"),
+                    urlparse(config.SERP_API_BASE_URL).hostname: get_breaker("serpapi")
+                },
+                rate_limits={
+                    host: bucket for host, bucket in (
+                        (urlparse(config.ALPHA_VANTAGE_BASE_URL).hostname, get_bucket("alpha_vantage")),
+                        (urlparse(config.NEWS_API_BASE_URL).hostname, get_bucket("newsapi")),
+                        (urlparse(config.SERP_API_BASE_URL).hostname, get_bucket("serpapi"))
+                    ) if bucket is not None
+                }
+            )
+        return _shared_client
@@ -2,10 +2,11 @@
 Input Router
 Centralizes input modality routing based on planner decisions
 """
-from typing import Dict, List
+from typing import Dict, List, Optional
 from tools.article_extractor import ArticleExtractorTool
 from tools.image_text_extractor import ImageTextExtractorTool
 from tools.claim_utils import extract_factual_claims
+from core.metrics import INPUT_ROUTE_SECONDS
 from schemas.response_messages import classify_and_respond
 from tools.image_intent_classifier import (
     should_verify_image_content,
@@ -16,9 +17,12 @@ from tools.image_intent_classifier import (
 class InputRouter:
     """Routes input based on planner's decision (does NOT detect type itself)"""
     
-    def __init__(self):
-        """Initialize tools for preprocessing"""
-        self.article_extractor = ArticleExtractorTool()
+    def __init__(self, article_extractor: Optional[ArticleExtractorTool] = None):
+        """
+        Args:
+            article_extractor: URL extractor to use; defaults to a new one with no fetch limits
+        """
+        self.article_extractor = article_extractor or ArticleExtractorTool()
         self.image_text_extractor = ImageTextExtractorTool()
     
     def route(self, input_type: str, content: str) -> Dict[str, any]:
@@ -32,14 +36,16 @@ class InputRouter:
         Returns:
             Dictionary with extracted claims and metadata
         """
-        if input_type == "image":
-            return self._process_image(content)
-        elif input_type == "url":
-            return self._process_url(content)
-        elif input_type == "text":
-            return self._process_text(content)
-        else:
+        handlers = {
+            "image": self._process_image,
+            "url": self._process_url,
+            "text": self._process_text
+        }
+        if input_type not in handlers:
             return {"error": f"Unknown input type: {input_type}"}
+        
+        with INPUT_ROUTE_SECONDS.time(input_type=input_type):
+            return handlers[input_type](content)
     
     def _process_image(self, image_path):
         """Process image input - extract text and verify claims"""
@@ -129,7 +135,8 @@ class InputRouter:
             "title": article_result['title'],
             "claims": claims,
             "metadata": {
-                "word_count": article_result['word_count']
+                "word_count": article_result['word_count'],
+                "canonical_url": article_result['canonical_url']
             }
         }
     
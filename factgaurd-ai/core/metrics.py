@@ -0,0 +1,191 @@
+"""
+Metrics
+In-process latency histograms exposed in the Prometheus text format
+Covers input routing, each verification stage, evidence agents and external tool calls
+"""
+import functools
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, Tuple
+
+
+# Upper bounds in seconds - tool calls land in the low buckets, LLM stages in the high ones
+DEFAULT_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+
+class Histogram:
+    """Cumulative latency histogram with a fixed label set"""
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str],
+                 buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._series: Dict[Tuple[str, ...], dict] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels):
+        """Record one observation (in seconds) for the given label values"""
+        key = self._key(labels)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = {"counts": [0] * len(self.buckets), "sum": 0.0, "count": 0}
+                self._series[key] = series
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series["counts"][i] += 1
+            series["sum"] += value
+            series["count"] += 1
+
+    @contextmanager
+    def time(self, **labels):
+        """Observe the wall time of the enclosed block, even if it raises"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def snapshot(self) -> Dict[Tuple[str, ...], dict]:
+        """Copy of every series, keyed by label values"""
+        with self._lock:
+            return {
+                key: {"counts": list(s["counts"]), "sum": s["sum"], "count": s["count"]}
+                for key, s in self._series.items()
+            }
+
+    def render(self) -> str:
+        """Exposition-format text for this histogram"""
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} histogram"
+        ]
+        for key, series in sorted(self.snapshot().items()):
+            base = list(zip(self.labelnames, key))
+            for bound, count in zip(self.buckets, series["counts"]):
+                lines.append(f"{self.name}_bucket{_labels(base + [('le', _float(bound))])} {count}")
+            lines.append(f"{self.name}_bucket{_labels(base + [('le', '+Inf')])} {series['count']}")
+            lines.append(f"{self.name}_sum{_labels(base)} {_float(series['sum'])}")
+            lines.append(f"{self.name}_count{_labels(base)} {series['count']}")
+        return "\n".join(lines)
+
+    def reset(self):
+        with self._lock:
+            self._series.clear()
+
+    def _key(self, labels: dict) -> Tuple[str, ...]:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+
+class MetricsRegistry:
+    """Holds every histogram the service exports"""
+
+    def __init__(self):
+        self._metrics: Dict[str, Histogram] = {}
+        self._lock = threading.Lock()
+
+    def histogram(self, name: str, documentation: str, labelnames: Iterable[str],
+                  buckets: Tuple[float, ...] = DEFAULT_BUCKETS) -> Histogram:
+        """Register a histogram, or return the existing one with the same name"""
+        with self._lock:
+            if name not in self._metrics:
+                self._metrics[name] = Histogram(name, documentation, labelnames, buckets)
+            return self._metrics[name]
+
+    def render(self) -> str:
+        """Exposition-format text for all registered metrics"""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        return "\n".join(metric.render() for metric in metrics) + "\n"
+
+    def reset(self):
+        """Drop all recorded observations (tests)"""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        for metric in metrics:
+            metric.reset()
+
+
+def _labels(pairs) -> str:
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _float(value: float) -> str:
+    return repr(float(value))
+
+
+# Global registry instance
+registry = MetricsRegistry()
+
+INPUT_ROUTE_SECONDS = registry.histogram(
+    "factguard_input_route_seconds",
+    "Time spent preprocessing an input (OCR, article fetch, claim extraction)",
+    ["input_type"]
+)
+STAGE_SECONDS = registry.histogram(
+    "factguard_verification_stage_seconds",
+    "Time spent in each stage of single-claim verification",
+    ["stage"]
+)
+AGENT_SECONDS = registry.histogram(
+    "factguard_evidence_agent_seconds",
+    "Time an evidence agent crew ran, including its tool loop",
+    ["agent", "status"]
+)
+TOOL_CALL_SECONDS = registry.histogram(
+    "factguard_tool_call_seconds",
+    "Latency of external tool calls (market data, news, search, article fetch, OCR)",
+    ["tool", "method", "outcome"]
+)
+RATE_LIMIT_WAIT_SECONDS = registry.histogram(
+    "factguard_rate_limit_wait_seconds",
+    "Time spent waiting for an upstream rate-limit slot (outcome 'rejected' counts refused calls)",
+    ["bucket", "outcome"]
+)
+
+
+def _is_error(result) -> bool:
+    """Tools report failures as {'error': ...} or [{'error': ...}] instead of raising"""
+    if isinstance(result, dict):
+        return "error" in result
+    if isinstance(result, list) and len(result) == 1 and isinstance(result[0], dict):
+        return "error" in result[0]
+    return False
+
+
+def instrument_tool(tool: str, method: str = None) -> Callable:
+    """
+    Decorator recording a tool method's latency and outcome in TOOL_CALL_SECONDS
+
+    Args:
+        tool: Tool label, e.g. 'alpha_vantage'
+        method: Method label; defaults to the decorated function's name
+    """
+    def decorator(fn: Callable) -> Callable:
+        label = method or fn.__name__
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            outcome = "exception"
+            try:
+                result = fn(*args, **kwargs)
+                outcome = "error" if _is_error(result) else "ok"
+                return result
+            finally:
+                TOOL_CALL_SECONDS.observe(
+                    time.perf_counter() - start, tool=tool, method=label, outcome=outcome
+                )
+        return wrapper
+    return decorator
@@ -0,0 +1,174 @@
+"""
+Pre-Router
+Deterministic fast-path routing for obvious claims - NO LLM
+Only ambiguous claims fall through to the Planner Agent
+"""
+import re
+from typing import List
+from schemas.claim_schema import RoutingDecision
+
+
+# Keyword sets shared with FactVerifier.parse_routing_decision (planner text fallback)
+FINANCE_KEYWORDS = ["stock", "price", "gold", "silver", "forex", "market", "financial"]
+NEWS_KEYWORDS = ["news", "announced", "reported", "article", "publication"]
+TIME_KEYWORDS = ["yesterday", "today", "recent", "latest", "current", "now"]
+
+# Instruments the Finance Agent can actually fetch
+COMMODITIES = {"gold", "silver", "oil", "crude", "brent", "platinum", "copper"}
+CURRENCY_CODES = {"USD", "INR", "EUR", "GBP", "JPY", "CNY", "AUD", "CAD", "CHF", "BTC", "ETH"}
+CURRENCY_NAMES = {"dollar", "dollars", "rupee", "rupees", "euro", "euros", "pound", "sterling",
+                  "yen", "yuan", "bitcoin", "ethereum"}
+KNOWN_TICKERS = {"AAPL", "TSLA", "GOOGL", "MSFT", "AMZN", "META", "NVDA"}
+COMPANY_TICKERS = {"apple": "AAPL", "tesla": "TSLA", "google": "GOOGL", "alphabet": "GOOGL",
+                   "microsoft": "MSFT", "amazon": "AMZN", "nvidia": "NVDA"}
+
+# Words that make an instrument mention a market claim ("gold is up" vs "gold medal")
+MARKET_TERMS = {"stock", "stocks", "share", "shares", "price", "prices", "priced", "market",
+                "markets", "index", "sensex", "nifty", "nasdaq", "dow", "forex", "rate",
+                "rates", "trading", "traded", "valuation", "ounce", "barrel", "per", "worth",
+                "exchange", "financial", "earnings", "revenue", "profit"}
+MOVEMENT_TERMS = {"up", "down", "rose", "rise", "rising", "fell", "fall", "falling", "surged",
+                  "surge", "plunged", "plunge", "jumped", "dropped", "drop", "gained", "gain",
+                  "lost", "rally", "rallied", "crashed", "crash", "high", "low", "record",
+                  "hit", "crossed", "above", "below"}
+
+# Words that indicate an event the News Agent should look for
+NEWS_EVENT_TERMS = {"news", "announced", "announces", "reported", "reports", "said", "says",
+                    "launched", "elected", "resigned", "died", "arrested", "signed", "won",
+                    "confirmed", "declared", "banned", "approved", "killed", "attack", "election",
+                    "minister", "president", "government", "ceo", "court", "article",
+                    "publication", "breaking"}
+
+TIME_TERMS = set(TIME_KEYWORDS) | {"tonight", "currently", "breaking", "live"}
+RELATIVE_PERIOD_PATTERN = re.compile(r'\b(?:this|last|past) (?:week|month|morning|quarter|year)\b')
+
+CASHTAG_PATTERN = re.compile(r'\$([A-Z]{1,5})\b')
+# Percentages and currency amounts ("fell 5%", "hit $200")
+PRICE_FIGURE_PATTERN = re.compile(r'\d\s*%|[$€£₹¥]\s*\d')
+CURRENCY_PAIR_PATTERN = re.compile(r'\b([A-Z]{3})\s*/\s*([A-Z]{3})\b')
+
+
+def pre_route(claim: str) -> RoutingDecision:
+    """
+    Route a claim with keyword rules instead of the Planner LLM
+
+    Args:
+        claim: Clean text claim
+
+    Returns:
+        RoutingDecision whose confidence says whether the rules can be trusted.
+        Callers should fall back to the Planner Agent below their threshold.
+    """
+    words = re.findall(r"[a-z0-9]+", claim.lower())
+    word_set = set(words)
+
+    instruments = _find_instruments(claim, word_set)
+    companies = sorted(word_set & set(COMPANY_TICKERS))
+    market_terms = word_set & MARKET_TERMS
+    market_hits = sorted(market_terms | (word_set & MOVEMENT_TERMS))
+    news_hits = sorted(word_set & NEWS_EVENT_TERMS)
+    time_sensitive = bool(word_set & TIME_TERMS) or bool(RELATIVE_PERIOD_PATTERN.search(claim.lower()))
+
+    is_finance = bool(instruments) and bool(market_hits)
+    required_agents = []
+
+    if is_finance and news_hits:
+        intent, confidence = "mixed", 0.85
+        required_agents = ["finance_agent", "news_agent"]
+    elif is_finance:
+        intent, confidence = "finance", 0.9
+        required_agents = ["finance_agent"]
+    elif market_terms and not instruments and len(market_hits) >= 2:
+        # Generic market talk ("stock market crashed") - no instrument to fetch
+        intent, confidence = "mixed", 0.6
+        required_agents = ["finance_agent", "news_agent"]
+    elif instruments or companies:
+        # "Apple released a new phone" - instrument mentioned but probably not a price claim
+        intent, confidence = "news", 0.5
+        required_agents = ["news_agent"]
+    elif len(news_hits) >= 2:
+        intent, confidence = "news", 0.8
+        required_agents = ["news_agent"]
+    elif news_hits:
+        intent, confidence = "news", 0.65
+        required_agents = ["news_agent"]
+    else:
+        intent, confidence = "general", 0.3
+
+    reasoning_parts = []
+    if instruments:
+        reasoning_parts.append(f"instruments {instruments}")
+    elif companies:
+        reasoning_parts.append(f"companies {companies} without price terms")
+    if market_hits:
+        reasoning_parts.append(f"market terms {market_hits[:5]}")
+    if news_hits:
+        reasoning_parts.append(f"news terms {news_hits[:5]}")
+
+    return RoutingDecision(
+        intent=intent,
+        time_sensitive=time_sensitive,
+        required_agents=required_agents,
+        reasoning="Rule-based fast path: " + ("; ".join(reasoning_parts) or "no routing signals"),
+        confidence=confidence
+    )
+
+
+def find_instruments(claim: str) -> List[str]:
+    """
+    Detect the commodities, tickers and currencies a claim mentions
+
+    Args:
+        claim: Clean text claim
+
+    Returns:
+        Instruments in detection order, e.g. ['gold', 'TSLA', 'USD/INR', 'rupee']
+    """
+    return _find_instruments(claim, set(re.findall(r"[a-z0-9]+", claim.lower())))
+
+
+def _has_price_context(claim: str, word_set: set) -> bool:
+    """Whether the claim talks about prices or markets rather than just movement words"""
+    return bool(word_set & MARKET_TERMS) or bool(PRICE_FIGURE_PATTERN.search(claim))
+
+
+def _moves(claim_lower: str, name: str) -> bool:
+    """Whether a movement word directly follows name ("gold up", "oil is falling")"""
+    movement = "|".join(sorted(MOVEMENT_TERMS))
+    return bool(re.search(rf'\b{name}\s+(?:is\s+|was\s+|has\s+)?(?:{movement})\b', claim_lower))
+
+
+def _find_instruments(claim: str, word_set: set) -> List[str]:
+    """
+    Detect commodities, tickers and currencies mentioned in the claim
+
+    Bare names (companies, commodities, currencies) only count with price or market
+    wording, or when they are what moved ("gold is up"), so "Amazon rainforest fires hit
+    a record high" or "Oil spill hit the coast" mention no instrument.
+    """
+    found = []
+    priced = _has_price_context(claim, word_set)
+    claim_lower = claim.lower()
+
+    found.extend(name for name in sorted(word_set & COMMODITIES) if priced or _moves(claim_lower, name))
+
+    for ticker in CASHTAG_PATTERN.findall(claim):
+        found.append(ticker)
+    for token in re.findall(r'\b[A-Z]{2,5}\b', claim):
+        if token in KNOWN_TICKERS and token not in found:
+            found.append(token)
+    if priced:
+        for name in sorted(word_set & set(COMPANY_TICKERS)):
+            if COMPANY_TICKERS[name] not in found:
+                found.append(COMPANY_TICKERS[name])
+
+    for base, quote in CURRENCY_PAIR_PATTERN.findall(claim):
+        if base in CURRENCY_CODES and quote in CURRENCY_CODES:
+            found.append(f"{base}/{quote}")
+    for token in re.findall(r'\b[A-Z]{3}\b', claim):
+        if token in CURRENCY_CODES and not any(token in f for f in found):
+            found.append(token)
+
+    found.extend(name for name in sorted(word_set & CURRENCY_NAMES) if priced or _moves(claim_lower, name))
+
+    return found
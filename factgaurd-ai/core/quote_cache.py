@@ -0,0 +1,128 @@
+"""
+Quote Cache
+Short-lived cache of market quotes whose TTL follows market hours
+Quotes barely move while a market is closed, so they are kept until it reopens
+"""
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional
+
+try:
+    from zoneinfo import ZoneInfo
+    MARKET_TZ = ZoneInfo("America/New_York")
+except Exception:
+    # No tz database (slim images) - fall back to EST and accept a 1h DST skew
+    MARKET_TZ = timezone(timedelta(hours=-5))
+
+# Regular trading sessions in New York time (exchange holidays are not modelled)
+EQUITY_OPEN = (9, 30)
+EQUITY_CLOSE = (16, 0)
+FOREX_WEEK_START = (6, 17, 0)   # Sunday 17:00
+FOREX_WEEK_END = (4, 17, 0)     # Friday 17:00
+
+
+def market_is_open(market: str, now: Optional[datetime] = None) -> bool:
+    """
+    Whether a market is trading
+
+    Args:
+        market: 'equity' (NYSE/NASDAQ hours) or 'forex' (24h, Sunday 17:00 - Friday 17:00 ET)
+        now: Aware datetime to check (defaults to now)
+    """
+    now = (now or datetime.now(timezone.utc)).astimezone(MARKET_TZ)
+    minutes = now.hour * 60 + now.minute
+
+    if market == "forex":
+        weekday = now.weekday()
+        if weekday == 5:
+            return False
+        if weekday == FOREX_WEEK_START[0]:
+            return minutes >= FOREX_WEEK_START[1] * 60 + FOREX_WEEK_START[2]
+        if weekday == FOREX_WEEK_END[0]:
+            return minutes < FOREX_WEEK_END[1] * 60 + FOREX_WEEK_END[2]
+        return True
+
+    if now.weekday() >= 5:
+        return False
+    return EQUITY_OPEN[0] * 60 + EQUITY_OPEN[1] <= minutes < EQUITY_CLOSE[0] * 60 + EQUITY_CLOSE[1]
+
+
+def seconds_until_open(market: str, now: Optional[datetime] = None) -> float:
+    """Seconds until the market next opens (0 if it is open now)"""
+    now = (now or datetime.now(timezone.utc)).astimezone(MARKET_TZ)
+    if market_is_open(market, now):
+        return 0.0
+
+    if market == "forex":
+        days_ahead = (FOREX_WEEK_START[0] - now.weekday()) % 7
+        opening = (now + timedelta(days=days_ahead)).replace(
+            hour=FOREX_WEEK_START[1], minute=FOREX_WEEK_START[2], second=0, microsecond=0
+        )
+    else:
+        opening = now.replace(hour=EQUITY_OPEN[0], minute=EQUITY_OPEN[1], second=0, microsecond=0)
+        if opening <= now:
+            opening += timedelta(days=1)
+        while opening.weekday() >= 5:
+            opening += timedelta(days=1)
+
+    return max(0.0, (opening - now).total_seconds())
+
+
+class QuoteCache:
+    """Thread-safe TTL cache for upstream quote responses"""
+
+    def __init__(self, open_ttl: float, closed_ttl: float):
+        """
+        Args:
+            open_ttl: Seconds to keep a quote while its market is trading
+            closed_ttl: Upper bound on how long to keep a quote while the market is closed
+        """
+        self.open_ttl = open_ttl
+        self.closed_ttl = closed_ttl
+        self._entries: Dict[tuple, tuple] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def ttl_for(self, market: str, now: Optional[datetime] = None) -> float:
+        """TTL for a quote fetched now - never past the next market open"""
+        if market_is_open(market, now):
+            return self.open_ttl
+        return max(self.open_ttl, min(self.closed_ttl, seconds_until_open(market, now)))
+
+    def get(self, key: tuple) -> Optional[dict]:
+        """Return a fresh cached quote or None"""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= now:
+                self._entries.pop(key, None)
+                self.misses += 1
+                return None
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key: tuple, quote: dict, market: str):
+        """Cache a successful quote for its market's current TTL"""
+        expires_at = time.monotonic() + self.ttl_for(market)
+        with self._lock:
+            # Quotes are few (one per symbol/pair); sweep expired ones on write
+            now = time.monotonic()
+            for stale in [k for k, (exp, _) in self._entries.items() if exp <= now]:
+                del self._entries[stale]
+            self._entries[key] = (expires_at, quote)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, any]:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / total, 3) if total else 0.0
+            }
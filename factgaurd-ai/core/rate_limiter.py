@@ -0,0 +1,213 @@
+"""
+Rate Limiter
+Token buckets per upstream quota, kept in SQLite so every thread and every API worker
+process on the host draws from the same budget. Calls wait for a slot when one frees up
+soon enough and are rejected otherwise.
+"""
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+import requests
+
+from config import config
+from core.deadline import remaining_or
+from core.metrics import RATE_LIMIT_WAIT_SECONDS
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS token_buckets (
+    name TEXT PRIMARY KEY,
+    tokens REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+"""
+
+class RateLimitExceeded(requests.exceptions.RequestException):
+    """No slot in the upstream's budget frees up within the allowed wait"""
+
+
+def parse_rate(spec: str) -> Optional[Tuple[float, float]]:
+    """Parse 'calls/seconds' (e.g. '5/60') into (capacity, period); empty means unlimited"""
+    if not spec or not spec.strip():
+        return None
+    calls, _, seconds = spec.partition("/")
+    return float(calls), float(seconds or 1)
+
+
+class TokenBucket:
+    """One named budget: capacity tokens, refilled evenly over period seconds"""
+
+    def __init__(self, limiter: "RateLimiter", name: str, capacity: float, period: float):
+        self.limiter = limiter
+        self.name = name
+        self.capacity = capacity
+        self.rate = capacity / period
+
+    def acquire(self, cost: float = 1.0, max_wait: Optional[float] = None) -> float:
+        """
+        Take cost tokens, sleeping until they are available
+
+        Args:
+            cost: Tokens this call uses (1 per request, or an estimated token count)
+            max_wait: Longest acceptable wait; defaults to the limiter's, capped by the request deadline
+
+        Returns:
+            Seconds waited
+
+        Raises:
+            RateLimitExceeded: The tokens would not be available within max_wait
+        """
+        max_wait = remaining_or(self.limiter.max_wait if max_wait is None else max_wait)
+        wait = self.limiter.reserve(self, min(cost, self.capacity), max_wait)
+        if wait > 0:
+            time.sleep(wait)
+        RATE_LIMIT_WAIT_SECONDS.observe(wait, bucket=self.name, outcome="acquired")
+        return wait
+
+
+class RateLimiter:
+    """SQLite-backed store of token buckets shared across processes"""
+
+    def __init__(self, path: str, max_wait: float):
+        """
+        Args:
+            path: SQLite file shared by all workers; ':memory:' for a private limiter
+            max_wait: Default longest wait for a slot before a call is rejected
+        """
+        self.path = path
+        self.max_wait = max_wait
+        self.rejected: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        # Autocommit mode so BEGIN IMMEDIATE controls the cross-process write lock
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=5, isolation_level=None)
+        if path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(SCHEMA)
+
+    def bucket(self, name: str, capacity: float, period: float) -> TokenBucket:
+        return TokenBucket(self, name, capacity, period)
+
+    def reserve(self, bucket: TokenBucket, cost: float, max_wait: float) -> float:
+        """
+        Atomically take cost tokens from bucket, going into debt for a wait of up to max_wait
+
+        Callers that go into debt queue behind each other in reservation order, across
+        processes, because each one's wait accounts for the debt of those before it.
+
+        Returns:
+            Seconds the caller must sleep before using its tokens
+        """
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                now = time.time()
+                row = self._conn.execute(
+                    "SELECT tokens, updated_at FROM token_buckets WHERE name = ?", (bucket.name,)
+                ).fetchone()
+                tokens = bucket.capacity if row is None else min(
+                    bucket.capacity, row[0] + (now - row[1]) * bucket.rate
+                )
+                wait = max(0.0, (cost - tokens) / bucket.rate)
+                if wait > max_wait:
+                    self._conn.execute("ROLLBACK")
+                    self.rejected[bucket.name] = self.rejected.get(bucket.name, 0) + 1
+                    RATE_LIMIT_WAIT_SECONDS.observe(0.0, bucket=bucket.name, outcome="rejected")
+                    raise RateLimitExceeded(
+                        f"{bucket.name} rate limit reached (next slot in {wait:.0f}s)"
+                    )
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO token_buckets (name, tokens, updated_at) VALUES (?, ?, ?)",
+                    (bucket.name, tokens - cost, now)
+                )
+                self._conn.execute("COMMIT")
+                return wait
+            except sqlite3.Error:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def stats(self) -> Dict[str, any]:
+        with self._lock:
+            rows = self._conn.execute("SELECT name, tokens, updated_at FROM token_buckets").fetchall()
+        return {
+            "buckets": {name: {"tokens": round(tokens, 2), "updated_at": updated} for name, tokens, updated in rows},
+            "rejected": dict(self.rejected)
+        }
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+# Bucket name -> "calls/seconds" budget from config
+def _configured_rates() -> Dict[str, str]:
+    return {
+        "alpha_vantage": config.RATE_LIMIT_ALPHA_VANTAGE,
+        "newsapi": config.RATE_LIMIT_NEWSAPI,
+        "serpapi": config.RATE_LIMIT_SERPAPI,
+        "llm_requests": config.RATE_LIMIT_LLM_RPM,
+        "llm_tokens": config.RATE_LIMIT_LLM_TPM
+    }
+
+
+_shared_limiter: Optional[RateLimiter] = None
+_buckets: Dict[str, Optional[TokenBucket]] = {}
+_shared_lock = threading.Lock()
+
+
+def get_rate_limiter() -> RateLimiter:
+    """Return the process-wide limiter, opening its store on first use"""
+    global _shared_limiter
+    with _shared_lock:
+        if _shared_limiter is None:
+            _shared_limiter = RateLimiter(path=config.RATE_LIMIT_PATH, max_wait=config.RATE_LIMIT_MAX_WAIT)
+        return _shared_limiter
+
+
+def get_bucket(name: str) -> Optional[TokenBucket]:
+    """Configured bucket for an upstream, or None when it has no budget set"""
+    with _shared_lock:
+        if name in _buckets:
+            return _buckets[name]
+    rate = parse_rate(_configured_rates().get(name, ""))
+    bucket = get_rate_limiter().bucket(name, *rate) if rate else None
+    with _shared_lock:
+        return _buckets.setdefault(name, bucket)
+
+
+def estimate_tokens(messages) -> int:
+    """Rough prompt size for TPM budgeting (~4 characters per token)"""
+    return sum(len(str(m.get("content", "")) if isinstance(m, dict) else str(m)) for m in messages) // 4 + 1
+
+
+def _limit_llm_call(context) -> Optional[bool]:
+    """CrewAI before-LLM-call hook: wait for RPM/TPM budget, or block the call"""
+    try:
+        requests_bucket = get_bucket("llm_requests")
+        if requests_bucket:
+            requests_bucket.acquire(1)
+        tokens_bucket = get_bucket("llm_tokens")
+        if tokens_bucket:
+            tokens_bucket.acquire(estimate_tokens(context.messages))
+    except RateLimitExceeded as e:
+        print(f"⏳ {str(e)} - blocking LLM call")
+        return False
+    return None
+
+
+_llm_hook_installed = False
+
+
+def install_llm_rate_limits():
+    """Register the LLM budget hook with CrewAI once (no-op when no LLM budget is set)"""
+    global _llm_hook_installed
+    if _llm_hook_installed or not (config.RATE_LIMIT_LLM_RPM or config.RATE_LIMIT_LLM_TPM):
+        return
+    from crewai.hooks import register_before_llm_call_hook
+    register_before_llm_call_hook(_limit_llm_call)
+    _llm_hook_installed = True
@@ -0,0 +1,217 @@
+"""
+Search Cache
+SQLite-backed cache of SerpAPI / NewsAPI results that survives restarts
+Keyed on the normalized query plus the request parameters that change the results
+"""
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+from config import config
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS search_cache (
+    key TEXT PRIMARY KEY,
+    endpoint TEXT NOT NULL,
+    query TEXT NOT NULL,
+    response TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    expires_at REAL NOT NULL,
+    last_access REAL NOT NULL,
+    hits INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_search_cache_last_access ON search_cache (last_access);
+CREATE INDEX IF NOT EXISTS idx_search_cache_expires_at ON search_cache (expires_at);
+"""
+
+
+def normalize_query(query: str) -> str:
+    """Fold case and whitespace; punctuation is kept because quotes change search semantics"""
+    return re.sub(r'\s+', ' ', query.lower()).strip()
+
+
+def cacheable_params(params: Dict) -> Dict:
+    """Request parameters minus the query text and credentials"""
+    return {k: v for k, v in params.items() if k not in ("q", "api_key", "apiKey")}
+
+
+def _has_error(results) -> bool:
+    if isinstance(results, dict):
+        return "error" in results
+    if isinstance(results, list):
+        return not results or any(isinstance(r, dict) and "error" in r for r in results)
+    return results is None
+
+
+class SearchCache:
+    """Persistent, size-capped search result cache with per-endpoint TTLs"""
+
+    def __init__(self, path: str, max_entries: int, ttls: Dict[str, float], default_ttl: float = 3600):
+        """
+        Args:
+            path: SQLite file (created if missing); ':memory:' for a private cache
+            max_entries: Rows kept before least-recently-used ones are evicted
+            ttls: Seconds to keep results, keyed by endpoint name
+            default_ttl: TTL for endpoints missing from ttls
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self.ttls = dict(ttls)
+        self.default_ttl = default_ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        # One connection shared by all threads; the lock serializes access
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=5)
+        if path != ":memory:":
+            # Several API workers may share the file
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(SCHEMA)
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(endpoint: str, query: str, params: Optional[Dict] = None) -> str:
+        """Stable key for an endpoint, normalized query and result-shaping parameters"""
+        payload = json.dumps(
+            {"endpoint": endpoint, "query": normalize_query(query), "params": params or {}},
+            sort_keys=True, default=str
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, endpoint: str, query: str, params: Optional[Dict] = None) -> Optional[List[Dict]]:
+        """Return fresh cached results or None"""
+        key = self.make_key(endpoint, query, params)
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response, expires_at FROM search_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or row[1] <= now:
+                if row is not None:
+                    self._conn.execute("DELETE FROM search_cache WHERE key = ?", (key,))
+                    self._conn.commit()
+                self.misses += 1
+                return None
+            self._conn.execute(
+                "UPDATE search_cache SET last_access = ?, hits = hits + 1 WHERE key = ?", (now, key)
+            )
+            self._conn.commit()
+            self.hits += 1
+        return json.loads(row[0])
+
+    def put(self, endpoint: str, query: str, params: Optional[Dict], results: List[Dict]):
+        """Store results for the endpoint's TTL, evicting expired then least-recently-used rows"""
+        key = self.make_key(endpoint, query, params)
+        now = time.time()
+        ttl = self.ttls.get(endpoint, self.default_ttl)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO search_cache "
+                "(key, endpoint, query, response, created_at, expires_at, last_access, hits) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, 0)",
+                (key, endpoint, normalize_query(query), json.dumps(results), now, now + ttl, now)
+            )
+            self._evict(now)
+            self._conn.commit()
+
+    def get_or_fetch(self, endpoint: str, query: str, params: Optional[Dict],
+                     fetch: Callable[[], List[Dict]]) -> List[Dict]:
+        """
+        Serve from cache, otherwise call fetch and cache its results unless they are errors
+
+        Args:
+            endpoint: Endpoint name used for the TTL (e.g. 'serp_google')
+            query: Search query
+            params: Parameters that change the results (num, tbs, dates, language, ...)
+            fetch: Zero-argument callable hitting the upstream API
+        """
+        if self.max_entries <= 0:
+            return fetch()
+
+        # A broken cache must never fail the search itself
+        try:
+            cached = self.get(endpoint, query, params)
+        except (sqlite3.Error, ValueError) as e:
+            print(f"⚠️ Search cache read failed: {str(e)}")
+            cached = None
+        if cached is not None:
+            return cached
+
+        results = fetch()
+        if not _has_error(results):
+            try:
+                self.put(endpoint, query, params, results)
+            except (sqlite3.Error, TypeError, ValueError) as e:
+                print(f"⚠️ Search cache write failed: {str(e)}")
+        return results
+
+    def _evict(self, now: float):
+        expired = self._conn.execute("DELETE FROM search_cache WHERE expires_at <= ?", (now,)).rowcount
+        count = self._conn.execute("SELECT COUNT(*) FROM search_cache").fetchone()[0]
+        overflow = count - self.max_entries
+        evicted = 0
+        if overflow > 0:
+            evicted = self._conn.execute(
+                "DELETE FROM search_cache WHERE key IN "
+                "(SELECT key FROM search_cache ORDER BY last_access ASC LIMIT ?)", (overflow,)
+            ).rowcount
+        self.evictions += max(0, expired) + max(0, evicted)
+
+    def clear(self):
+        """Drop every cached result"""
+        with self._lock:
+            self._conn.execute("DELETE FROM search_cache")
+            self._conn.commit()
+
+    def stats(self) -> Dict[str, any]:
+        """Return size and this process's hit/miss/eviction counts"""
+        with self._lock:
+            size = self._conn.execute("SELECT COUNT(*) FROM search_cache").fetchone()[0]
+            by_endpoint = dict(self._conn.execute(
+                "SELECT endpoint, COUNT(*) FROM search_cache GROUP BY endpoint"
+            ).fetchall())
+            total = self.hits + self.misses
+            return {
+                "size": size,
+                "max_entries": self.max_entries,
+                "by_endpoint": by_endpoint,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / total, 3) if total else 0.0
+            }
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+_shared_cache: Optional[SearchCache] = None
+_shared_lock = threading.Lock()
+
+
+def get_search_cache() -> SearchCache:
+    """Return the process-wide search cache, opening it on first use"""
+    global _shared_cache
+    with _shared_lock:
+        if _shared_cache is None:
+            _shared_cache = SearchCache(
+                path=config.SEARCH_CACHE_PATH,
+                max_entries=config.SEARCH_CACHE_MAX_ENTRIES,
+                ttls={
+                    "serp_google": config.SEARCH_CACHE_TTL_WEB,
+                    "serp_news": config.SEARCH_CACHE_TTL_NEWS,
+                    "newsapi": config.SEARCH_CACHE_TTL_NEWS
+                }
+            )
+        return _shared_cache
@@ -0,0 +1,63 @@
+"""
+Single Flight
+Coalesces concurrent calls for the same key into one upstream request
+"""
+import threading
+from concurrent.futures import Future
+from typing import Callable, Dict, Hashable
+
+
+class SingleFlight:
+    """Run at most one call per key at a time; concurrent callers share its result"""
+
+    def __init__(self):
+        self._calls: Dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+        self.leaders = 0
+        self.shared = 0
+
+    def do(self, key: Hashable, fn: Callable[[], any]) -> any:
+        """
+        Call fn, or wait for the in-flight call with the same key
+
+        Args:
+            key: Identity of the request (e.g. ('quote', 'TSLA'))
+            fn: Zero-argument callable doing the real work
+
+        Returns:
+            fn's result - the same object for every caller that shared the flight
+
+        Raises:
+            Whatever fn raised, re-raised in every waiting caller
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            if future is not None:
+                self.shared += 1
+                leader = False
+            else:
+                future = Future()
+                self._calls[key] = future
+                self.leaders += 1
+                leader = True
+
+        if not leader:
+            return future.result()
+
+        try:
+            result = fn()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            # Later callers start a fresh flight instead of reusing this result
+            with self._lock:
+                self._calls.pop(key, None)
+
+    def stats(self) -> Dict[str, int]:
+        """Return how many calls went upstream vs. joined an in-flight call"""
+        with self._lock:
+            return {"in_flight": len(self._calls), "leaders": self.leaders, "shared": self.shared}
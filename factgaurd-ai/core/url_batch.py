@@ -0,0 +1,236 @@
+"""
+URL Batch
+Ingests a list of article URLs: fetches and extracts them concurrently (global cap plus
+per-domain politeness in the extractor), then verifies each article's claims on a
+separate, smaller pool. Results are reported per URL as soon as each one finishes.
+"""
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List
+
+from config import config
+from core.deadline import deadline_scope
+from core.domain_politeness import DomainPoliteness
+from core.input_router import InputRouter
+from core.url_canonicalizer import normalize_url
+
+
+class BatchRejected(Exception):
+    """Raised when the maximum number of URL batches is already running"""
+    pass
+
+
+def interleave_by_domain(urls: List[str]) -> List[str]:
+    """
+    Reorder urls round-robin across domains
+
+    Consecutive fetches then go to different publishers, so workers are not all parked
+    on one domain's politeness limit while other domains wait in the queue.
+    """
+    by_domain: Dict[str, deque] = OrderedDict()
+    for url in urls:
+        by_domain.setdefault(DomainPoliteness.domain_of(url), deque()).append(url)
+    ordered = []
+    while by_domain:
+        for domain in list(by_domain):
+            ordered.append(by_domain[domain].popleft())
+            if not by_domain[domain]:
+                del by_domain[domain]
+    return ordered
+
+
+class UrlBatch:
+    """One submitted batch: progress counters and its event callback"""
+
+    def __init__(self, runner: "UrlBatchRunner", pending: int, verify: bool,
+                 on_event: Callable[[str, Dict], None]):
+        self.runner = runner
+        self.unique = pending
+        self.pending = pending
+        self.verify = verify
+        self.on_event = on_event
+        self.succeeded = 0
+        self.failed = 0
+        self.cancelled = False
+        self.started = time.monotonic()
+        self._lock = threading.Lock()
+
+    def cancel(self):
+        """Skip URLs and claims that have not started yet (e.g. the client went away)"""
+        self.cancelled = True
+
+    def emit(self, event: str, data: Dict):
+        try:
+            self.on_event(event, data)
+        except Exception as e:
+            print(f"⚠️ URL batch event handler failed: {str(e)}")
+
+    def finish_url(self, result: Dict):
+        """Report one URL's final result; the last one also reports the batch summary"""
+        self.emit("result", result)
+        with self._lock:
+            if "error" in result:
+                self.failed += 1
+            else:
+                self.succeeded += 1
+            self.pending -= 1
+            done = self.pending == 0
+        if done:
+            self.emit("done", {
+                "succeeded": self.succeeded,
+                "failed": self.failed,
+                "cancelled": self.cancelled,
+                "elapsed": round(time.monotonic() - self.started, 3)
+            })
+            self.runner._release()
+
+
+class _UrlClaims:
+    """Collects the verification results of one URL's claims as they complete"""
+
+    def __init__(self, batch: UrlBatch, result: Dict):
+        self.batch = batch
+        self.result = result
+        self.pending = len(result["claims"])
+        self._lock = threading.Lock()
+
+    def claim_done(self, index: int, outcome: Dict):
+        with self._lock:
+            self.result["claims"][index] = outcome
+            self.pending -= 1
+            done = self.pending == 0
+        if done:
+            self.batch.finish_url(self.result)
+
+
+class UrlBatchRunner:
+    """Shared fetch and verify pools serving every URL batch in this process"""
+
+    def __init__(
+        self,
+        verify: Callable[[str], Dict],
+        router: InputRouter,
+        fetch_concurrency: int,
+        verify_concurrency: int,
+        max_active: int
+    ):
+        """
+        Args:
+            verify: Verifies one claim, returning {"result": str, "verdict": VerdictResult | None}
+            router: Input router whose URL handler fetches articles and extracts claims
+            fetch_concurrency: Article fetches running at once across all batches
+            verify_concurrency: Claim verifications running at once across all batches
+            max_active: Batches allowed to run at the same time
+        """
+        self.verify = verify
+        self.router = router
+        self.max_active = max_active
+        self._fetch_pool = ThreadPoolExecutor(max_workers=fetch_concurrency, thread_name_prefix="url-fetch")
+        self._verify_pool = ThreadPoolExecutor(max_workers=verify_concurrency, thread_name_prefix="url-verify")
+        self._lock = threading.Lock()
+        self.active = 0
+        self.batches = 0
+        self.rejected = 0
+
+    def start(self, urls: List[str], on_event: Callable[[str, Dict], None], verify: bool = True) -> UrlBatch:
+        """
+        Admit and schedule a batch without waiting for it
+
+        Duplicate spellings of one article (tracking parameters, AMP/mobile variants, ...)
+        are fetched once and reported together. on_event is called from worker threads
+        with 'article' (claims extracted), 'result' (one per unique URL) and finally 'done'.
+
+        Raises:
+            BatchRejected: max_active batches are already running
+        """
+        groups: Dict[str, List[str]] = OrderedDict()
+        for url in urls:
+            groups.setdefault(normalize_url(url), []).append(url)
+
+        with self._lock:
+            if self.active >= self.max_active:
+                self.rejected += 1
+                raise BatchRejected(f"{self.active} URL batches already running; retry later")
+            self.active += 1
+            self.batches += 1
+
+        batch = UrlBatch(self, len(groups), verify, on_event)
+        if not groups:
+            batch.emit("done", {"succeeded": 0, "failed": 0, "cancelled": False, "elapsed": 0.0})
+            self._release()
+            return batch
+
+        first_urls = {variants[0]: variants for variants in groups.values()}
+        for url in interleave_by_domain(list(first_urls)):
+            self._fetch_pool.submit(self._process_url, batch, first_urls[url])
+        return batch
+
+    def _process_url(self, batch: UrlBatch, urls: List[str]):
+        url = urls[0]
+        if batch.cancelled:
+            batch.finish_url({"url": url, "urls": urls, "error": "Batch cancelled"})
+            return
+        try:
+            # Each article gets the per-request budget from when its fetch starts
+            with deadline_scope(config.REQUEST_DEADLINE):
+                routed = self.router.route("url", url)
+        except Exception as e:
+            print(f"⚠️ URL batch fetch failed for {url}: {str(e)}")
+            routed = {"error": str(e)}
+
+        if "error" in routed:
+            batch.finish_url({"url": url, "urls": urls, "error": routed["error"]})
+            return
+
+        result = {
+            "url": url,
+            "urls": urls,
+            "canonical_url": routed["metadata"].get("canonical_url"),
+            "title": routed.get("title"),
+            "claims": [{"claim": claim} for claim in routed["claims"]]
+        }
+        batch.emit("article", {
+            "url": url,
+            "canonical_url": result["canonical_url"],
+            "title": result["title"],
+            "claims": list(routed["claims"])
+        })
+        if not batch.verify or not routed["claims"]:
+            batch.finish_url(result)
+            return
+
+        collector = _UrlClaims(batch, result)
+        for index, claim in enumerate(routed["claims"]):
+            self._verify_pool.submit(self._verify_claim, batch, collector, index, claim)
+
+    def _verify_claim(self, batch: UrlBatch, collector: _UrlClaims, index: int, claim: str):
+        if batch.cancelled:
+            collector.claim_done(index, {"claim": claim, "error": "Batch cancelled"})
+            return
+        try:
+            with deadline_scope(config.REQUEST_DEADLINE):
+                outcome = self.verify(claim)
+            verdict = outcome.get("verdict")
+            collector.claim_done(index, {
+                "claim": claim,
+                "result": outcome.get("result"),
+                "verdict": verdict.model_dump() if verdict is not None else None
+            })
+        except Exception as e:
+            print(f"⚠️ URL batch verification failed for claim '{claim[:60]}': {str(e)}")
+            collector.claim_done(index, {"claim": claim, "error": str(e)})
+
+    def _release(self):
+        with self._lock:
+            self.active -= 1
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "active": self.active,
+                "max_active": self.max_active,
+                "batches": self.batches,
+                "rejected": self.rejected
+            }
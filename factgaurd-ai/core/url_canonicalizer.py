@@ -0,0 +1,242 @@
+"""
+URL Canonicalizer
+Maps the many spellings of one article URL (tracking parameters, mobile/AMP variants,
+trailing slashes, link shorteners) onto a single key for caching and deduplication
+"""
+import re
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Union
+from urllib.parse import parse_qsl, urlencode, urljoin, urlsplit, urlunsplit
+
+import requests
+
+from config import config
+from core.http_client import HttpClient, get_http_client
+
+
+# Query parameters that only identify the campaign, click or sharer
+TRACKING_PARAMS = frozenset([
+    'fbclid', 'gclid', 'dclid', 'gbraid', 'wbraid', 'msclkid', 'yclid', 'twclid', 'ttclid',
+    'igshid', 'mc_cid', 'mc_eid', '_ga', '_gl', '_hsenc', '_hsmi', 'mkt_tok', 'ref_src',
+    'ref_url', 'cmpid', 'ocid', 'smid', 'sr_share', 's_cid', 'ncid', 'spm'
+])
+TRACKING_PREFIXES = ('utm_',)
+# Query parameters that select an AMP rendering of the same article
+AMP_PARAMS = frozenset(['amp', '_amp', 'outputtype'])
+
+# Host labels for mobile/AMP/www variants of the main site
+VARIANT_HOST_LABELS = ('www', 'm', 'mobile', 'amp')
+
+SHORTENER_HOSTS = frozenset([
+    'bit.ly', 'bitly.com', 't.co', 'tinyurl.com', 'goo.gl', 'ow.ly', 'buff.ly', 'lnkd.in',
+    'dlvr.it', 'trib.al', 'fb.me', 'is.gd', 'rebrand.ly', 'cutt.ly', 't.ly', 'rb.gy',
+    'tiny.cc', 'shorturl.at', 'flip.it', 'wp.me', 'reut.rs', 'nyti.ms', 'bloom.bg',
+    'cnn.it', 'bbc.in', 'wapo.st', 'econ.st', 'hubs.ly', 'shorturl.me'
+])
+
+CANONICAL_LINK = re.compile(r'<link\b[^>]*\brel\s*=\s*["\']?canonical\b[^>]*>', re.IGNORECASE)
+HREF = re.compile(r'\bhref\s*=\s*(?:"([^"]*)"|\'([^\']*)\'|([^\s>]+))', re.IGNORECASE)
+HEAD_END = re.compile(r'</head\s*>', re.IGNORECASE)
+
+
+def normalize_host(host: str) -> str:
+    """Lower-case host without its www/m/mobile/amp label"""
+    host = host.lower().rstrip('.')
+    labels = host.split('.')
+    while len(labels) > 2 and labels[0] in VARIANT_HOST_LABELS:
+        labels.pop(0)
+    return '.'.join(labels)
+
+
+def _normalize_path(path: str) -> str:
+    path = re.sub(r'/{2,}', '/', path or '/')
+    # AMP renderings: /amp/... prefix, .../amp suffix, story.amp(.html)
+    path = re.sub(r'^/amp(?=/)', '', path, flags=re.IGNORECASE)
+    path = re.sub(r'/amp/?$', '/', path, flags=re.IGNORECASE)
+    path = re.sub(r'\.amp(?=\.html?$|$)', '', path, flags=re.IGNORECASE)
+    if len(path) > 1:
+        path = path.rstrip('/')
+    return path or '/'
+
+
+def _keep_param(name: str, value: str) -> bool:
+    lowered = name.lower()
+    if lowered in TRACKING_PARAMS or lowered.startswith(TRACKING_PREFIXES):
+        return False
+    if lowered in AMP_PARAMS and (lowered != 'outputtype' or value.lower() == 'amp'):
+        return False
+    return True
+
+
+def normalize_url(url: str) -> str:
+    """
+    Canonical form of a URL without any network access
+
+    Lower-cases scheme and host, drops www/mobile/AMP host labels, default ports,
+    fragments, tracking and AMP query parameters, AMP path variants and trailing
+    slashes, and sorts the remaining query parameters.
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = normalize_host(parts.hostname or '')
+    port = parts.port
+    if port and not (scheme == 'http' and port == 80) and not (scheme == 'https' and port == 443):
+        host = f"{host}:{port}"
+
+    params = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if _keep_param(k, v)]
+    query = urlencode(sorted(params))
+    return urlunsplit((scheme, host, _normalize_path(parts.path), query, ''))
+
+
+def is_amp_or_mobile(url: str) -> bool:
+    """Whether url is recognizably an AMP or mobile rendering (host label, /amp path or AMP query)"""
+    parts = urlsplit(url)
+    labels = (parts.hostname or '').lower().split('.')
+    while len(labels) > 2 and labels[0] in VARIANT_HOST_LABELS:
+        if labels.pop(0) != 'www':
+            return True
+    if re.search(r'(?:^|/)amp(?:/|$)|\.amp(?:\.html?)?$', parts.path, re.IGNORECASE):
+        return True
+    return any(k.lower() in AMP_PARAMS and (k.lower() != 'outputtype' or v.lower() == 'amp')
+               for k, v in parse_qsl(parts.query, keep_blank_values=True))
+
+
+def same_site(a: str, b: str) -> bool:
+    """Whether two URLs are on the same site once www/mobile/AMP labels are ignored"""
+    return normalize_host(urlsplit(a).hostname or '') == normalize_host(urlsplit(b).hostname or '')
+
+
+def find_canonical_link(html: Union[str, bytes], base_url: str) -> Optional[str]:
+    """Absolute href of the page's <link rel="canonical">, if it declares one in <head>"""
+    if isinstance(html, bytes):
+        html = html.decode('utf-8', errors='replace')
+    head_end = HEAD_END.search(html)
+    head = html[:head_end.start()] if head_end else html
+    tag = CANONICAL_LINK.search(head)
+    if not tag:
+        return None
+    href = HREF.search(tag.group(0))
+    if not href:
+        return None
+    link = urljoin(base_url, next(g for g in href.groups() if g is not None).strip())
+    return link if urlsplit(link).scheme in ('http', 'https') else None
+
+
+class UrlCanonicalizer:
+    """Canonical cache keys for article URLs, with memoized shortener resolution"""
+
+    def __init__(
+        self,
+        http_client: Optional[HttpClient] = None,
+        max_entries: int = 10000,
+        resolve_shorteners: bool = True
+    ):
+        """
+        Args:
+            http_client: Client used to follow shortener redirects; defaults to the shared one
+            max_entries: Resolved short links and learned aliases kept (LRU)
+            resolve_shorteners: Follow redirects of known link shorteners
+        """
+        self.http = http_client or get_http_client()
+        self.max_entries = max_entries
+        self.resolve_shorteners = resolve_shorteners
+        # Short link -> final URL, and normalized URL -> the page's declared canonical key
+        self._resolved: OrderedDict = OrderedDict()
+        self._aliases: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self.resolutions = 0
+        self.resolution_hits = 0
+
+    def resolve(self, url: str) -> str:
+        """
+        URL to fetch for url: the redirect target of a known shortener, otherwise url itself
+
+        Resolutions are memoized per short link; failures fall back to the short link.
+        """
+        host = (urlsplit(url).hostname or '').lower()
+        if not self.resolve_shorteners or host not in SHORTENER_HOSTS:
+            return url
+
+        key = normalize_url(url)
+        with self._lock:
+            if key in self._resolved:
+                self._resolved.move_to_end(key)
+                self.resolution_hits += 1
+                return self._resolved[key]
+
+        try:
+            # GET rather than HEAD (several shorteners reject HEAD); only headers are read
+            response = self.http.get(url, stream=True, allow_redirects=True)
+            response.close()
+        except requests.exceptions.RequestException as e:
+            print(f"⚠️ Could not resolve short link {url}: {str(e)}")
+            return url
+        target = response.url or url
+
+        with self._lock:
+            self.resolutions += 1
+            self._remember(self._resolved, key, target)
+        return target
+
+    def canonical_key(self, url: str) -> str:
+        """Cache key for an (already resolved) URL, following learned AMP/canonical aliases"""
+        key = normalize_url(url)
+        with self._lock:
+            if key in self._aliases:
+                self._aliases.move_to_end(key)
+                return self._aliases[key]
+        return key
+
+    def learn_canonical(self, url: str, html: Union[str, bytes]) -> Optional[str]:
+        """
+        Record the page's <link rel="canonical"> as the key for url
+
+        Only AMP/mobile renderings pointing at the same site are followed; on shared hosts
+        (user pages, blogs) an ordinary page could otherwise claim another article's key.
+
+        Returns:
+            The canonical key when it differs from url's own, else None
+        """
+        if not is_amp_or_mobile(url):
+            return None
+        link = find_canonical_link(html, url)
+        if not link or not same_site(url, link):
+            return None
+        key, canonical = normalize_url(url), normalize_url(link)
+        if canonical == key:
+            return None
+        with self._lock:
+            self._remember(self._aliases, key, canonical)
+        return canonical
+
+    def _remember(self, entries: OrderedDict, key: str, value: str):
+        entries[key] = value
+        entries.move_to_end(key)
+        while len(entries) > self.max_entries:
+            entries.popitem(last=False)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "resolved_links": len(self._resolved),
+                "aliases": len(self._aliases),
+                "resolutions": self.resolutions,
+                "resolution_hits": self.resolution_hits
+            }
+
+
+_shared_canonicalizer: Optional[UrlCanonicalizer] = None
+_shared_lock = threading.Lock()
+
+
+def get_url_canonicalizer() -> UrlCanonicalizer:
+    """Return the process-wide canonicalizer"""
+    global _shared_canonicalizer
+    with _shared_lock:
+        if _shared_canonicalizer is None:
+            _shared_canonicalizer = UrlCanonicalizer(
+                max_entries=config.URL_CANONICAL_CACHE_SIZE,
+                resolve_shorteners=config.URL_RESOLVE_SHORTENERS
+            )
+        return _shared_canonicalizer
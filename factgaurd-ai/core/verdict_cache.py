@@ -0,0 +1,173 @@
+"""
+Verdict Cache
+In-memory LRU cache of final verdicts keyed on normalized claims (or canonical URLs
+for pasted article links). TTL depends on how quickly the underlying facts can change
+"""
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Optional
+from core.url_canonicalizer import normalize_url
+from schemas.claim_schema import RoutingDecision
+
+# A claim that is nothing but a link (the article is fetched and verified instead)
+_URL_INPUT = re.compile(r'(?:https?://|www\.)\S+', re.IGNORECASE)
+
+# Punctuation is dropped except what changes a number's meaning: decimal points/thousands
+# separators between digits, percent signs after them, currency symbols and minus signs
+# before them - so "3.5%" vs "35%", "$2,000" vs "₹2,000" and "-3%" vs "3%" stay distinct keys
+_PUNCTUATION = re.compile(r'(\d[.,](?=\d)|\d%|[$€£₹¥](?=\s*\d)|(?<!\w)-(?=\d))|[^\w\s]')
+
+
+def normalize_claim(claim: str) -> str:
+    """
+    Fold case, punctuation and whitespace so trivially different claims share a key
+
+    Args:
+        claim: Raw claim text
+
+    Returns:
+        Normalized cache key
+    """
+    text = claim.lower()
+    text = _PUNCTUATION.sub(lambda m: m.group(1) or '', text)
+    text = re.sub(r'\s+', ' ', text)
+    return text.strip()
+
+
+class VerdictCache:
+    """Thread-safe, size-bounded LRU cache with a per-entry TTL"""
+
+    def __init__(
+        self,
+        max_size: int,
+        finance_ttl: float,
+        news_ttl: float,
+        general_ttl: float,
+        time_sensitive_ttl: float,
+        url_key: Optional[Callable[[str], str]] = None
+    ):
+        """
+        Args:
+            max_size: Maximum number of cached verdicts before LRU eviction
+            finance_ttl: Seconds to keep finance/mixed verdicts
+            news_ttl: Seconds to keep news/events verdicts
+            general_ttl: Seconds to keep general verdicts
+            time_sensitive_ttl: Upper bound on TTL for time-sensitive claims
+            url_key: Cache key for URL inputs; defaults to normalize_url (e.g. pass
+                     UrlCanonicalizer.canonical_key to follow learned AMP aliases)
+        """
+        self.max_size = max_size
+        self.finance_ttl = finance_ttl
+        self.news_ttl = news_ttl
+        self.general_ttl = general_ttl
+        self.time_sensitive_ttl = time_sensitive_ttl
+        self.url_key = url_key or normalize_url
+
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def ttl_for(self, routing: RoutingDecision) -> float:
+        """
+        Pick a TTL from the routing decision
+
+        Args:
+            routing: Routing decision for the claim
+
+        Returns:
+            Seconds the verdict stays valid
+        """
+        if routing.intent in ("finance", "mixed"):
+            ttl = self.finance_ttl
+        elif routing.intent in ("news", "events"):
+            ttl = self.news_ttl
+        else:
+            ttl = self.general_ttl
+
+        if routing.time_sensitive:
+            ttl = min(ttl, self.time_sensitive_ttl)
+
+        return ttl
+
+    def key_for(self, claim: str) -> str:
+        """Cache key: the canonical URL for a pasted link, else the normalized claim"""
+        text = claim.strip()
+        if _URL_INPUT.fullmatch(text):
+            if not re.match(r'https?://', text, re.IGNORECASE):
+                text = f"https://{text}"
+            return "url:" + self.url_key(text)
+        return normalize_claim(claim)
+
+    def get(self, claim: str) -> Optional[any]:
+        """
+        Look up a cached verdict
+
+        Args:
+            claim: Claim text (normalized internally)
+
+        Returns:
+            Cached verification outcome, or None on miss/expiry
+        """
+        key = self.key_for(claim)
+        now = time.monotonic()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            result, expires_at = entry
+            if now >= expires_at:
+                del self._entries[key]
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return result
+
+    def put(self, claim: str, result: any, routing: RoutingDecision):
+        """
+        Store a verdict
+
+        Args:
+            claim: Claim text (normalized internally)
+            result: Verification outcome (display text and structured verdict)
+            routing: Routing decision used to derive the TTL
+        """
+        if self.max_size <= 0:
+            return
+
+        key = self.key_for(claim)
+        expires_at = time.monotonic() + self.ttl_for(routing)
+
+        with self._lock:
+            self._entries[key] = (result, expires_at)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        """Drop all cached verdicts (counters are kept)"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, any]:
+        """Return cache size and hit/miss counters"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0
+            }
@@ -0,0 +1,180 @@
+"""
+Verification Pipeline
+Prebuilt planner, evidence and consensus crews that are reused across claims
+Only the claim/evidence variables are bound per request via kickoff(inputs=...)
+"""
+from crewai import Crew, Task, Process
+from agents.planner_agent import create_planner_agent
+from agents.finance_agent import create_finance_agent
+from agents.news_agent import create_news_agent
+from agents.consensus_agent import create_consensus_agent
+from core.circuit_breaker import get_breaker
+
+
+# Task templates - {placeholders} are filled by CrewAI at kickoff, JSON braces are left alone
+PLANNING_TEMPLATE = """Analyze this claim and determine the verification strategy:
+
+            Claim: "{claim}"
+
+            You must output a JSON object with these fields:
+            - intent: One of 'finance', 'news', 'events', 'mixed', or 'general'
+            - time_sensitive: true or false
+            - required_agents: List of agents to call (e.g., ['finance_agent', 'news_agent'])
+            - reasoning: Brief explanation
+
+            Example output:
+            {
+                "intent": "finance",
+                "time_sensitive": true,
+                "required_agents": ["finance_agent", "news_agent"],
+                "reasoning": "Claim involves recent financial data requiring both market data and news verification"
+            }
+            """
+
+FINANCE_TEMPLATE = """Verify this financial claim using market data:
+
+                Claim: "{claim}"
+
+                Market data already fetched for this claim:
+                {prefetched_evidence}
+
+                Reason over the data above first. Only use the Financial Data Fetcher tool
+                if it is missing, failed, or does not cover the claim.
+                Return your findings as structured evidence with source information.
+                """
+
+NEWS_TEMPLATE = """Verify this claim using news sources and search:
+
+                Claim: "{claim}"
+
+                Search results already fetched for this claim:
+                {prefetched_evidence}
+
+                Reason over the results above first. Only use the Evidence Sweep tool (news,
+                Google, Google News and fact-checks in one call) if they miss the claim.
+                Prioritize trusted sources. Return findings with source credibility.
+                """
+
+CONSENSUS_TEMPLATE = """Synthesize all evidence and produce final verdict:
+
+            Original Claim: "{claim}"
+
+            Routing Decision: {routing_reasoning}
+
+            Evidence Collected:
+            {evidence_summary}
+
+            Your task:
+            1. Review all evidence
+            2. Check for contradictions
+            3. Assess source credibility
+            4. Calculate confidence score (0.0 to 1.0)
+            5. Apply verdict rules:
+               - confidence >= 0.8 → VERIFIED (if supports claim) or CONTRADICTED (if refutes claim)
+               - 0.5 ≤ confidence < 0.8 → PARTIALLY TRUE
+               - confidence < 0.5 → UNVERIFIABLE
+
+            Respond with ONLY a JSON object (no prose, no markdown) in this shape:
+            {
+                "verdict": "VERIFIED | CONTRADICTED | PARTIALLY TRUE | UNVERIFIABLE",
+                "confidence": 0.0,
+                "summary": "Summary of findings",
+                "evidence": [
+                    {"source_name": "Reuters", "source_type": "News", "content": "What the source says", "url": null, "date": null, "credibility": "High"}
+                ],
+                "contradictions": ["Any contradictions found"],
+                "notes": "Additional notes"
+            }
+            {format_feedback}
+            """
+
+
+def _single_task_crew(agent, description: str, expected_output: str) -> Crew:
+    """Build a one-agent, one-task sequential crew"""
+    task = Task(
+        description=description,
+        agent=agent,
+        expected_output=expected_output
+    )
+    return Crew(
+        agents=[agent],
+        tasks=[task],
+        process=Process.sequential,
+        verbose=False
+    )
+
+
+class VerificationPipeline:
+    """
+    Agents and crews for one worker thread.
+
+    Crew kickoffs are not reentrant, so a pipeline must only be driven by one
+    thread at a time (FactVerifier keeps one per thread).
+    """
+
+    def __init__(self):
+        """Create agents and build every crew once"""
+        self.planner = create_planner_agent()
+        self.finance_agent = create_finance_agent()
+        self.news_agent = create_news_agent()
+        self.consensus_agent = create_consensus_agent()
+        # Shared across threads: every kickoff is a run of LLM calls against one endpoint
+        self.llm_breaker = get_breaker("llm")
+
+        self.planning_crew = _single_task_crew(
+            self.planner, PLANNING_TEMPLATE, "JSON object with routing decision"
+        )
+        self.evidence_crews = {
+            "finance_agent": _single_task_crew(
+                self.finance_agent, FINANCE_TEMPLATE, "Financial evidence with source and data points"
+            ),
+            "news_agent": _single_task_crew(
+                self.news_agent, NEWS_TEMPLATE, "News evidence with source credibility and dates"
+            ),
+        }
+        self.consensus_crew = _single_task_crew(
+            self.consensus_agent, CONSENSUS_TEMPLATE,
+            "JSON verdict object with verdict, confidence, summary and evidence"
+        )
+
+    def plan(self, claim: str) -> str:
+        """Run the planner crew and return its raw output"""
+        return self._kickoff(self.planning_crew, {"claim": claim})
+
+    def gather_evidence(self, agent_name: str, claim: str, prefetched_evidence: str = "") -> str:
+        """
+        Run one evidence agent's crew and return its raw output
+
+        Args:
+            prefetched_evidence: Tool output fetched directly for the claim, so the
+                                 agent can skip its own tool calls
+        """
+        return self._kickoff(self.evidence_crews[agent_name], {
+            "claim": claim,
+            "prefetched_evidence": prefetched_evidence or "None - fetch it with your tool."
+        })
+
+    def build_consensus(
+        self,
+        claim: str,
+        routing_reasoning: str,
+        evidence_summary: str,
+        format_feedback: str = ""
+    ) -> str:
+        """
+        Run the consensus crew and return its raw output
+
+        Args:
+            format_feedback: Correction appended to the prompt when a previous
+                             answer failed VerdictResult validation
+        """
+        return self._kickoff(self.consensus_crew, {
+            "claim": claim,
+            "routing_reasoning": routing_reasoning,
+            "evidence_summary": evidence_summary,
+            "format_feedback": format_feedback
+        })
+
+    def _kickoff(self, crew: Crew, inputs: dict) -> str:
+        """Kick off a crew through the LLM breaker (raises CircuitOpenError while it is open)"""
+        return str(self.llm_breaker.call(crew.kickoff, inputs=inputs))
@@ -5,25 +5,93 @@ This module coordinates all agents using CrewAI to verify factual claims.
 NOW ONLY VERIFIES CLAIMS - input routing handled by input_router.py
 """
 
-from crewai import Crew, Task, Process
-from agents.planner_agent import create_planner_agent
-from agents.finance_agent import create_finance_agent
-from agents.news_agent import create_news_agent
-from agents.consensus_agent import create_consensus_agent
 from schemas.claim_schema import ClaimInput, RoutingDecision
-from schemas.verdict_schema import VerdictResult, format_verdict_for_display
+from schemas.verdict_schema import VerdictResult, format_verdict_for_display, parse_verdict_json
+from core.evidence_collector import EvidenceCollector
+from core.evidence_packer import EvidencePacker
+from core.evidence_prefetch import EvidencePrefetcher
+from core.verification_pipeline import VerificationPipeline
+from core.url_canonicalizer import get_url_canonicalizer
+from core.verdict_cache import VerdictCache
+from core.pre_router import pre_route, FINANCE_KEYWORDS, NEWS_KEYWORDS, TIME_KEYWORDS
+from core.metrics import STAGE_SECONDS, AGENT_SECONDS
+from core.http_cassette import get_cassette
+from core.circuit_breaker import open_upstreams
+from core.deadline import current_deadline, in_context, remaining_or
+from core.rate_limiter import install_llm_rate_limits
+from agents.finance_agent import lookup_financial_data
+from agents.news_agent import sweep_evidence
+from config import config
+from concurrent.futures import ThreadPoolExecutor
 import json
 import re
+import threading
+import time
+
+# Data sources behind each evidence agent's tools
+AGENT_UPSTREAMS = {
+    "finance_agent": ["alpha_vantage"],
+    "news_agent": ["newsapi", "serpapi"]
+}
+
+# Consensus text used when the request deadline ends the stage before a verdict
+CONSENSUS_UNFINISHED = (
+    "VERDICT: CANNOT VERIFY\n"
+    "SUMMARY: Verification ran out of time before the evidence could be weighed. Please try again."
+)
 
 class FactVerifier:
     """Main orchestrator for fact verification using multi-agent system"""
     
     def __init__(self):
         """Initialize agents only (NO tools - routing handled externally)"""
-        self.planner = create_planner_agent()
-        self.finance_agent = create_finance_agent()
-        self.news_agent = create_news_agent()
-        self.consensus_agent = create_consensus_agent()
+        # Crews are built once per thread and reused; kickoffs are not reentrant
+        self._local = threading.local()
+        # Long-lived so batch workers keep their crews from one batch to the next
+        self._claim_pool = ThreadPoolExecutor(max_workers=config.BATCH_MAX_WORKERS, thread_name_prefix="claim")
+        # Hook LLM traffic into the record/replay cassette before any crew runs
+        get_cassette()
+        install_llm_rate_limits()
+        self._pipeline()
+        self.evidence_collector = EvidenceCollector(agent_timeout=config.AGENT_TIMEOUT)
+        self.evidence_packer = EvidencePacker(token_budget=config.EVIDENCE_TOKEN_BUDGET)
+        self.evidence_prefetcher = EvidencePrefetcher(
+            finance_lookup=lookup_financial_data,
+            news_sweep=sweep_evidence,
+            max_finance_queries=config.PREFETCH_MAX_FINANCE_QUERIES
+        )
+        self.verdict_cache = VerdictCache(
+            max_size=config.VERDICT_CACHE_SIZE,
+            finance_ttl=config.VERDICT_CACHE_TTL_FINANCE,
+            news_ttl=config.VERDICT_CACHE_TTL_NEWS,
+            general_ttl=config.VERDICT_CACHE_TTL_GENERAL,
+            time_sensitive_ttl=config.VERDICT_CACHE_TTL_TIME_SENSITIVE,
+            url_key=get_url_canonicalizer().canonical_key
+        )
+    
+    def _pipeline(self) -> VerificationPipeline:
+        """Return this thread's prebuilt crews, building them on first use"""
+        pipeline = getattr(self._local, "pipeline", None)
+        if pipeline is None:
+            pipeline = VerificationPipeline()
+            self._local.pipeline = pipeline
+        return pipeline
+    
+    @property
+    def planner(self):
+        return self._pipeline().planner
+    
+    @property
+    def finance_agent(self):
+        return self._pipeline().finance_agent
+    
+    @property
+    def news_agent(self):
+        return self._pipeline().news_agent
+    
+    @property
+    def consensus_agent(self):
+        return self._pipeline().consensus_agent
     
     def parse_routing_decision(self, planner_output: str) -> RoutingDecision:
         """
@@ -54,11 +122,11 @@ class FactVerifier:
         output_lower = planner_output.lower()
         
         # Detect intent
-        if any(word in output_lower for word in ["stock", "price", "gold", "silver", "forex", "market", "financial"]):
+        if any(word in output_lower for word in FINANCE_KEYWORDS):
             intent = "finance"
             required_agents.append("finance_agent")
         
-        if any(word in output_lower for word in ["news", "announced", "reported", "article", "publication"]):
+        if any(word in output_lower for word in NEWS_KEYWORDS):
             if intent == "finance":
                 intent = "mixed"
             else:
@@ -66,7 +134,7 @@ class FactVerifier:
             required_agents.append("news_agent")
         
         # Detect time sensitivity
-        if any(word in output_lower for word in ["yesterday", "today", "recent", "latest", "current", "now"]):
+        if any(word in output_lower for word in TIME_KEYWORDS):
             time_sensitive = True
         
         return RoutingDecision(
@@ -77,13 +145,33 @@ class FactVerifier:
         )
     
     
-    def verify_claim(self, claim: str, skip_validation: bool = False) -> str:
+    def verify_claim(self, claim: str, skip_validation: bool = False, on_event=None) -> str:
         """
         Main method to verify a factual text claim
         
         Args:
             claim: Clean text claim to verify
             skip_validation: If True, bypass strict claim validation (useful for OCR/URL content)
+            on_event: Optional callback(event_name, data) for progress events
+                      ('routing', 'evidence', 'consensus', 'verdict', ...)
+        
+        Returns:
+            Human-readable verification result
+        """
+        return self.verify_claim_detailed(claim, skip_validation, on_event)["result"]
+    
+    def verify_claim_detailed(self, claim: str, skip_validation: bool = False, on_event=None) -> dict:
+        """
+        Verify a claim and return both display text and the structured verdict
+        
+        Args:
+            claim: Clean text claim to verify
+            skip_validation: If True, bypass strict claim validation (useful for OCR/URL content)
+            on_event: Optional callback(event_name, data) for progress events
+        
+        Returns:
+            Dict with 'result' (display text) and 'verdict' (VerdictResult, or None when
+            the claim was rejected or the consensus output could not be validated)
         """
         if not skip_validation:
             # Validate claim completeness BEFORE verification
@@ -92,10 +180,12 @@ class FactVerifier:
             is_valid, reason = is_complete_claim(claim)
             if not is_valid:
                 # Return friendly message, not harsh error
-                return classify_claim_issue(claim)
+                message = classify_claim_issue(claim)
+                self._emit(on_event, "rejected", {"reason": reason, "result": message})
+                return {"result": message, "verdict": None}
         
         # Claim is valid - proceed with verification
-        return self._verify_single_claim(claim)
+        return self._verify_single_claim_detailed(claim, on_event=on_event)
     
     def verify_claims_batch(self, claims: list, source_info: dict = None, skip_validation: bool = False) -> str:
         """
@@ -139,16 +229,7 @@ The content appears to contain sentence fragments or incomplete statements.
 
 Please provide complete claims with clear subjects, actions, and context for verification."""
         
-        results = []
-        for i, claim in enumerate(valid_claims, 1):
-            print(f"{'='*60}")
-            print(f"Verifying Claim {i}/{len(claims)}")
-            print(f"{'='*60}\n")
-            result = self._verify_single_claim(claim)
-            results.append({
-                'claim': claim,
-                'result': result
-            })
+        results = self._verify_concurrently(valid_claims)
         
         # Format aggregated results
         output = f"\n{'='*60}\n"
@@ -167,167 +248,363 @@ Please provide complete claims with clear subjects, actions, and context for ver
             output += f"\n--- Claim {i} ---\n"
             output += f"Claim: {item['claim'][:100]}{'...' if len(item['claim']) > 100 else ''}\n"
             output += f"{item['result']}\n"
+            output += f"⏱️ Verified in {item['elapsed']:.1f}s\n"
         
         return output
     
-    def _verify_single_claim(self, claim: str) -> str:
+    def _verify_concurrently(self, claims: list) -> list:
+        """
+        Verify claims in parallel with a bounded number of workers
+        
+        Args:
+            claims: List of validated claims
+        
+        Returns:
+            List of {'claim', 'result', 'elapsed'} dicts in the original claim order
+        """
+        max_workers = max(1, min(config.BATCH_MAX_WORKERS, len(claims)))
+        print(f"🚀 Verifying {len(claims)} claim(s) with up to {max_workers} worker(s)...")
+        
+        def verify(index: int, claim: str) -> dict:
+            print(f"{'='*60}")
+            print(f"Verifying Claim {index}/{len(claims)}")
+            print(f"{'='*60}\n")
+            start = time.monotonic()
+            try:
+                result = self._verify_single_claim(claim)
+            except Exception as e:
+                print(f"❌ Claim {index} failed: {str(e)}")
+                result = f"❌ Verification failed for this claim: {str(e)}"
+            return {
+                'claim': claim,
+                'result': result,
+                'elapsed': time.monotonic() - start
+            }
+        
+        batch_start = time.monotonic()
+        # Claims share the request's deadline
+        futures = [self._claim_pool.submit(in_context(verify, i, claim)) for i, claim in enumerate(claims, 1)]
+        results = [future.result() for future in futures]
+        
+        print(f"✅ Batch finished in {time.monotonic() - batch_start:.1f}s "
+              f"(sum of claims {sum(r['elapsed'] for r in results):.1f}s)")
+        return results
+    
+    def _verify_single_claim(self, claim: str, on_event=None) -> str:
         """
         Verify a single factual claim
         
         Args:
             claim: The factual claim to verify
+            on_event: Optional callback(event_name, data) for progress events
         
         Returns:
             Human-readable verification result
         """
+        return self._verify_single_claim_detailed(claim, on_event)["result"]
+    
+    def _verify_single_claim_detailed(self, claim: str, on_event=None) -> dict:
+        """
+        Verify a single factual claim
+        
+        Args:
+            claim: The factual claim to verify
+            on_event: Optional callback(event_name, data) for progress events
+        
+        Returns:
+            Dict with 'result' (display text) and 'verdict' (VerdictResult or None)
+        """
+        with STAGE_SECONDS.time(stage="cache_lookup"):
+            cached = self.verdict_cache.get(claim)
+        if cached is not None:
+            print("♻️ Returning cached verdict for this claim")
+            self._emit(on_event, "verdict", self._verdict_event(cached, cached=True))
+            return dict(cached)
         
         # Step 1: Planning - Get routing decision
         print("🧠 Step 1: Analyzing claim and planning verification strategy...")
+        self._emit(on_event, "planning", {})
+        with STAGE_SECONDS.time(stage="planning"):
+            routing = self._plan(claim)
         
-        planning_task = Task(
-            description=f"""Analyze this claim and determine the verification strategy:
-            
-            Claim: "{claim}"
-            
-            You must output a JSON object with these fields:
-            - intent: One of 'finance', 'news', 'events', 'mixed', or 'general'
-            - time_sensitive: true or false
-            - required_agents: List of agents to call (e.g., ['finance_agent', 'news_agent'])
-            - reasoning: Brief explanation
-            
-            Example output:
-            {{
-                "intent": "finance",
-                "time_sensitive": true,
-                "required_agents": ["finance_agent", "news_agent"],
-                "reasoning": "Claim involves recent financial data requiring both market data and news verification"
-            }}
-            """,
-            agent=self.planner,
-            expected_output="JSON object with routing decision"
-        )
+        print(f"📋 Routing Decision: {routing.intent} | Time-sensitive: {routing.time_sensitive}")
+        print(f"🎯 Required agents: {routing.required_agents}")
+        self._emit(on_event, "routing", routing.model_dump())
+        
+        # Step 2: Intelligent Routing - Call only required agents, concurrently
+        with STAGE_SECONDS.time(stage="evidence"):
+            evidence_collection = self._collect_evidence(claim, routing, on_event=on_event)
+        
+        # Step 3: Consensus - Synthesize all evidence
+        print("⚖️  Step 3: Building consensus and calculating confidence...")
+        self._emit(on_event, "consensus", {"evidence_count": len(evidence_collection)})
         
-        planning_crew = Crew(
-            agents=[self.planner],
-            tasks=[planning_task],
-            process=Process.sequential,
-            verbose=False
+        # Keep the most relevant snippets from every agent within the prompt's token budget
+        evidence_summary = self.evidence_packer.pack(
+            claim, evidence_collection, time_sensitive=routing.time_sensitive
         )
         
-        planner_output = planning_crew.kickoff()
-        routing = self.parse_routing_decision(str(planner_output))
+        print("DEBUG: Starting Consensus Crew kickoff...")
+        with STAGE_SECONDS.time(stage="consensus"):
+            verdict, consensus_output = self._build_verdict(claim, routing, evidence_summary)
+        print("DEBUG: Consensus Crew finished.")
         
-        print(f"📋 Routing Decision: {routing.intent} | Time-sensitive: {routing.time_sensitive}")
-        print(f"🎯 Required agents: {routing.required_agents}")
+        # Step 4: Format output for UI
+        print("✨ Step 4: Formatting results for display...")
+        with STAGE_SECONDS.time(stage="formatting"):
+            if verdict is not None:
+                formatted_output = self._render_verdict(verdict)
+            else:
+                # Structured output never validated - scrape what we can from the text
+                formatted_output = self._format_final_output(consensus_output, routing, list(evidence_collection.values()))
+        outcome = {"result": formatted_output, "verdict": verdict}
+        
+        # Don't pin a verdict built without evidence because every agent failed or timed out,
+        # one built while a data source was unavailable, or a consensus cut off by the deadline
+        upstreams = [name for agent in routing.required_agents for name in AGENT_UPSTREAMS.get(agent, [])]
+        cut_short = verdict is None and consensus_output == CONSENSUS_UNFINISHED
+        if (evidence_collection or not routing.required_agents) and not open_upstreams(upstreams) and not cut_short:
+            self.verdict_cache.put(claim, outcome, routing)
+        
+        self._emit(on_event, "verdict", self._verdict_event(outcome, cached=False))
+        return dict(outcome)
+    
+    def _build_verdict(self, claim: str, routing: RoutingDecision, evidence_summary: str):
+        """
+        Run consensus until it returns a valid VerdictResult
         
-        # Step 2: Intelligent Routing - Call only required agents
-        evidence_collection = []
-        agents_to_run = []
-        verification_tasks = []
+        Args:
+            claim: The factual claim to verify
+            routing: Routing decision from Planner
+            evidence_summary: Evidence text handed to the Consensus Agent
         
-        if "finance_agent" in routing.required_agents:
-            print("💰 Calling Finance Agent...")
-            agents_to_run.append(self.finance_agent)
-            
-            finance_task = Task(
-                description=f"""Verify this financial claim using market data:
-                
-                Claim: "{claim}"
-                
-                Use the Financial Data Fetcher tool to get relevant market data.
-                Return your findings as structured evidence with source information.
-                """,
-                agent=self.finance_agent,
-                expected_output="Financial evidence with source and data points"
+        Returns:
+            (VerdictResult or None, raw consensus text of the last attempt)
+        """
+        format_feedback = ""
+        consensus_output = ""
+        pipeline = self._pipeline()
+        
+        for attempt in range(1, config.CONSENSUS_MAX_ATTEMPTS + 1):
+            deadline = current_deadline()
+            if attempt > 1 and deadline is not None and deadline.expired():
+                print("⏱️ Request deadline reached - not retrying consensus")
+                break
+            consensus_output = self._run_within_deadline(
+                "consensus",
+                lambda: pipeline.build_consensus(claim, routing.reasoning, evidence_summary, format_feedback)
             )
-            verification_tasks.append(finance_task)
+            if consensus_output is None:
+                print("⏱️ Consensus did not return a verdict within the request deadline")
+                consensus_output = CONSENSUS_UNFINISHED
+                break
+            try:
+                return parse_verdict_json(consensus_output), consensus_output
+            except ValueError as e:
+                error = str(e).splitlines()[0] if str(e) else "invalid output"
+                print(f"⚠️ Consensus attempt {attempt} returned an invalid verdict: {error}")
+                format_feedback = (
+                    f"Your previous answer was rejected ({error}). "
+                    "Return ONLY the JSON object described above."
+                )
+        
+        return None, consensus_output
+    
+    def _render_verdict(self, verdict: VerdictResult) -> str:
+        """
+        Render a validated VerdictResult as display text (same layout as _format_final_output)
         
-        if "news_agent" in routing.required_agents:
-            print("📰 Calling News Agent...")
-            agents_to_run.append(self.news_agent)
-            
-            news_task = Task(
-                description=f"""Verify this claim using news sources and search:
-                
-                Claim: "{claim}"
-                
-                Use News Article Search and Google Search tools to find evidence.
-                Prioritize trusted sources. Return findings with source credibility.
-                """,
-                agent=self.news_agent,
-                expected_output="News evidence with source credibility and dates"
-            )
-            verification_tasks.append(news_task)
-        
-        # Execute verification tasks if any
-        if verification_tasks:
-            verification_crew = Crew(
-                agents=agents_to_run,
-                tasks=verification_tasks,
-                process=Process.sequential,
-                verbose=False
-            )
-            
-            verification_output = verification_crew.kickoff()
-            evidence_collection.append(str(verification_output))
+        Args:
+            verdict: Structured verdict from the Consensus Agent
         
-        # Step 3: Consensus - Synthesize all evidence
-        print("⚖️  Step 3: Building consensus and calculating confidence...")
+        Returns:
+            Clean, formatted text for the UI
+        """
+        # Positive verdicts keep the label the UI already understands
+        label = "SUPPORTED" if verdict.verdict in ("VERIFIED", "PARTIALLY TRUE") else verdict.verdict
         
-        # Truncate evidence if too long (max 2000 chars to fit in 8k context safely)
-        evidence_summary = "\n\n".join(evidence_collection) if evidence_collection else "No specific evidence gathered."
-        if len(evidence_summary) > 2000:
-            print(f"⚠️ Evidence too long ({len(evidence_summary)} chars). Truncating to 2000 chars.")
-            evidence_summary = evidence_summary[:2000] + "\n...[TRUNCATED]..."
+        if verdict.confidence >= config.HIGH_CONFIDENCE_THRESHOLD:
+            level = "High"
+        elif verdict.confidence >= config.MEDIUM_CONFIDENCE_THRESHOLD:
+            level = "Medium"
+        else:
+            level = "Low"
         
-        consensus_task = Task(
-            description=f"""Synthesize all evidence and produce final verdict:
-            
-            Original Claim: "{claim}"
-            
-            Routing Decision: {routing.reasoning}
-            
-            Evidence Collected:
-            {evidence_summary}
-            
-            Your task:
-            1. Review all evidence
-            2. Check for contradictions
-            3. Assess source credibility
-            4. Calculate confidence score (0.0 to 1.0)
-            5. Apply verdict rules:
-               - confidence >= 0.8 → VERIFIED (if supports claim) or CONTRADICTED (if refutes claim)
-               - 0.5 ≤ confidence < 0.8 → PARTIALLY TRUE
-               - confidence < 0.5 → UNVERIFIABLE
-            
-            Output a clear summary with:
-            - Verdict (VERIFIED/CONTRADICTED/PARTIALLY TRUE/UNVERIFIABLE)
-            - Confidence score
-            - Summary of findings
-            - Evidence sources used
-            - Any contradictions found
-            - Additional notes
-            """,
-            agent=self.consensus_agent,
-            expected_output="Final verdict with confidence, summary, and evidence sources"
-        )
+        sources = []
+        for source in verdict.evidence:
+            line = f"- {source.source_name}"
+            if source.source_type:
+                line += f" — {source.source_type}"
+            if source.date:
+                line += f" ({source.date})"
+            sources.append(line)
+        
+        final_output = []
+        final_output.append("📊 VERIFICATION RESULT\n")
+        final_output.append(f"Verdict: {label}")
+        final_output.append(f"Confidence: {level} ({verdict.confidence:.2f})\n")
+        final_output.append("Summary:")
+        final_output.append(f"{verdict.summary}\n")
+        final_output.append("Sources:")
+        final_output.append("\n".join(sources) if sources else "No sources cited.")
+        
+        return "\n".join(final_output)
+    
+    @staticmethod
+    def _verdict_event(outcome: dict, cached: bool) -> dict:
+        """Serializable payload for the 'verdict' progress event"""
+        verdict = outcome.get("verdict")
+        return {
+            "result": outcome["result"],
+            "verdict": verdict.model_dump() if verdict is not None else None,
+            "cached": cached
+        }
+    
+    def _plan(self, claim: str) -> RoutingDecision:
+        """
+        Decide which agents to call, skipping the Planner LLM for obvious claims
         
-        consensus_crew = Crew(
-            agents=[self.consensus_agent],
-            tasks=[consensus_task],
-            process=Process.sequential,
-            verbose=False
+        Args:
+            claim: The factual claim to verify
+        
+        Returns:
+            RoutingDecision from the rule-based fast path or the Planner Agent
+        """
+        fast_routing = pre_route(claim)
+        if fast_routing.confidence >= config.FAST_ROUTE_MIN_CONFIDENCE:
+            print(f"⚡ Fast-path routing (confidence {fast_routing.confidence:.2f}) - skipping planner")
+            return fast_routing
+        
+        budget = remaining_or(float("inf"), reserve=config.DEADLINE_CONSENSUS_RESERVE)
+        if budget < config.DEADLINE_PLANNER_MIN:
+            print(f"⏱️ Only {budget:.0f}s left for planning and evidence - using rule-based routing")
+            return fast_routing
+        
+        print(f"🤔 Fast-path unsure (confidence {fast_routing.confidence:.2f}) - asking planner")
+        pipeline = self._pipeline()
+        routing = self._run_within_deadline(
+            "planner", lambda: self._plan_with_llm(claim, pipeline), reserve=config.DEADLINE_CONSENSUS_RESERVE
         )
+        if routing is None:
+            print("⏱️ Planner did not answer in time - using rule-based routing")
+            return fast_routing
+        return routing
+    
+    def _plan_with_llm(self, claim: str, pipeline: VerificationPipeline) -> RoutingDecision:
+        """
+        Ask the Planner Agent for a routing decision
         
-        print("DEBUG: Starting Consensus Crew kickoff...")
-        consensus_output = consensus_crew.kickoff()
-        print("DEBUG: Consensus Crew finished.")
+        Args:
+            claim: The factual claim to verify
+            pipeline: Crews of the thread serving the request
         
-        # Step 4: Format output for UI
-        print("✨ Step 4: Formatting results for display...")
-        formatted_output = self._format_final_output(str(consensus_output), routing, evidence_collection)
+        Returns:
+            RoutingDecision parsed from the planner output
+        """
+        planner_output = pipeline.plan(claim)
+        return self.parse_routing_decision(planner_output)
+    
+    def _run_within_deadline(self, stage: str, job, reserve: float = 0.0):
+        """
+        Run an LLM stage (planner, consensus) bounded by what is left of the request deadline
+        
+        Uses the evidence collector's future-with-timeout path, so a slow crew is abandoned
+        instead of holding the request past its deadline.
+        
+        Args:
+            stage: Stage name for logging
+            job: Zero-argument callable running the stage
+            reserve: Seconds to hold back for later stages
         
-        return formatted_output
+        Returns:
+            The job's result, or None if it failed or ran out of time
+        """
+        if current_deadline() is None:
+            return job()
+        
+        budget = remaining_or(float("inf"), reserve=reserve)
+        if budget <= 0:
+            print(f"⏱️ Request deadline leaves no time for {stage}")
+            return None
+        
+        [item] = self.evidence_collector.collect({stage: job}, timeout=budget)
+        if item['status'] == "timeout":
+            # The late crew is still running; give this thread fresh crews next time
+            self._local.pipeline = None
+        return item['evidence'] if item['status'] == "ok" else None
+    
+    def _collect_evidence(self, claim: str, routing: RoutingDecision, on_event=None) -> dict:
+        """
+        Run every required evidence agent in its own crew, concurrently
+        
+        Args:
+            claim: The factual claim to verify
+            routing: Routing decision from Planner
+            on_event: Optional callback(event_name, data), fired as each agent finishes
+        
+        Returns:
+            Mapping of agent name to evidence text, for agents that finished before the deadline
+        """
+        pipeline = self._pipeline()
+        
+        def job(agent_name: str):
+            unavailable = open_upstreams(AGENT_UPSTREAMS[agent_name])
+            notes = "\n".join(breaker.unavailable_note() for breaker in unavailable)
+            if len(unavailable) == len(AGENT_UPSTREAMS[agent_name]):
+                # Every source this agent relies on is down - don't spend LLM iterations retrying it
+                print(f"🔌 Skipping {agent_name}: all of its data sources are unavailable")
+                return notes
+            
+            # Prefetch inside the job so it runs in parallel and counts against the agent deadline
+            prefetched = self.evidence_prefetcher.prefetch(agent_name, claim) if config.EVIDENCE_PREFETCH else ""
+            evidence = pipeline.gather_evidence(agent_name, claim, prefetched)
+            return f"{notes}\n{evidence}" if notes else evidence
+        
+        jobs = {}
+        if "finance_agent" in routing.required_agents:
+            print("💰 Calling Finance Agent...")
+            jobs["finance_agent"] = lambda: job("finance_agent")
+        if "news_agent" in routing.required_agents:
+            print("📰 Calling News Agent...")
+            jobs["news_agent"] = lambda: job("news_agent")
+        
+        if not jobs:
+            return {}
+        
+        # Agents get whatever the request deadline leaves after reserving time for consensus
+        budget = remaining_or(config.AGENT_TIMEOUT, reserve=config.DEADLINE_CONSENSUS_RESERVE)
+        if budget <= 0:
+            print("⏱️ Request deadline leaves no time for evidence agents - skipping them")
+            return {}
+        
+        print(f"🚀 Step 2: Collecting evidence from {len(jobs)} agent(s) in parallel...")
+        results = self.evidence_collector.collect(
+            jobs,
+            on_result=lambda item: self._emit(on_event, "evidence", item),
+            timeout=budget
+        )
+        
+        evidence_collection = {}
+        for item in results:
+            print(f"   {item['agent']}: {item['status']} ({item['elapsed']:.1f}s)")
+            AGENT_SECONDS.observe(item['elapsed'], agent=item['agent'], status=item['status'])
+            if item['status'] == "ok" and item['evidence']:
+                evidence_collection[item['agent']] = item['evidence']
+            elif item['status'] == "timeout":
+                # The late crew is still running; give this thread fresh crews next time
+                self._local.pipeline = None
+        
+        return evidence_collection
+    
+    @staticmethod
+    def _emit(on_event, event: str, data: dict):
+        """Deliver a progress event; a broken listener must never break verification"""
+        if on_event is None:
+            return
+        try:
+            on_event(event, data)
+        except Exception as e:
+            print(f"⚠️ Progress listener failed on '{event}': {str(e)}")
     
     def _format_final_output(self, consensus_text: str, routing: RoutingDecision, evidence: list) -> str:
         """
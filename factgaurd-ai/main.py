@@ -6,6 +6,7 @@ NEW ARCHITECTURE: Planner decides input type → Router preprocesses → Verifie
 
 from fact_verifier import fact_verifier
 from core.input_router import InputRouter
+from core.deadline import deadline_scope
 from config import config
 import os
 import re
@@ -61,31 +62,33 @@ def main():
         input_type = detect_input_type(user_input)
         print(f"📋 Input type detected: {input_type.upper()}")
         
-        # STEP 2: Route to appropriate preprocessing
-        if input_type in ['url', 'image']:
-            print(f"🔄 Routing to {input_type} processor...\n")
-            routed_result = router.route(input_type, user_input)
+        # One time budget for routing, extraction and verification
+        with deadline_scope(config.REQUEST_DEADLINE):
+            # STEP 2: Route to appropriate preprocessing
+            if input_type in ['url', 'image']:
+                print(f"🔄 Routing to {input_type} processor...\n")
+                routed_result = router.route(input_type, user_input)
             
-            if "error" in routed_result:
-                print(f"❌ Error: {routed_result['error']}\n")
-                return
+                if "error" in routed_result:
+                    print(f"❌ Error: {routed_result['error']}\n")
+                    return
             
-            # Extract claims from routing result
-            claims = routed_result['claims']
-            skip_validation = routed_result.get('skip_validation', False)  # Get flag for reconstructed claims
-            source_info = {
-                'source': routed_result.get('source', user_input),
-                'title': routed_result.get('title')
-            }
+                # Extract claims from routing result
+                claims = routed_result['claims']
+                skip_validation = routed_result.get('skip_validation', False)  # Get flag for reconstructed claims
+                source_info = {
+                    'source': routed_result.get('source', user_input),
+                    'title': routed_result.get('title')
+                }
             
-            print(f"✅ Found {len(claims)} claims to verify\n")
+                print(f"✅ Found {len(claims)} claims to verify\n")
             
-            # STEP 3: Verify claims
-            result = fact_verifier.verify_claims_batch(claims, source_info, skip_validation=skip_validation)
-        else:
-            # Direct text claim - verify immediately
-            print("📝 Processing text claim...\n")
-            result = fact_verifier.verify_claim(user_input)
+                # STEP 3: Verify claims
+                result = fact_verifier.verify_claims_batch(claims, source_info, skip_validation=skip_validation)
+            else:
+                # Direct text claim - verify immediately
+                print("📝 Processing text claim...\n")
+                result = fact_verifier.verify_claim(user_input)
         
         # Display results
         print("\n" + "="*60)
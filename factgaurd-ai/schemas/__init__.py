@@ -3,12 +3,13 @@ Initialize schemas package
 """
 
 from schemas.claim_schema import ClaimInput, RoutingDecision, EvidenceSource
-from schemas.verdict_schema import VerdictResult, format_verdict_for_display
+from schemas.verdict_schema import VerdictResult, format_verdict_for_display, parse_verdict_json
 
 __all__ = [
     'ClaimInput',
     'RoutingDecision',
     'EvidenceSource',
     'VerdictResult',
-    'format_verdict_for_display'
+    'format_verdict_for_display',
+    'parse_verdict_json'
 ]
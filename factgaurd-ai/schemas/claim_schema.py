@@ -23,6 +23,12 @@ class RoutingDecision(BaseModel):
         ..., 
         description="Brief explanation of routing decision"
     )
+    confidence: float | None = Field(
+        default=None,
+        ge=0.0,
+        le=1.0,
+        description="Rule-based router's confidence in this decision (None when produced by the Planner Agent)"
+    )
 
 class EvidenceSource(BaseModel):
     """Information about a single source of evidence"""
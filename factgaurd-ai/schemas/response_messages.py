@@ -217,6 +217,15 @@ Such sources often lack verifiable context or public access.
 Please paste the message text or provide a reliable external source for verification."""
 
 
+def not_an_article_link() -> str:
+    """Link points to a file (PDF, video, image, ...) or an oversized page instead of an article"""
+    return """⚠️  The link doesn't appear to point to a readable article.
+
+It leads to a file such as a PDF, video, or image, or to a page too large to analyze.
+
+Please link to the article page itself or paste the relevant text directly."""
+
+
 def classify_url_issue(url: str, status_code: int = None, error_type: str = None) -> str:
     """
     Classify URL access issues and return appropriate message
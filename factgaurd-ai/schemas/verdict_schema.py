@@ -1,6 +1,18 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 from typing import List, Literal
 from schemas.claim_schema import EvidenceSource
+import json
+import re
+
+# Verdict labels the Consensus Agent is prompted with, folded into the schema's four verdicts
+VERDICT_ALIASES = {
+    "SUPPORTED": "VERIFIED",
+    "TRUE": "VERIFIED",
+    "FALSE": "CONTRADICTED",
+    "UNSUPPORTED": "CONTRADICTED",
+    "NOT FACTUAL": "UNVERIFIABLE",
+    "CANNOT VERIFY": "UNVERIFIABLE",
+}
 
 class VerdictResult(BaseModel):
     """Final verification verdict with confidence and evidence"""
@@ -30,6 +42,65 @@ class VerdictResult(BaseModel):
         default_factory=list, 
         description="List of contradictions found if any"
     )
+    
+    @field_validator("verdict", mode="before")
+    @classmethod
+    def normalize_verdict(cls, value):
+        """Accept the consensus prompt's labels (SUPPORTED, FALSE, ...) and any casing"""
+        if isinstance(value, str):
+            label = value.strip().upper().replace("_", " ")
+            return VERDICT_ALIASES.get(label, label)
+        return value
+    
+    @field_validator("confidence", mode="before")
+    @classmethod
+    def parse_confidence(cls, value):
+        """Accept 'High (0.95)' or '95%' as well as plain numbers"""
+        if isinstance(value, str):
+            match = re.search(r'\d+(?:\.\d+)?', value)
+            if not match:
+                raise ValueError(f"no numeric confidence in {value!r}")
+            number = float(match.group(0))
+            return number / 100 if number > 1 else number
+        return value
+    
+    @field_validator("evidence", mode="before")
+    @classmethod
+    def coerce_evidence(cls, value):
+        """Accept bare source names in place of full EvidenceSource objects"""
+        if isinstance(value, list):
+            return [
+                {"source_name": item, "source_type": "Cited source", "content": ""}
+                if isinstance(item, str) else item
+                for item in value
+            ]
+        return value
+
+def parse_verdict_json(text: str) -> VerdictResult:
+    """
+    Parse and validate a VerdictResult from Consensus Agent output
+    
+    Args:
+        text: Raw agent output, optionally wrapped in a ```json fence or prose
+    
+    Returns:
+        Validated VerdictResult
+    
+    Raises:
+        ValueError: If no JSON object is found or it fails validation
+    """
+    start = text.find("{")
+    end = text.rfind("}")
+    if start == -1 or end <= start:
+        raise ValueError("no JSON object found in output")
+    
+    try:
+        data = json.loads(text[start:end + 1])
+    except json.JSONDecodeError as e:
+        raise ValueError(f"invalid JSON: {e.msg}")
+    
+    # pydantic's ValidationError is a ValueError
+    return VerdictResult.model_validate(data)
 
 def format_verdict_for_display(verdict: VerdictResult) -> str:
     """
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Test Article Cache and Conditional Revalidation
+"""
+from io import BytesIO
+import requests
+from core.article_cache import ArticleCache, freshness_lifetime
+from tools.article_extractor import ArticleExtractorTool
+
+URL = "https://news.example.com/markets/gold"
+BODY = "Gold prices rose two percent on Monday after the central bank cut interest rates. " * 3
+
+
+def _page(text: str) -> bytes:
+    return f"<html><title>Gold</title><body><article><p>{text}</p></article></body></html>".encode()
+
+
+class FakeHttp:
+    """HttpClient stand-in replaying queued (status, headers, body) responses"""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.requests = []
+
+    def get(self, url, headers=None, **kwargs):
+        self.requests.append(dict(headers or {}))
+        status, response_headers, body = self.responses.pop(0)
+        response = requests.Response()
+        response.status_code = status
+        response.headers.update({"Content-Type": "text/html", **response_headers})
+        response.raw = BytesIO(body)
+        response.url = url
+        return response
+
+
+def _cache(path=":memory:", default_ttl=60):
+    return ArticleCache(path, max_entries=100, default_ttl=default_ttl, max_ttl=3600)
+
+
+def _tool(cache, *responses):
+    http = FakeHttp(*responses)
+    return ArticleExtractorTool(http_client=http, article_cache=cache), http
+
+
+def test_fresh_entry_skips_fetch():
+    """A fresh entry is served without touching the network"""
+    cache = _cache()
+    tool, http = _tool(cache, (200, {"Cache-Control": "max-age=300"}, _page(BODY)))
+
+    first = tool.extract_article(URL)
+    second = tool.extract_article(URL + "#comments")
+
+    assert second["content"] == first["content"]
+    assert len(http.requests) == 1
+    assert cache.stats()["hits"] == 1
+    print("✓ Fresh article served from cache")
+
+
+def test_stale_entry_revalidated_with_304():
+    """A stale entry is revalidated with its validators and reused on 304"""
+    cache = _cache(default_ttl=0)
+    tool, http = _tool(
+        cache,
+        (200, {"ETag": '"v1"', "Last-Modified": "Mon, 03 Jun 2024 10:00:00 GMT"}, _page(BODY)),
+        (304, {"Cache-Control": "max-age=120"}, b""),
+    )
+
+    first = tool.extract_article(URL)
+    second = tool.extract_article(URL)
+
+    assert second == first
+    assert http.requests[1]["If-None-Match"] == '"v1"'
+    assert http.requests[1]["If-Modified-Since"] == "Mon, 03 Jun 2024 10:00:00 GMT"
+    assert cache.lookup(URL)["fresh"]
+    assert cache.stats()["revalidated"] == 1
+    print("✓ Unchanged page revalidated with a 304")
+
+
+def test_changed_page_replaces_entry():
+    """A 200 to a conditional request is re-extracted and replaces the entry"""
+    cache = _cache(default_ttl=0)
+    updated = BODY.replace("two", "three")
+    tool, http = _tool(
+        cache,
+        (200, {"ETag": '"v1"'}, _page(BODY)),
+        (200, {"ETag": '"v2"'}, _page(updated)),
+    )
+
+    tool.extract_article(URL)
+    result = tool.extract_article(URL)
+
+    assert "three percent" in result["content"]
+    assert cache.lookup(URL)["etag"] == '"v2"'
+
+
+def test_uncacheable_responses_not_stored():
+    """no-store pages, and stale-at-once pages without validators, are never cached"""
+    cache = _cache(default_ttl=0)
+    tool, http = _tool(
+        cache,
+        (200, {"Cache-Control": "no-store", "ETag": '"v1"'}, _page(BODY)),
+        (200, {}, _page(BODY)),
+        (200, {}, _page("too short")),
+    )
+
+    tool.extract_article(URL)
+    tool.extract_article(URL + "?page=2")
+    assert "error" in tool.extract_article(URL + "?page=3")
+
+    assert cache.stats()["size"] == 0
+
+
+def test_freshness_lifetime():
+    """Cache-Control decides freshness, capped at the maximum"""
+    assert freshness_lifetime({}, 900, 3600) == 900
+    assert freshness_lifetime({"Cache-Control": "public, max-age=60"}, 900, 3600) == 60
+    assert freshness_lifetime({"Cache-Control": "s-maxage=100000"}, 900, 3600) == 3600
+    assert freshness_lifetime({"Cache-Control": "no-cache"}, 900, 3600) == 0
+    assert freshness_lifetime({"Cache-Control": "private, no-store"}, 900, 3600) is None
+
+
+def test_cache_key_and_restart(tmp_path):
+    """Entries are keyed on the canonical URL and survive a restart"""
+    path = str(tmp_path / "article_cache.db")
+    first = _cache(path)
+    first.store(URL, {"title": "Gold", "content": BODY, "word_count": 42}, {"ETag": '"v1"'})
+    first.close()
+
+    second = _cache(path)
+    entry = second.lookup("https://NEWS.example.com/markets/gold/?utm_source=twitter#top")
+    assert entry["title"] == "Gold" and entry["fresh"]
+    second.close()
+
+
+if __name__ == "__main__":
+    print("Run with: python -m pytest tests/test_article_cache.py -v")
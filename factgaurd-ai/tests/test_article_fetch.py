@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Test Streaming Article Fetch
+"""
+from io import BytesIO
+import requests
+from core.article_cache import ArticleCache
+from core.deadline import deadline_scope
+from tools.article_extractor import ArticleExtractorTool
+from schemas.response_messages import not_an_article_link
+
+
+PARAGRAPH = "<p>" + "Gold prices rose two percent on Monday after the central bank cut rates. " * 3 + "</p>"
+
+
+class CountingBody(BytesIO):
+    """Response body that records how many bytes were read from it"""
+
+    def __init__(self, data: bytes):
+        super().__init__(data)
+        self.bytes_read = 0
+
+    def read(self, size=-1):
+        chunk = super().read(size)
+        self.bytes_read += len(chunk)
+        return chunk
+
+
+class FakeHttp:
+    """HttpClient stand-in serving one canned streamed response"""
+
+    def __init__(self, body: bytes, headers: dict, status: int = 200):
+        self.body = CountingBody(body)
+        self.headers = headers
+        self.status = status
+        self.kwargs = None
+
+    def get(self, url, **kwargs):
+        self.kwargs = kwargs
+        response = requests.Response()
+        response.status_code = self.status
+        response.headers.update(self.headers)
+        response.raw = self.body
+        response.url = url
+        return response
+
+
+def _extractor(body: bytes, headers: dict, max_bytes: int = 1024 * 1024):
+    http = FakeHttp(body, headers)
+    cache = ArticleCache(":memory:", max_entries=10, default_ttl=60, max_ttl=3600)
+    return ArticleExtractorTool(http_client=http, max_bytes=max_bytes, article_cache=cache), http
+
+
+def test_html_is_streamed():
+    """Pages are requested with stream=True and parsed as before"""
+    page = f"<html><title>Gold</title><body><article>{PARAGRAPH}</article></body></html>".encode()
+    extractor, http = _extractor(page, {"Content-Type": "text/html"})
+
+    result = extractor.extract_article("https://news.example.com/gold")
+
+    assert http.kwargs["stream"] is True
+    assert result["title"] == "Gold"
+    assert "central bank" in result["content"]
+    print("✓ Article streamed and extracted")
+
+
+def test_non_html_rejected_before_body_read():
+    """A PDF or video link is refused from its headers alone"""
+    extractor, http = _extractor(b"%PDF-1.7" + b"\0" * 100000, {"Content-Type": "application/pdf"})
+
+    assert extractor.extract_article("https://example.com/report.pdf") == {"error": not_an_article_link()}
+    assert http.body.bytes_read == 0
+
+
+def test_oversized_content_length_rejected():
+    """A declared body beyond the cap is refused without reading it"""
+    extractor, http = _extractor(b"<html></html>", {"Content-Type": "text/html", "Content-Length": "50000000"},
+                                 max_bytes=1000)
+
+    assert "error" in extractor.extract_article("https://example.com/huge")
+    assert http.body.bytes_read == 0
+
+
+def test_undeclared_body_capped():
+    """Without a Content-Length, at most max_bytes are read"""
+    page = f"<html><body><main>{PARAGRAPH}</main>".encode() + b"<p>filler</p>" * 100000
+    extractor, http = _extractor(page, {"Content-Type": "text/html"}, max_bytes=200 * 1024)
+
+    result = extractor.extract_article("https://example.com/endless")
+
+    assert "central bank" in result["content"]
+    assert http.body.bytes_read <= 200 * 1024 + 64 * 1024
+
+
+def test_teaser_article_in_chrome_does_not_end_read():
+    """An <article> teaser in the navigation or a script string does not cut the page short"""
+    page = (
+        b"<html><body><nav><article><a href='/x'>Related story</a></article></nav>"
+        b"<script>var tpl = '<article></article>';</script>"
+        + b"<div class='menu'>menu item</div>" * 5000
+        + f"<article>{PARAGRAPH}</article></body></html>".encode()
+    )
+    extractor, http = _extractor(page, {"Content-Type": "text/html"})
+
+    result = extractor.extract_article("https://example.com/story")
+
+    assert "central bank" in result["content"]
+    assert http.body.bytes_read == len(page)
+
+
+def test_stops_shortly_after_main_article():
+    """Once a substantial top-level <article> closes, the trailing page is not downloaded"""
+    page = (
+        b"<html><body><nav><article><a href='/x'>Related story</a></article></nav>"
+        + f"<article>{PARAGRAPH * 4}<article class='quote'>{PARAGRAPH * 6}</article>"
+          f"<p>Analysts expect another cut in June.</p></article>".encode()
+        + b"<div>comments</div>" * 200000
+    )
+    extractor, http = _extractor(page, {"Content-Type": "text/html"}, max_bytes=8 * 1024 * 1024)
+
+    result = extractor.extract_article("https://example.com/story")
+
+    assert "another cut in June" in result["content"]
+    assert "comments" not in result["content"]
+    assert http.body.bytes_read < len(page) // 10
+
+
+def test_declared_charset_used():
+    """The Content-Type charset decodes the body; without one the parser sniffs <meta>"""
+    page = f"<html><title>Café</title><body><article>{PARAGRAPH}</article></body></html>"
+
+    extractor, _ = _extractor(page.encode("cp1252"), {"Content-Type": 'text/html; charset="windows-1252"'})
+    assert extractor.extract_article("https://example.com/a")["title"] == "Café"
+
+    meta = page.replace("<html>", '<html><meta charset="utf-8">').encode("utf-8")
+    extractor, _ = _extractor(meta, {"Content-Type": "text/html"})
+    assert extractor.extract_article("https://example.com/b")["title"] == "Café"
+
+
+def test_slow_body_stops_at_deadline():
+    """A body still arriving when the request deadline passes is abandoned"""
+    page = f"<html><body><main>{PARAGRAPH}</main>".encode() + b"<p>x</p>" * 100000
+    extractor, http = _extractor(page, {"Content-Type": "text/html"})
+
+    with deadline_scope(0):
+        result = extractor.extract_article("https://example.com/slow")
+
+    assert "error" in result
+    assert http.body.bytes_read < len(page)
+
+
+if __name__ == "__main__":
+    test_html_is_streamed()
+    test_non_html_rejected_before_body_read()
+    test_oversized_content_length_rejected()
+    test_undeclared_body_capped()
+    test_teaser_article_in_chrome_does_not_end_read()
+    test_stops_shortly_after_main_article()
+    test_declared_charset_used()
+    test_slow_body_stops_at_deadline()
+
+    print("\n✅ All article fetch tests passed!")
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Test Parallel Batch Verification
+"""
+import time
+from fact_verifier import FactVerifier
+from config import config
+
+
+CLAIMS = [
+    "Tesla delivered 1.8 million vehicles in 2023",
+    "The Reserve Bank of India kept the repo rate at 6.5 percent",
+    "Apple reported quarterly revenue of 90 billion dollars",
+]
+
+
+def _fake_verifier(delays):
+    """FactVerifier whose per-claim pipeline just sleeps"""
+    verifier = FactVerifier()
+
+    def fake_verify(claim):
+        time.sleep(delays[claim])
+        if claim == "boom":
+            raise RuntimeError("consensus crashed")
+        return f"Verdict: SUPPORTED ({claim[:10]})"
+
+    verifier._verify_single_claim = fake_verify
+    return verifier
+
+
+def test_batch_runs_in_parallel_and_keeps_order():
+    """Claims finish out of order but are reported in input order"""
+    delays = {CLAIMS[0]: 0.4, CLAIMS[1]: 0.1, CLAIMS[2]: 0.2}
+    verifier = _fake_verifier(delays)
+    config.BATCH_MAX_WORKERS = 3
+
+    start = time.monotonic()
+    results = verifier._verify_concurrently(CLAIMS)
+    elapsed = time.monotonic() - start
+
+    print(f"✓ 3 claims (0.7s sequential) took {elapsed:.2f}s")
+    assert elapsed < 0.65
+    assert [r["claim"] for r in results] == CLAIMS
+    assert results[0]["elapsed"] >= 0.4
+
+
+def test_worker_limit_is_respected():
+    """With one worker the batch is sequential"""
+    delays = {claim: 0.1 for claim in CLAIMS}
+    config.BATCH_MAX_WORKERS = 1
+    try:
+        verifier = _fake_verifier(delays)
+        start = time.monotonic()
+        verifier._verify_concurrently(CLAIMS)
+        elapsed = time.monotonic() - start
+    finally:
+        config.BATCH_MAX_WORKERS = 3
+
+    print(f"✓ Single worker took {elapsed:.2f}s")
+    assert elapsed >= 0.3
+
+
+def test_batch_workers_reuse_crews():
+    """Claim workers outlive a batch, so their crews are built once, not per batch"""
+    config.BATCH_MAX_WORKERS = 2
+    try:
+        verifier = FactVerifier()
+    finally:
+        config.BATCH_MAX_WORKERS = 3
+    pipelines = set()
+
+    def fake_verify(claim):
+        time.sleep(0.01)
+        pipelines.add(id(verifier._pipeline()))
+        return "Verdict: SUPPORTED"
+
+    verifier._verify_single_claim = fake_verify
+    for _ in range(3):
+        verifier._verify_concurrently(CLAIMS)
+
+    print(f"✓ 9 claims in 3 batches used {len(pipelines)} pipeline(s)")
+    assert len(pipelines) <= 2
+
+
+def test_failed_claim_does_not_sink_batch():
+    """One crashing claim is reported; the others still complete"""
+    delays = {CLAIMS[0]: 0, "boom": 0}
+    verifier = _fake_verifier(delays)
+
+    output = verifier.verify_claims_batch([CLAIMS[0], "boom"], skip_validation=True)
+
+    assert "Verdict: SUPPORTED" in output
+    assert "Verification failed" in output
+    assert "Verified in" in output
+    print("✓ Failure isolated to its own claim")
+
+
+if __name__ == "__main__":
+    test_batch_runs_in_parallel_and_keeps_order()
+    test_worker_limit_is_respected()
+    test_batch_workers_reuse_crews()
+    test_failed_claim_does_not_sink_batch()
+
+    print("\n✅ All batch verification tests passed!")
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Test Bounded Verification Executor
+"""
+import asyncio
+import time
+from core.bounded_executor import BoundedExecutor, ExecutorSaturated
+
+
+def _blocking(delay):
+    time.sleep(delay)
+    return delay
+
+
+def test_event_loop_stays_responsive():
+    """Blocking work runs off the loop, so other coroutines keep running"""
+    executor = BoundedExecutor(max_workers=2, max_queue=0)
+
+    async def scenario():
+        ticks = 0
+
+        async def heartbeat():
+            nonlocal ticks
+            for _ in range(5):
+                await asyncio.sleep(0.02)
+                ticks += 1
+
+        await asyncio.gather(executor.run(_blocking, 0.2), heartbeat())
+        return ticks
+
+    ticks = asyncio.run(scenario())
+    print(f"✓ Heartbeat ticked {ticks} times during blocking call")
+    assert ticks == 5
+
+
+def test_concurrency_limit():
+    """Only max_workers calls run at once; the rest wait in the queue"""
+    executor = BoundedExecutor(max_workers=2, max_queue=2)
+
+    async def scenario():
+        start = time.monotonic()
+        await asyncio.gather(*(executor.run(_blocking, 0.1) for _ in range(4)))
+        return time.monotonic() - start
+
+    elapsed = asyncio.run(scenario())
+    print(f"✓ 4 calls on 2 workers took {elapsed:.2f}s")
+    assert 0.18 <= elapsed < 0.4
+    assert executor.stats()["running"] == 0
+
+
+def test_rejects_when_queue_full():
+    """Work beyond workers + queue is rejected immediately"""
+    executor = BoundedExecutor(max_workers=1, max_queue=1)
+
+    async def scenario():
+        first = executor.submit(_blocking, 0.1)
+        second = executor.submit(_blocking, 0.1)
+        stats = executor.stats()
+        try:
+            executor.submit(_blocking, 0.1)
+            rejected = False
+        except ExecutorSaturated:
+            rejected = True
+        await asyncio.gather(first, second)
+        return rejected, stats
+
+    rejected, stats = asyncio.run(scenario())
+    assert rejected
+    assert stats["running"] == 1
+    assert stats["queued"] == 1
+    assert executor.stats()["rejected"] == 1
+    print("✓ Saturated executor rejected extra work")
+
+
+def test_slot_released_after_error():
+    """A failing call frees its slot"""
+    executor = BoundedExecutor(max_workers=1, max_queue=0)
+
+    def broken():
+        raise RuntimeError("boom")
+
+    async def scenario():
+        try:
+            await executor.run(broken)
+        except RuntimeError:
+            pass
+        return await executor.run(_blocking, 0)
+
+    assert asyncio.run(scenario()) == 0
+    print("✓ Slot released after exception")
+
+
+if __name__ == "__main__":
+    test_event_loop_stays_responsive()
+    test_concurrency_limit()
+    test_rejects_when_queue_full()
+    test_slot_released_after_error()
+
+    print("\n✅ All bounded executor tests passed!")
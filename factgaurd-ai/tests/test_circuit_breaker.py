@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Test Per-Upstream Circuit Breakers
+"""
+import time
+import pytest
+import requests
+from core.circuit_breaker import CircuitBreaker, CircuitOpenError, get_breaker, CLOSED, OPEN, HALF_OPEN
+from core.deadline import deadline_scope
+from core.http_client import HttpClient
+from fact_verifier import FactVerifier
+from schemas.claim_schema import RoutingDecision
+
+
+def _failing():
+    raise requests.exceptions.ReadTimeout("read timed out")
+
+
+def test_opens_after_threshold_and_fails_fast():
+    """Consecutive failures open the circuit; later calls never reach the upstream"""
+    breaker = CircuitBreaker("serpapi", failure_threshold=3, reset_timeout=60)
+    for _ in range(3):
+        with pytest.raises(requests.exceptions.ReadTimeout):
+            breaker.call(_failing)
+
+    calls = []
+    start = time.monotonic()
+    with pytest.raises(CircuitOpenError, match="SerpAPI"):
+        breaker.call(lambda: calls.append(1))
+
+    assert breaker.state == OPEN
+    assert calls == []
+    assert time.monotonic() - start < 0.05
+    assert breaker.stats()["rejected"] == 1
+    print("✓ Open circuit rejects instantly")
+
+
+def test_success_resets_failure_count():
+    """Only consecutive failures count"""
+    breaker = CircuitBreaker("newsapi", failure_threshold=2, reset_timeout=60)
+    with pytest.raises(requests.exceptions.ReadTimeout):
+        breaker.call(_failing)
+    breaker.call(lambda: "ok")
+    with pytest.raises(requests.exceptions.ReadTimeout):
+        breaker.call(_failing)
+
+    assert breaker.state == CLOSED
+
+
+def test_slow_calls_trip_the_breaker():
+    """Successful but slow responses count as failures"""
+    breaker = CircuitBreaker("alpha_vantage", failure_threshold=2, reset_timeout=60, slow_call_seconds=0.01)
+    breaker.record_success(elapsed=0.5)
+    breaker.record_success(elapsed=0.5)
+
+    assert breaker.state == OPEN
+
+
+def test_half_open_probe_recovers_or_reopens():
+    """After the reset timeout one probe decides the circuit's state"""
+    breaker = CircuitBreaker("llm", failure_threshold=1, reset_timeout=0.05)
+    breaker.record_failure()
+    time.sleep(0.06)
+    assert breaker.state == HALF_OPEN
+
+    # The probe is in flight - concurrent callers still fail fast
+    breaker.before_call()
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+    breaker.record_failure()
+    assert breaker.state == OPEN
+
+    time.sleep(0.06)
+    breaker.call(lambda: "recovered")
+    assert breaker.state == CLOSED
+    print("✓ Half-open probe closed the circuit")
+
+
+def test_http_client_guards_known_hosts():
+    """5xx responses count as failures; an open breaker stops the request before it is sent"""
+    breaker = CircuitBreaker("newsapi", failure_threshold=2, reset_timeout=60)
+    client = HttpClient(pool_connections=1, pool_maxsize=1, max_retries=0, backoff_factor=0,
+                        connect_timeout=1, read_timeout=1, breakers={"newsapi.org": breaker})
+    sent = []
+
+    def fake_get(url, **kwargs):
+        sent.append(url)
+        response = requests.Response()
+        response.status_code = 503
+        return response
+
+    client.session.get = fake_get
+    client.get("https://newsapi.org/v2/everything")
+    client.get("https://newsapi.org/v2/everything")
+
+    with pytest.raises(CircuitOpenError):
+        client.get("https://newsapi.org/v2/everything")
+    client.get("https://example.com/article")
+
+    assert len(sent) == 3
+    assert breaker.state == OPEN
+
+
+def test_deadline_timeouts_do_not_trip_the_breaker():
+    """Timeouts shortened by the request deadline are not held against the upstream"""
+    breaker = CircuitBreaker("newsapi", failure_threshold=1, reset_timeout=60)
+    client = HttpClient(pool_connections=1, pool_maxsize=1, max_retries=0, backoff_factor=0,
+                        connect_timeout=5, read_timeout=30, breakers={"newsapi.org": breaker})
+
+    def fake_get(url, timeout=None, **kwargs):
+        raise requests.exceptions.ReadTimeout(f"read timed out ({timeout})")
+
+    client.session.get = fake_get
+    for _ in range(3):
+        with deadline_scope(0.5):
+            with pytest.raises(requests.exceptions.ReadTimeout):
+                client.get("https://newsapi.org/v2/everything")
+    assert breaker.state == CLOSED
+
+    with pytest.raises(requests.exceptions.ReadTimeout):
+        client.get("https://newsapi.org/v2/everything")
+    assert breaker.state == OPEN
+
+
+def test_agent_skipped_when_its_sources_are_down():
+    """With every data source open the agent is not run and a note stands in for its evidence"""
+    verifier = FactVerifier()
+    verifier.evidence_prefetcher.prefetch = lambda agent_name, claim: ""
+    ran = []
+
+    class FakePipeline:
+        def gather_evidence(self, agent_name, claim, prefetched_evidence=""):
+            ran.append(agent_name)
+            return f"{agent_name} evidence"
+
+    verifier._pipeline = lambda: FakePipeline()
+    breaker = get_breaker("alpha_vantage")
+    for _ in range(breaker.failure_threshold):
+        breaker.record_failure()
+
+    try:
+        routing = RoutingDecision(intent="mixed", time_sensitive=True,
+                                  required_agents=["finance_agent", "news_agent"], reasoning="test")
+        evidence = verifier._collect_evidence("Gold prices rose today", routing)
+    finally:
+        breaker.record_success()
+
+    assert ran == ["news_agent"]
+    assert evidence["finance_agent"].startswith("Source unavailable: Alpha Vantage")
+    assert evidence["news_agent"] == "news_agent evidence"
+    print("✓ Finance agent skipped while Alpha Vantage is down")
+
+
+if __name__ == "__main__":
+    test_opens_after_threshold_and_fails_fast()
+    test_success_resets_failure_count()
+    test_slow_calls_trip_the_breaker()
+    test_half_open_probe_recovers_or_reopens()
+    test_http_client_guards_known_hosts()
+    test_agent_skipped_when_its_sources_are_down()
+
+    print("\n✅ All circuit breaker tests passed!")
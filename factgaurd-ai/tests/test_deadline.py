@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Test Request Deadline Propagation
+"""
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+import requests
+from core.bounded_executor import BoundedExecutor
+from core.deadline import DeadlineExceeded, current_deadline, deadline_scope, in_context, remaining_or
+from core.evidence_collector import EvidenceCollector
+from core.http_client import HttpClient
+from fact_verifier import CONSENSUS_UNFINISHED, FactVerifier
+from schemas.claim_schema import RoutingDecision
+
+
+def test_nested_scope_never_extends():
+    """An inner scope can shorten the budget but not lengthen it"""
+    assert current_deadline() is None
+    assert remaining_or(30) == 30
+
+    with deadline_scope(5) as outer:
+        with deadline_scope(60) as inner:
+            assert inner.expires_at == outer.expires_at
+            assert inner.remaining() <= 5
+        assert current_deadline() is outer
+        assert remaining_or(30, reserve=2) <= 3
+    assert current_deadline() is None
+
+
+def test_deadline_crosses_thread_pools():
+    """Worker threads see the submitting request's deadline"""
+    with deadline_scope(10) as deadline:
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            assert pool.submit(in_context(current_deadline)).result() is deadline
+            assert pool.submit(current_deadline).result() is None
+
+        executor = BoundedExecutor(max_workers=1, max_queue=0)
+        assert asyncio.run(_run(executor)) is deadline
+
+
+async def _run(executor):
+    return await executor.run(current_deadline)
+
+
+def test_http_timeouts_shrink_to_remaining_budget():
+    """Tool calls get the smaller of their own timeout and the time left"""
+    client = HttpClient(pool_connections=1, pool_maxsize=1, max_retries=0, backoff_factor=0,
+                        connect_timeout=5, read_timeout=30)
+    seen = []
+    client.session.get = lambda url, timeout=None, **kwargs: seen.append(timeout) or requests.Response()
+
+    client.get("https://newsapi.org/v2/everything")
+    with deadline_scope(2):
+        client.get("https://newsapi.org/v2/everything")
+
+    assert seen[0] == (5, 30)
+    assert seen[1][0] <= 2 and seen[1][1] <= 2
+
+
+def test_http_call_refused_after_deadline():
+    """No upstream call is started once the budget is spent"""
+    client = HttpClient(pool_connections=1, pool_maxsize=1, max_retries=0, backoff_factor=0,
+                        connect_timeout=5, read_timeout=30)
+    client.session.get = lambda *args, **kwargs: pytest.fail("request should not be sent")
+
+    with deadline_scope(0):
+        with pytest.raises(DeadlineExceeded):
+            client.get("https://serpapi.com/search")
+    print("✓ Expired deadline short-circuits tool calls")
+
+
+def test_collector_uses_remaining_budget():
+    """A per-call timeout overrides the collector's static agent timeout"""
+    collector = EvidenceCollector(agent_timeout=120)
+    start = time.monotonic()
+    results = collector.collect({"news_agent": lambda: time.sleep(1) or "late"}, timeout=0.1)
+
+    assert results[0]["status"] == "timeout"
+    assert time.monotonic() - start < 0.5
+
+
+def test_agents_skipped_without_budget():
+    """With only the consensus reserve left, evidence agents are not started"""
+    verifier = FactVerifier()
+
+    class FakePipeline:
+        def gather_evidence(self, *args):
+            pytest.fail("agents should not run")
+
+    verifier._pipeline = lambda: FakePipeline()
+    routing = RoutingDecision(intent="finance", time_sensitive=True,
+                              required_agents=["finance_agent"], reasoning="test")
+
+    with deadline_scope(1):
+        assert verifier._collect_evidence("Gold prices rose today", routing) == {}
+
+
+def test_consensus_not_retried_after_deadline():
+    """An invalid verdict is not retried once the deadline has passed"""
+    verifier = FactVerifier()
+    calls = []
+
+    class FakePipeline:
+        def build_consensus(self, *args):
+            calls.append(args)
+            time.sleep(0.05)
+            return "not json"
+
+    verifier._pipeline = lambda: FakePipeline()
+    routing = RoutingDecision(intent="general", time_sensitive=False, required_agents=[], reasoning="test")
+
+    with deadline_scope(0.03):
+        verdict, _ = verifier._build_verdict("Water boils at 100C", routing, "")
+
+    assert verdict is None
+    assert len(calls) == 1
+
+
+def test_slow_planner_falls_back_to_rules():
+    """A planner still running at the deadline is abandoned for rule-based routing"""
+    verifier = FactVerifier()
+
+    class FakePipeline:
+        def plan(self, claim):
+            time.sleep(1)
+            return "INTENT: finance"
+
+    verifier._pipeline = lambda: FakePipeline()
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("fact_verifier.config.DEADLINE_CONSENSUS_RESERVE", 0)
+        mp.setattr("fact_verifier.config.DEADLINE_PLANNER_MIN", 0)
+        start = time.monotonic()
+        with deadline_scope(0.2):
+            routing = verifier._plan("The Eiffel Tower is located in Berlin")
+
+    assert routing.reasoning.startswith("Rule-based fast path")
+    assert time.monotonic() - start < 0.5
+
+
+def test_slow_consensus_bounded_by_deadline():
+    """A hung consensus crew cannot hold the request past its deadline"""
+    verifier = FactVerifier()
+
+    class FakePipeline:
+        def build_consensus(self, *args):
+            time.sleep(1)
+            return "{}"
+
+    verifier._pipeline = lambda: FakePipeline()
+    routing = RoutingDecision(intent="general", time_sensitive=False, required_agents=[], reasoning="test")
+
+    start = time.monotonic()
+    with deadline_scope(0.2):
+        verdict, raw = verifier._build_verdict("Water boils at 100C", routing, "")
+
+    assert verdict is None
+    assert raw == CONSENSUS_UNFINISHED
+    assert time.monotonic() - start < 0.5
+    assert "CANNOT VERIFY" in verifier._format_final_output(raw, routing, [])
+
+
+if __name__ == "__main__":
+    test_nested_scope_never_extends()
+    test_deadline_crosses_thread_pools()
+    test_http_timeouts_shrink_to_remaining_budget()
+    test_http_call_refused_after_deadline()
+    test_collector_uses_remaining_budget()
+    test_agents_skipped_without_budget()
+    test_consensus_not_retried_after_deadline()
+    test_slow_planner_falls_back_to_rules()
+    test_slow_consensus_bounded_by_deadline()
+
+    print("\n✅ All deadline tests passed!")
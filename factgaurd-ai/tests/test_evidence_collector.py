@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Test Concurrent Evidence Collection
+"""
+import time
+from core.evidence_collector import EvidenceCollector
+
+
+def _slow_job(text, delay):
+    def job():
+        time.sleep(delay)
+        return text
+    return job
+
+
+def test_agents_run_concurrently():
+    """Wall-clock time should track the slowest agent, not the sum"""
+    collector = EvidenceCollector(agent_timeout=5)
+
+    start = time.monotonic()
+    results = collector.collect({
+        "finance_agent": _slow_job("finance evidence", 0.3),
+        "news_agent": _slow_job("news evidence", 0.3),
+    })
+    elapsed = time.monotonic() - start
+
+    print(f"✓ Two 0.3s agents finished in {elapsed:.2f}s")
+    assert elapsed < 0.55
+    assert [r["agent"] for r in results] == ["finance_agent", "news_agent"]
+    assert all(r["status"] == "ok" for r in results)
+    assert results[0]["evidence"] == "finance evidence"
+
+
+def test_deadline_drops_slow_agent():
+    """An agent exceeding its deadline is skipped, others are kept"""
+    collector = EvidenceCollector(agent_timeout=0.2)
+
+    start = time.monotonic()
+    results = collector.collect({
+        "finance_agent": _slow_job("finance evidence", 0.05),
+        "news_agent": _slow_job("news evidence", 2),
+    })
+    elapsed = time.monotonic() - start
+
+    print(f"✓ Collection returned after {elapsed:.2f}s")
+    assert elapsed < 1
+    assert results[0]["status"] == "ok"
+    assert results[1]["status"] == "timeout"
+    assert results[1]["evidence"] == ""
+
+
+def test_agent_error_is_isolated():
+    """A failing agent does not discard evidence from the others"""
+    def broken():
+        raise RuntimeError("tool loop crashed")
+
+    collector = EvidenceCollector(agent_timeout=5)
+    results = collector.collect({
+        "finance_agent": broken,
+        "news_agent": _slow_job("news evidence", 0),
+    })
+
+    assert results[0]["status"] == "error"
+    assert results[1]["status"] == "ok"
+    assert results[1]["evidence"] == "news evidence"
+    print("✓ Error in one agent isolated")
+
+
+def test_results_reported_as_they_arrive():
+    """on_result fires in completion order, return value keeps job order"""
+    arrived = []
+    collector = EvidenceCollector(agent_timeout=5)
+
+    results = collector.collect({
+        "finance_agent": _slow_job("finance evidence", 0.2),
+        "news_agent": _slow_job("news evidence", 0.01),
+    }, on_result=lambda item: arrived.append(item["agent"]))
+
+    assert arrived == ["news_agent", "finance_agent"]
+    assert [r["agent"] for r in results] == ["finance_agent", "news_agent"]
+    print("✓ Evidence streamed in arrival order")
+
+
+def test_no_jobs():
+    """No required agents means no evidence"""
+    assert EvidenceCollector(agent_timeout=5).collect({}) == []
+
+
+if __name__ == "__main__":
+    test_agents_run_concurrently()
+    test_deadline_drops_slow_agent()
+    test_agent_error_is_isolated()
+    test_results_reported_as_they_arrive()
+    test_no_jobs()
+
+    print("\n✅ All evidence collector tests passed!")
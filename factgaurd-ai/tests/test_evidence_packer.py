@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Test Relevance-Ranked Evidence Packing
+"""
+from datetime import datetime
+from core.evidence_packer import EvidencePacker, estimate_tokens
+
+
+NOW = datetime(2024, 6, 10)
+CLAIM = "Gold price rose above 2300 dollars per ounce"
+
+FINANCE_OUTPUT = """Market data for GLD (SPDR Gold Shares):
+
+- Price: ₹25,000 (USD $300.50), latest trading day 2024-06-07
+- Change percent: +1.2%
+
+Gold spot price closed at 2310 dollars per ounce on 2024-06-07, source: Alpha Vantage."""
+
+NEWS_OUTPUT = """Search summary for the claim.
+
+1. Reuters (June 8, 2024): Gold price rose above 2300 dollars an ounce as the dollar weakened.
+2. Random blog: Ten tips for buying jewellery this wedding season, with unrelated advice on gift wrapping and store discounts.
+3. Unrelated: The city council met to discuss parking permits and road repairs near the old market square."""
+
+
+def test_every_agent_represented_under_tight_budget():
+    """A small budget still keeps the best snippet from each agent"""
+    packer = EvidencePacker(token_budget=60)
+    selected = packer.select(CLAIM, {"finance_agent": FINANCE_OUTPUT, "news_agent": NEWS_OUTPUT}, now=NOW)
+
+    agents = {s["agent"] for s in selected}
+    assert agents == {"finance_agent", "news_agent"}
+    assert sum(s["tokens"] for s in selected) <= 60
+    print(f"✓ Kept {len(selected)} snippets from {sorted(agents)}")
+
+
+def test_relevant_trusted_snippets_win():
+    """The Reuters line outranks unrelated filler from the same agent"""
+    packer = EvidencePacker(token_budget=500)
+    snippets = packer.split("news_agent", NEWS_OUTPUT)
+    claim_terms = {"gold", "price", "rose", "above", "2300", "dollars", "ounce"}
+    scores = {s["text"][:12]: packer.score(s, claim_terms, False, NOW) for s in snippets}
+
+    reuters = next(v for k, v in scores.items() if "Reuters" in k)
+    assert all(reuters > v for k, v in scores.items() if "Reuters" not in k)
+    print("✓ Reuters snippet ranked first")
+
+
+def test_trust_matches_whole_names_and_hosts():
+    """Short outlet names do not match inside other words; domains match by host suffix"""
+    packer = EvidencePacker(token_budget=500)
+
+    assert packer._trust("Baptist Herald", "Church news") == 0.4
+    assert packer._trust("News search", "Several options and one exception were discussed") == 0.4
+    assert packer._trust("PTI", "") == 1.0
+    assert packer._trust("uk.reuters.com", "") == 1.0
+    assert packer._trust("News search", "Details at https://www.bbc.co.uk/news/123") == 0.8
+    assert packer._trust("reuters.com.example.net", "") == 0.4
+    assert packer._trust("data.census.gov", "") == 1.0
+
+
+def test_snippets_are_attributed():
+    """Snippets carry the cited source, or the agent's default source"""
+    packer = EvidencePacker(token_budget=500)
+    finance = packer.split("finance_agent", FINANCE_OUTPUT)
+    news = packer.split("news_agent", NEWS_OUTPUT)
+
+    assert finance[0]["source"] == "Alpha Vantage"
+    assert any(s["source"] == "Alpha Vantage" and "2310" in s["text"] for s in finance)
+    assert news[0]["source"] == "News search"
+    assert news[1]["source"] == "Reuters"
+    print("✓ Sources attributed")
+
+
+def test_pack_respects_budget_and_groups_by_agent():
+    """Packed text fits the budget and lists agents in collection order"""
+    long_output = "\n\n".join(f"Paragraph {i} about gold prices rising this week on strong demand." for i in range(50))
+    packer = EvidencePacker(token_budget=120)
+    packed = packer.pack(CLAIM, {"finance_agent": FINANCE_OUTPUT, "news_agent": long_output}, now=NOW)
+
+    assert estimate_tokens(packed) <= 120 + 10
+    assert packed.index("finance_agent:") < packed.index("news_agent:")
+    assert "[Alpha Vantage]" in packed
+    print(f"✓ Packed {len(packed)} chars")
+
+
+def test_recency_matters_for_time_sensitive_claims():
+    """Fresh evidence outranks stale evidence when the claim is time-sensitive"""
+    packer = EvidencePacker(token_budget=500)
+    fresh = {"agent": "news_agent", "source": "Reuters", "text": "Gold rose above 2300 on 2024-06-09"}
+    stale = {"agent": "news_agent", "source": "Reuters", "text": "Gold rose above 2300 on 2020-06-09"}
+    terms = {"gold", "rose", "above", "2300"}
+
+    assert packer.score(fresh, terms, True, NOW) > packer.score(stale, terms, True, NOW)
+
+
+def test_no_evidence():
+    """Empty evidence falls back to the previous placeholder text"""
+    assert EvidencePacker(token_budget=100).pack(CLAIM, {}) == "No specific evidence gathered."
+
+
+if __name__ == "__main__":
+    test_every_agent_represented_under_tight_budget()
+    test_relevant_trusted_snippets_win()
+    test_trust_matches_whole_names_and_hosts()
+    test_snippets_are_attributed()
+    test_pack_respects_budget_and_groups_by_agent()
+    test_recency_matters_for_time_sensitive_claims()
+    test_no_evidence()
+
+    print("\n✅ All evidence packer tests passed!")
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Test Direct Evidence Prefetch
+"""
+import time
+from core.evidence_prefetch import EvidencePrefetcher
+from core.verification_pipeline import VerificationPipeline
+from fact_verifier import FactVerifier
+from schemas.claim_schema import RoutingDecision
+
+
+def _prefetcher(delay=0.0, calls=None):
+    calls = [] if calls is None else calls
+
+    def lookup(query):
+        calls.append(query)
+        time.sleep(delay)
+        return f"{{'symbol': '{query}', 'price': '100'}}"
+
+    return EvidencePrefetcher(finance_lookup=lookup, news_sweep=lambda claim: f"Sweep for {claim}"), calls
+
+
+def test_finance_queries_from_claim():
+    """Commodities, tickers, pairs and currency names become fetcher queries"""
+    prefetcher, _ = _prefetcher()
+
+    assert prefetcher.finance_queries("Gold and silver prices rose today") == ["GOLD", "SILVER"]
+    assert prefetcher.finance_queries("Tesla stock hit a record high") == ["TSLA"]
+    assert prefetcher.finance_queries("USD/INR crossed 84 this week") == ["USD/INR"]
+    assert prefetcher.finance_queries("The rupee fell against the dollar") == ["USD/INR"]
+    assert prefetcher.finance_queries("Inflation is high") == []
+
+
+def test_finance_lookups_run_in_parallel():
+    """Several instruments are fetched concurrently"""
+    prefetcher, calls = _prefetcher(delay=0.2)
+
+    start = time.monotonic()
+    text = prefetcher.prefetch("finance_agent", "Gold, silver and oil prices all fell")
+    elapsed = time.monotonic() - start
+
+    print(f"✓ 3 lookups took {elapsed:.2f}s")
+    assert sorted(calls) == ["GOLD", "OIL", "SILVER"]
+    assert elapsed < 0.5
+    assert "[GOLD]" in text and "[OIL]" in text
+
+
+def test_prefetch_failure_is_empty():
+    """A failing tool leaves the agent to fetch for itself"""
+    def broken(_):
+        raise RuntimeError("quota exceeded")
+
+    prefetcher = EvidencePrefetcher(finance_lookup=broken, news_sweep=broken)
+    assert prefetcher.prefetch("finance_agent", "Gold prices rose") == ""
+    assert prefetcher.prefetch("news_agent", "RBI cut rates") == ""
+
+
+def test_prefetched_evidence_reaches_agent_task():
+    """The evidence crew's task description carries the prefetched results"""
+    pipeline = VerificationPipeline()
+    crew = pipeline.evidence_crews["finance_agent"]
+    crew._interpolate_inputs({"claim": "Gold prices rose", "prefetched_evidence": "[GOLD] price 2400"})
+
+    assert "[GOLD] price 2400" in crew.tasks[0].description
+
+
+def test_collect_evidence_injects_prefetch():
+    """FactVerifier hands each agent its own prefetched evidence"""
+    verifier = FactVerifier()
+    verifier.evidence_prefetcher, _ = _prefetcher()
+    received = {}
+
+    class FakePipeline:
+        def gather_evidence(self, agent_name, claim, prefetched_evidence=""):
+            received[agent_name] = prefetched_evidence
+            return f"{agent_name} evidence"
+
+    verifier._pipeline = lambda: FakePipeline()
+    routing = RoutingDecision(intent="mixed", time_sensitive=True,
+                              required_agents=["finance_agent", "news_agent"], reasoning="test")
+    evidence = verifier._collect_evidence("Gold prices rose after the RBI announcement", routing)
+
+    assert set(evidence) == {"finance_agent", "news_agent"}
+    assert received["finance_agent"].startswith("[GOLD]")
+    assert received["news_agent"] == "Sweep for Gold prices rose after the RBI announcement"
+    print("✓ Prefetched evidence injected per agent")
+
+
+if __name__ == "__main__":
+    test_finance_queries_from_claim()
+    test_finance_lookups_run_in_parallel()
+    test_prefetch_failure_is_empty()
+    test_prefetched_evidence_reaches_agent_task()
+    test_collect_evidence_injects_prefetch()
+
+    print("\n✅ All evidence prefetch tests passed!")
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Test Concurrent Evidence Sweep
+"""
+import asyncio
+import time
+from tools.evidence_sweep import EvidenceSweepTool
+from tools.news_api import NewsAPITool
+from tools.serp_api import SerpAPITool
+
+
+class FakeNews(NewsAPITool):
+    def __init__(self, delay=0.2):
+        self.delay = delay
+
+    def search_news(self, query, **kwargs):
+        time.sleep(self.delay)
+        return [{"title": "RBI holds repo rate", "url": "https://www.reuters.com/rbi-rate/",
+                 "source": "Reuters", "published_at": "2024-06-07", "description": "RBI kept rates at 6.5%"}]
+
+
+class FakeSerp(SerpAPITool):
+    def __init__(self, delay=0.2, fail_news=False):
+        self.delay = delay
+        self.fail_news = fail_news
+
+    def google_search(self, query, num_results=5, time_period=None):
+        time.sleep(self.delay)
+        if query.startswith("fact check"):
+            return [{"title": "Fact check: RBI rate", "link": "https://factcheck.example.org/rbi",
+                     "snippet": "True", "source": "Example Fact Check"}]
+        return [{"title": "RBI holds repo rate", "link": "http://reuters.com/rbi-rate?utm=x",
+                 "snippet": "", "source": "reuters.com"},
+                {"title": "RBI policy explained", "link": "https://blog.example.com/rbi", "snippet": "..."}]
+
+    def search_news(self, query, num_results=5):
+        time.sleep(self.delay)
+        if self.fail_news:
+            raise RuntimeError("SerpAPI down")
+        return [{"error": "No news results found"}]
+
+
+CLAIM = "RBI kept the repo rate at 6.5 percent"
+
+
+def test_channels_run_concurrently():
+    """Four 0.2s searches finish in about the time of one"""
+    sweep = EvidenceSweepTool(FakeNews(), FakeSerp())
+
+    start = time.monotonic()
+    results = sweep.sweep(CLAIM)
+    elapsed = time.monotonic() - start
+
+    print(f"✓ 4 channels took {elapsed:.2f}s")
+    assert elapsed < 0.5
+    assert results
+
+
+def test_results_are_merged_and_ranked():
+    """The same article from NewsAPI and Google becomes one result, listed first"""
+    results = EvidenceSweepTool(FakeNews(delay=0), FakeSerp(delay=0)).sweep(CLAIM)
+    urls = [r["url"] for r in results]
+
+    assert len(results) == 3
+    assert results[0]["found_by"] == ["newsapi", "google"]
+    assert results[0]["date"] == "2024-06-07"
+    assert results[0]["snippet"] == "RBI kept rates at 6.5%"
+    assert "https://factcheck.example.org/rbi" in urls
+    print("✓ Duplicate article merged")
+
+
+def test_failed_channel_does_not_fail_sweep():
+    """An exception in one channel only drops that channel"""
+    results = EvidenceSweepTool(FakeNews(delay=0), FakeSerp(delay=0, fail_news=True)).sweep(CLAIM)
+    assert len(results) == 3
+
+
+def test_sweep_inside_running_loop():
+    """The blocking wrapper also works when called from async code"""
+    sweep = EvidenceSweepTool(FakeNews(delay=0), FakeSerp(delay=0))
+
+    async def caller():
+        return sweep.sweep(CLAIM)
+
+    assert len(asyncio.run(caller())) == 3
+
+
+def test_format_results():
+    """Formatted output lists each unique result once with its channels"""
+    sweep = EvidenceSweepTool(FakeNews(delay=0), FakeSerp(delay=0))
+    text = sweep.format_results(CLAIM, sweep.sweep(CLAIM))
+
+    assert text.count("RBI holds repo rate") == 1
+    assert "Found by: newsapi, google" in text
+    assert sweep.format_results(CLAIM, []).startswith("No news")
+
+
+if __name__ == "__main__":
+    test_channels_run_concurrently()
+    test_results_are_merged_and_ranked()
+    test_failed_channel_does_not_fail_sweep()
+    test_sweep_inside_running_loop()
+    test_format_results()
+
+    print("\n✅ All evidence sweep tests passed!")
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Test HTML Extraction Backends
+"""
+import pytest
+import core.html_extractor as html_extractor
+from core.html_extractor import HAS_LXML, LxmlExtractor, SoupExtractor, get_extractor
+
+needs_lxml = pytest.mark.skipif(not HAS_LXML, reason="lxml not installed")
+
+PARAGRAPH = "<p>Gold prices <b>rose</b> two percent after the rate cut.</p>"
+
+PAGES = {
+    "article": f"""<html><head><title> Gold rallies </title><script>var x = 1;</script></head>
+        <body><header><nav>Home Markets</nav></header>
+        <article><h1>Gold rallies</h1>{PARAGRAPH}<aside>Related: oil</aside> Reporting by Reuters</article>
+        <p>Comments</p><footer>Privacy</footer></body></html>""",
+    "nested articles": f"<html><body><article>{PARAGRAPH}<article>Inner</article> Outer tail</article></body></html>",
+    "selector priority": f"""<html><body><div class="sidebar content">Sidebar</div>
+        <div role="main">Main region {PARAGRAPH}</div></body></html>""",
+    "id selector": f'<html><body><div id="content">By id</div><div class="article-body">{PARAGRAPH}</div></body></html>',
+    "empty container": f'<html><body><main><script>x</script></main>{PARAGRAPH}<p>Second <i>para</i></p></body></html>',
+    "paragraphs": f"<html><body><div>{PARAGRAPH}<!-- note --><p>Next</p></div></body></html>",
+    "no title": "<html><body><p>Only text</p></body></html>",
+    "empty": "",
+}
+
+
+@needs_lxml
+@pytest.mark.parametrize("name", list(PAGES))
+def test_lxml_matches_soup(name):
+    """The single-pass walk extracts the same title and text as the BeautifulSoup backend"""
+    html = PAGES[name]
+    assert LxmlExtractor().extract(html) == SoupExtractor().extract(html)
+    assert LxmlExtractor().extract(html.encode()) == SoupExtractor().extract(html.encode())
+
+
+@needs_lxml
+def test_boilerplate_skipped():
+    """Scripts, navigation and asides never reach the extracted text"""
+    title, text = LxmlExtractor().extract(PAGES["article"])
+
+    assert title == "Gold rallies"
+    assert text == "Gold rallies Gold prices rose two percent after the rate cut. Reporting by Reuters"
+    print("✓ Boilerplate subtrees skipped")
+
+
+@needs_lxml
+def test_bytes_use_meta_charset():
+    """Undecoded bodies are decoded from the page's <meta charset>"""
+    html = '<html><head><meta charset="windows-1252"><title>Café</title></head><body><p>x</p></body></html>'
+    assert LxmlExtractor().extract(html.encode("cp1252"))[0] == "Café"
+
+
+def test_backend_selection(monkeypatch):
+    """'auto' prefers lxml, and a missing lxml falls back to BeautifulSoup"""
+    assert isinstance(get_extractor("soup"), SoupExtractor)
+    assert isinstance(get_extractor("auto"), LxmlExtractor if HAS_LXML else SoupExtractor)
+
+    monkeypatch.setattr(html_extractor, "HAS_LXML", False)
+    assert isinstance(get_extractor("lxml"), SoupExtractor)
+    with pytest.raises(ValueError):
+        get_extractor("regex")
+
+
+if __name__ == "__main__":
+    print("Run with: python -m pytest tests/test_html_extractor.py -v")
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Test HTTP Record/Replay Cassette
+"""
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+
+from core.http_cassette import Cassette, CassetteMiss, install_httpx
+from core.http_client import HttpClient
+
+
+class Handler(BaseHTTPRequestHandler):
+    calls = 0
+
+    def _reply(self, payload: dict):
+        Handler.calls += 1
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        self._reply({"path": self.path, "call": Handler.calls})
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        self._reply({"echo": json.loads(self.rfile.read(length)), "call": Handler.calls})
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    Handler.calls = 0
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _client(cassette):
+    return HttpClient(pool_connections=1, pool_maxsize=1, max_retries=0, backoff_factor=0,
+                      connect_timeout=1, read_timeout=1, cassette=cassette)
+
+
+def test_tool_traffic_replays_without_network(server, tmp_path):
+    """Exchanges recorded through HttpClient are served from the cassette on replay"""
+    path = str(tmp_path / "tools.json")
+    recorded = _client(Cassette(path, "record")).get(f"{server}/query", params={"symbol": "XAU", "apikey": "live"})
+
+    # A different key is still the same request once credentials are stripped
+    replayed = _client(Cassette(path, "replay")).get(f"{server}/query", params={"apikey": "other", "symbol": "XAU"})
+
+    assert Handler.calls == 1
+    assert replayed.status_code == 200
+    assert replayed.json() == recorded.json()
+    assert replayed.headers["Content-Type"] == "application/json"
+    print("✓ Tool response replayed offline")
+
+
+def test_secrets_are_not_written(server, tmp_path):
+    """API keys never reach the cassette file"""
+    path = tmp_path / "tools.json"
+    _client(Cassette(str(path), "record")).get(f"{server}/search", params={"q": "gold", "api_key": "s3cret"})
+
+    request = json.loads(path.read_text(encoding="utf-8"))["interactions"][0]["request"]
+    assert request["url"] == f"{server}/search?q=gold"
+
+
+def test_replay_miss_raises(tmp_path):
+    """An unrecorded request fails like a connection error instead of going live"""
+    path = str(tmp_path / "empty.json")
+    Cassette(path, "record")._save()
+    cassette = Cassette(path, "replay")
+
+    with pytest.raises(CassetteMiss):
+        _client(cassette).get("http://127.0.0.1:9/never-recorded")
+    assert cassette.stats()["misses"] == 1
+
+
+def test_repeated_requests_cycle_in_order(server, tmp_path):
+    """Identical requests replay their recordings in order and wrap around"""
+    path = str(tmp_path / "repeat.json")
+    recorder = _client(Cassette(path, "record"))
+    first = recorder.get(f"{server}/quote").json()
+    second = recorder.get(f"{server}/quote").json()
+
+    player = _client(Cassette(path, "replay"))
+    replayed = [player.get(f"{server}/quote").json() for _ in range(3)]
+
+    assert replayed == [first, second, first]
+
+
+def test_llm_traffic_through_httpx(server, tmp_path):
+    """POST bodies (LLM prompts) are matched by content on replay"""
+    path = str(tmp_path / "llm.json")
+    try:
+        install_httpx(Cassette(path, "record"))
+        with httpx.Client() as client:
+            live = client.post(f"{server}/v1/chat/completions", json={"model": "m", "messages": ["a"]}).json()
+            client.post(f"{server}/v1/chat/completions", json={"model": "m", "messages": ["b"]})
+
+        install_httpx(Cassette(path, "replay"))
+        with httpx.Client() as client:
+            replayed = client.post(f"{server}/v1/chat/completions", json={"messages": ["a"], "model": "m"}).json()
+    finally:
+        install_httpx(None)
+
+    assert Handler.calls == 2
+    assert replayed == live
+    print("✓ LLM exchange replayed by prompt")
+
+
+def test_changed_body_is_a_miss_unless_opted_in(server, tmp_path):
+    """A prompt that was never recorded does not get another prompt's reply by default"""
+    path = str(tmp_path / "drift.json")
+    recorder = _client(Cassette(path, "record"))
+    recorded = recorder.session.post(f"{server}/v1/chat/completions", json={"messages": ["a"]}).json()
+
+    strict = Cassette(path, "replay")
+    with pytest.raises(CassetteMiss):
+        _client(strict).session.post(f"{server}/v1/chat/completions", json={"messages": ["changed"]})
+    assert strict.stats()["misses"] == 1
+    assert strict.stats()["body_mismatches"] == 1
+
+    loose = Cassette(path, "replay", match_any_body=True)
+    assert _client(loose).session.post(f"{server}/v1/chat/completions", json={"messages": ["changed"]}).json() == recorded
+    assert loose.stats()["hits"] == 1
+    assert loose.stats()["body_mismatches"] == 1
+
+
+if __name__ == "__main__":
+    print("Run with: python -m pytest tests/test_http_cassette.py -v")
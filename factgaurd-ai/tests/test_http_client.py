@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Test Pooled HTTP Client
+"""
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from core.deadline import deadline_scope
+from core.http_client import HttpClient, parse_host_timeouts, parse_retry_after
+from tools.alpha_vantage import AlphaVantageTool
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.requests += 1
+            server.peers.add(self.client_address)
+            status = server.statuses.pop(0) if server.statuses else 200
+        body = json.dumps({"Global Quote": {"01. symbol": "TSLA", "05. price": "200.00"}}).encode()
+        self.send_response(status)
+        if status != 200 and server.retry_after:
+            self.send_header("Retry-After", server.retry_after)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def _start_server(statuses=None, retry_after=None):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    server.retry_after = retry_after
+    server.lock = threading.Lock()
+    server.requests = 0
+    server.peers = set()
+    server.statuses = list(statuses or [])
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}/query"
+
+
+def _client(**overrides):
+    settings = dict(pool_connections=2, pool_maxsize=4, max_retries=2, backoff_factor=0,
+                    connect_timeout=2, read_timeout=5)
+    settings.update(overrides)
+    return HttpClient(**settings)
+
+
+def test_connections_are_reused():
+    """Sequential calls to one host share a single keep-alive connection"""
+    server, url = _start_server()
+    client = _client()
+    try:
+        for _ in range(5):
+            assert client.get(url).status_code == 200
+    finally:
+        client.close()
+        server.shutdown()
+
+    print(f"✓ {server.requests} requests over {len(server.peers)} connection(s)")
+    assert server.requests == 5
+    assert len(server.peers) == 1
+
+
+def test_retries_server_errors():
+    """429/5xx responses are retried until a success"""
+    server, url = _start_server(statuses=[503, 429])
+    client = _client()
+    try:
+        response = client.get(url)
+    finally:
+        client.close()
+        server.shutdown()
+
+    assert response.status_code == 200
+    assert server.requests == 3
+    print("✓ Recovered after 503 and 429")
+
+
+def test_exhausted_retries_return_last_response():
+    """When retries run out the final error response is returned, not raised"""
+    server, url = _start_server(statuses=[500, 500, 500, 500])
+    client = _client(max_retries=1)
+    try:
+        response = client.get(url)
+    finally:
+        client.close()
+        server.shutdown()
+
+    assert response.status_code == 500
+    assert server.requests == 2
+
+
+def test_retry_after_honoured():
+    """A Retry-After wait is observed before retrying"""
+    server, url = _start_server(statuses=[503], retry_after="1")
+    client = _client()
+    try:
+        start = time.monotonic()
+        response = client.get(url)
+        elapsed = time.monotonic() - start
+    finally:
+        client.close()
+        server.shutdown()
+
+    assert response.status_code == 200
+    assert elapsed >= 1
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after("soon") is None
+
+
+def test_retries_stop_at_the_deadline():
+    """Backoff and Retry-After waits that would outlast the deadline end the retries"""
+    server, url = _start_server(statuses=[503] * 10, retry_after="30")
+    slow_backoff, slow_url = _start_server(statuses=[503] * 10)
+    client = _client(backoff_factor=1)
+    try:
+        start = time.monotonic()
+        with deadline_scope(1):
+            assert client.get(url).status_code == 503
+            assert server.requests == 1
+
+            # First retry is immediate, the next would back off 2s
+            assert client.get(slow_url).status_code == 503
+        elapsed = time.monotonic() - start
+    finally:
+        client.close()
+        server.shutdown()
+        slow_backoff.shutdown()
+
+    assert slow_backoff.requests == 2
+    assert elapsed < 0.5
+
+
+def test_per_host_timeouts():
+    """Host overrides apply to the read timeout only"""
+    client = _client(host_timeouts=parse_host_timeouts("www.alphavantage.co=15, serpapi.com=20"))
+
+    assert client.timeout_for("https://www.alphavantage.co/query?x=1") == (2, 15.0)
+    assert client.timeout_for("https://serpapi.com/search") == (2, 20.0)
+    assert client.timeout_for("https://example.com/article") == (2, 5)
+
+
+def test_tool_uses_injected_client():
+    """Tools send their requests through the client they are given"""
+    server, url = _start_server()
+    client = _client()
+    tool = AlphaVantageTool(http_client=client)
+    tool.api_key = "test"
+    tool.base_url = url
+    try:
+        quote = tool.get_stock_quote("TSLA")
+        tool.get_stock_quote("TSLA")
+    finally:
+        client.close()
+        server.shutdown()
+
+    assert quote["symbol"] == "TSLA"
+    assert len(server.peers) == 1
+    print("✓ AlphaVantageTool reused the pooled connection")
+
+
+if __name__ == "__main__":
+    test_connections_are_reused()
+    test_retries_server_errors()
+    test_exhausted_retries_return_last_response()
+    test_retry_after_honoured()
+    test_retries_stop_at_the_deadline()
+    test_per_host_timeouts()
+    test_tool_uses_injected_client()
+
+    print("\n✅ All HTTP client tests passed!")
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Test Rule-based Fast-path Router
+"""
+from core.pre_router import find_instruments, pre_route
+from config import config
+
+
+def test_obvious_finance_claims_skip_planner():
+    """Commodity/ticker/currency + market wording routes to finance with high confidence"""
+    test_cases = [
+        "Is gold up today",
+        "Tesla stock fell 5% this week",
+        "$NVDA shares hit a record high",
+        "USD/INR exchange rate crossed 85",
+        "Silver price is above $30 per ounce",
+    ]
+
+    for claim in test_cases:
+        routing = pre_route(claim)
+        print(f"✓ {claim} → {routing.intent} ({routing.confidence:.2f}) {routing.required_agents}")
+        assert routing.intent == "finance"
+        assert routing.required_agents == ["finance_agent"]
+        assert routing.confidence >= config.FAST_ROUTE_MIN_CONFIDENCE
+
+
+def test_finance_with_news_is_mixed():
+    """Price movement tied to an announcement needs both agents"""
+    routing = pre_route("Apple shares jumped after the CEO announced record revenue")
+
+    assert routing.intent == "mixed"
+    assert set(routing.required_agents) == {"finance_agent", "news_agent"}
+    assert routing.confidence >= config.FAST_ROUTE_MIN_CONFIDENCE
+
+
+def test_time_sensitivity():
+    """Relative time words mark the claim time-sensitive"""
+    assert pre_route("Is gold up today").time_sensitive
+    assert pre_route("Bitcoin price dropped last week").time_sensitive
+    assert not pre_route("Gold price crossed $2000 per ounce in 2020").time_sensitive
+
+
+def test_ambiguous_claims_fall_back_to_planner():
+    """Claims without strong signals stay below the fast-path threshold"""
+    test_cases = [
+        "The Eiffel Tower is located in Berlin",
+        "Apple released a new phone",
+        "Water boils at 100 degrees Celsius at sea level",
+        "She won a gold medal",
+    ]
+
+    for claim in test_cases:
+        routing = pre_route(claim)
+        print(f"✓ {claim} → {routing.intent} ({routing.confidence:.2f})")
+        assert routing.confidence < config.FAST_ROUTE_MIN_CONFIDENCE
+
+
+def test_company_names_need_price_terms():
+    """Company names with only movement words are not market claims"""
+    test_cases = [
+        "Amazon rainforest fires hit a record high this year",
+        "Tesla opened up a new factory in Berlin",
+        "Google hit a record number of users",
+    ]
+
+    for claim in test_cases:
+        routing = pre_route(claim)
+        print(f"✓ {claim} → {routing.intent} ({routing.confidence:.2f}) {routing.required_agents}")
+        assert routing.confidence < config.FAST_ROUTE_MIN_CONFIDENCE
+        assert "finance_agent" not in routing.required_agents
+        assert find_instruments(claim) == []
+
+    assert find_instruments("Amazon fell 3% today") == ["AMZN"]
+
+
+def test_commodity_and_currency_words_need_price_terms():
+    """Commodity and currency words in non-market claims do not fast-route to finance"""
+    test_cases = [
+        "Oil spill hit the coast of Alaska",
+        "The euro 2024 final drew a record crowd",
+        "Copper wire theft rose in London last year",
+        "Neeraj won gold at the Olympics and set a record",
+    ]
+
+    for claim in test_cases:
+        routing = pre_route(claim)
+        print(f"✓ {claim} → {routing.intent} ({routing.confidence:.2f}) {routing.required_agents}")
+        assert routing.confidence < config.FAST_ROUTE_MIN_CONFIDENCE
+        assert "finance_agent" not in routing.required_agents
+        assert find_instruments(claim) == []
+
+    assert find_instruments("Is gold up today") == ["gold"]
+    assert find_instruments("The euro fell against the dollar") == ["euro"]
+    assert find_instruments("Apple hit $200") == ["AAPL"]
+
+
+def test_news_event_claims():
+    """Multiple event signals route to the news agent"""
+    routing = pre_route("The president announced that the minister resigned")
+
+    assert routing.intent == "news"
+    assert routing.required_agents == ["news_agent"]
+    assert routing.reasoning.startswith("Rule-based fast path")
+
+
+if __name__ == "__main__":
+    test_obvious_finance_claims_skip_planner()
+    test_finance_with_news_is_mixed()
+    test_time_sensitivity()
+    test_ambiguous_claims_fall_back_to_planner()
+    test_company_names_need_price_terms()
+    test_commodity_and_currency_words_need_price_terms()
+    test_news_event_claims()
+
+    print("\n✅ All pre-router tests passed!")
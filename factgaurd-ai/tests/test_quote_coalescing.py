@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Test Single-Flight Quote Coalescing and Market-Hours Quote Cache
+"""
+import threading
+import time
+from datetime import datetime
+import pytest
+from core.quote_cache import MARKET_TZ, QuoteCache, market_is_open, seconds_until_open
+from core.single_flight import SingleFlight
+from tools.alpha_vantage import AlphaVantageTool
+
+
+def _ny(year, month, day, hour, minute=0):
+    return datetime(year, month, day, hour, minute, tzinfo=MARKET_TZ)
+
+
+def _counting_tool(result=None, delay=0.1):
+    """AlphaVantageTool whose upstream request sleeps and counts calls"""
+    tool = AlphaVantageTool(quote_cache=QuoteCache(open_ttl=60, closed_ttl=60))
+    calls = []
+
+    def fake_request(symbol):
+        calls.append(symbol)
+        time.sleep(delay)
+        return dict(result or {"symbol": symbol, "price": "₹16,700.00 (USD $200.00)"})
+
+    tool._request_stock_quote = fake_request
+    return tool, calls
+
+
+def test_concurrent_callers_share_one_request():
+    """Ten simultaneous requests for one ticker make a single upstream call"""
+    tool, calls = _counting_tool()
+    results = []
+
+    def worker():
+        results.append(tool.get_stock_quote("tsla"))
+
+    threads = [threading.Thread(target=worker) for _ in range(10)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    print(f"✓ {len(results)} callers, {len(calls)} upstream call(s)")
+    assert calls == ["TSLA"]
+    assert all(r["symbol"] == "TSLA" for r in results)
+    # Each caller gets its own copy
+    results[0]["price"] = "changed"
+    assert results[1]["price"] != "changed"
+
+
+def test_cached_quote_skips_upstream():
+    """A second call within the TTL is served from the quote cache"""
+    tool, calls = _counting_tool(delay=0)
+    tool.get_stock_quote("AAPL")
+    tool.get_stock_quote("AAPL")
+
+    assert calls == ["AAPL"]
+    assert tool.quote_cache.stats()["hits"] == 1
+
+
+def test_errors_are_not_cached():
+    """Provider errors (e.g. throttling notes) are retried on the next call"""
+    tool, calls = _counting_tool(result={"error": "No data found for symbol XYZ"}, delay=0)
+    tool.get_stock_quote("XYZ")
+    tool.get_stock_quote("XYZ")
+
+    assert len(calls) == 2
+
+
+def test_single_flight_propagates_errors():
+    """Every waiting caller sees the leader's exception"""
+    flights = SingleFlight()
+    started = threading.Event()
+    errors = []
+
+    def failing():
+        started.set()
+        time.sleep(0.1)
+        raise RuntimeError("quota exceeded")
+
+    def follower():
+        started.wait()
+        try:
+            flights.do("XAU/USD", failing)
+        except RuntimeError as e:
+            errors.append(str(e))
+
+    thread = threading.Thread(target=follower)
+    thread.start()
+    with pytest.raises(RuntimeError):
+        flights.do("XAU/USD", failing)
+    thread.join()
+
+    assert errors == ["quota exceeded"]
+    assert flights.stats() == {"in_flight": 0, "leaders": 1, "shared": 1}
+
+
+def test_market_hours():
+    """Equities trade 9:30-16:00 ET on weekdays, forex Sunday 17:00 - Friday 17:00 ET"""
+    assert market_is_open("equity", _ny(2024, 6, 12, 10))        # Wednesday morning
+    assert not market_is_open("equity", _ny(2024, 6, 12, 17))    # Wednesday evening
+    assert not market_is_open("equity", _ny(2024, 6, 15, 12))    # Saturday
+    assert market_is_open("forex", _ny(2024, 6, 12, 23))         # Wednesday night
+    assert not market_is_open("forex", _ny(2024, 6, 16, 12))     # Sunday noon
+    assert market_is_open("forex", _ny(2024, 6, 16, 18))         # Sunday evening
+
+
+def test_closed_market_ttl_stops_at_next_open():
+    """Quotes cached before the open expire when trading starts"""
+    cache = QuoteCache(open_ttl=60, closed_ttl=3600)
+
+    assert seconds_until_open("equity", _ny(2024, 6, 14, 17)) == pytest.approx(((2 * 24) + 16.5) * 3600)
+    assert cache.ttl_for("equity", _ny(2024, 6, 12, 10)) == 60
+    assert cache.ttl_for("equity", _ny(2024, 6, 14, 20)) == 3600   # Friday night -> capped
+    assert cache.ttl_for("equity", _ny(2024, 6, 17, 9)) == 1800    # Monday 9:00 -> until 9:30
+
+
+if __name__ == "__main__":
+    test_concurrent_callers_share_one_request()
+    test_cached_quote_skips_upstream()
+    test_errors_are_not_cached()
+    test_single_flight_propagates_errors()
+    test_market_hours()
+    test_closed_market_ttl_stops_at_next_open()
+
+    print("\n✅ All quote coalescing tests passed!")
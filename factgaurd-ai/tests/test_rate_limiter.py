@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Test Shared Upstream Rate Limits
+"""
+import time
+from types import SimpleNamespace
+import pytest
+import requests
+from core.circuit_breaker import CircuitBreaker, CircuitOpenError
+from core.deadline import deadline_scope
+from core.http_client import HttpClient
+from core.rate_limiter import RateLimiter, RateLimitExceeded, _limit_llm_call, estimate_tokens, parse_rate
+import core.rate_limiter as rate_limiter
+
+
+def test_parse_rate():
+    """Budgets are 'calls/seconds'; empty means unlimited"""
+    assert parse_rate("5/60") == (5.0, 60.0)
+    assert parse_rate("30") == (30.0, 1.0)
+    assert parse_rate("") is None
+    assert parse_rate("  ") is None
+
+
+def test_burst_then_queue():
+    """Calls within capacity pass at once; the next one waits for a refill"""
+    limiter = RateLimiter(":memory:", max_wait=1)
+    bucket = limiter.bucket("alpha_vantage", capacity=2, period=0.2)
+
+    assert bucket.acquire() == 0
+    assert bucket.acquire() == 0
+
+    start = time.monotonic()
+    waited = bucket.acquire()
+    assert 0.05 < waited <= 0.1
+    assert time.monotonic() - start >= waited
+    print("✓ Burst admitted, overflow queued")
+
+
+def test_rejected_beyond_max_wait():
+    """A call that would wait longer than allowed fails fast and is counted"""
+    limiter = RateLimiter(":memory:", max_wait=0.5)
+    bucket = limiter.bucket("newsapi", capacity=1, period=3600)
+
+    bucket.acquire()
+    start = time.monotonic()
+    with pytest.raises(RateLimitExceeded):
+        bucket.acquire()
+    assert time.monotonic() - start < 0.1
+    assert limiter.stats()["rejected"] == {"newsapi": 1}
+    assert isinstance(RateLimitExceeded("x"), requests.exceptions.RequestException)
+
+
+def test_wait_capped_by_request_deadline():
+    """The wait never runs past the request's remaining budget"""
+    limiter = RateLimiter(":memory:", max_wait=10)
+    bucket = limiter.bucket("serpapi", capacity=1, period=1)
+
+    bucket.acquire()
+    with deadline_scope(0.2):
+        with pytest.raises(RateLimitExceeded):
+            bucket.acquire()
+
+
+def test_workers_share_one_budget(tmp_path):
+    """Two limiters on the same file (as two worker processes) draw from one bucket"""
+    path = str(tmp_path / "rate_limits.db")
+    first = RateLimiter(path, max_wait=0).bucket("alpha_vantage", capacity=3, period=60)
+    second = RateLimiter(path, max_wait=0).bucket("alpha_vantage", capacity=3, period=60)
+
+    first.acquire()
+    second.acquire()
+    first.acquire()
+    with pytest.raises(RateLimitExceeded):
+        second.acquire()
+    print("✓ Budget shared across workers")
+
+
+def test_http_client_limits_configured_hosts():
+    """Requests to a limited host take a token; other hosts are untouched"""
+    limiter = RateLimiter(":memory:", max_wait=0)
+    client = HttpClient(pool_connections=1, pool_maxsize=1, max_retries=0, backoff_factor=0, connect_timeout=5, read_timeout=30,
+                        rate_limits={"www.alphavantage.co": limiter.bucket("alpha_vantage", 1, 60)})
+    sent = []
+    client.session.get = lambda url, **kwargs: sent.append(url) or requests.Response()
+
+    client.get("https://www.alphavantage.co/query")
+    with pytest.raises(RateLimitExceeded):
+        client.get("https://www.alphavantage.co/query")
+    client.get("https://newsapi.org/v2/everything")
+
+    assert sent == ["https://www.alphavantage.co/query", "https://newsapi.org/v2/everything"]
+
+
+def test_open_circuit_spends_no_quota():
+    """A call to an upstream whose circuit is open fails at once without taking a token"""
+    limiter = RateLimiter(":memory:", max_wait=5)
+    bucket = limiter.bucket("alpha_vantage", 1, 60)
+    breaker = CircuitBreaker("alpha_vantage", failure_threshold=1, reset_timeout=60)
+    client = HttpClient(pool_connections=1, pool_maxsize=1, max_retries=0, backoff_factor=0, connect_timeout=5, read_timeout=30,
+                        rate_limits={"www.alphavantage.co": bucket}, breakers={"www.alphavantage.co": breaker})
+    client.session.get = lambda url, **kwargs: pytest.fail("request should not be sent")
+
+    breaker.record_failure()
+    start = time.monotonic()
+    with pytest.raises(CircuitOpenError):
+        client.get("https://www.alphavantage.co/query")
+
+    assert time.monotonic() - start < 0.1
+    assert bucket.acquire(max_wait=0) == 0
+
+
+def test_rate_limited_probe_released():
+    """A half-open probe that never got quota does not block the next probe"""
+    limiter = RateLimiter(":memory:", max_wait=0)
+    breaker = CircuitBreaker("alpha_vantage", failure_threshold=1, reset_timeout=0.01)
+    client = HttpClient(pool_connections=1, pool_maxsize=1, max_retries=0, backoff_factor=0, connect_timeout=5, read_timeout=30,
+                        rate_limits={"www.alphavantage.co": limiter.bucket("alpha_vantage", 1, 60)},
+                        breakers={"www.alphavantage.co": breaker})
+
+    breaker.record_failure()
+    time.sleep(0.02)
+    limiter.bucket("alpha_vantage", 1, 60).acquire()
+    with pytest.raises(RateLimitExceeded):
+        client.get("https://www.alphavantage.co/query")
+
+    breaker.before_call()
+
+
+def test_llm_hook_blocks_over_budget(monkeypatch):
+    """The CrewAI hook lets calls through within budget and blocks them beyond it"""
+    limiter = RateLimiter(":memory:", max_wait=0)
+    monkeypatch.setattr(rate_limiter, "_buckets", {
+        "llm_requests": limiter.bucket("llm_requests", 1, 60),
+        "llm_tokens": None
+    })
+    context = SimpleNamespace(messages=[{"role": "user", "content": "x" * 400}])
+
+    assert estimate_tokens(context.messages) == 101
+    assert _limit_llm_call(context) is None
+    assert _limit_llm_call(context) is False
+
+
+if __name__ == "__main__":
+    print("Run with: python -m pytest tests/test_rate_limiter.py -v")
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Test Persistent Search Result Cache
+"""
+import time
+from core.search_cache import SearchCache, cacheable_params
+from tools.news_api import NewsAPITool
+from tools.serp_api import SerpAPITool
+
+
+RESULTS = [{"title": "Gold hits record", "link": "https://www.reuters.com/x", "snippet": "..."}]
+
+
+def _cache(path=":memory:", **overrides):
+    settings = dict(max_entries=100, ttls={"serp_google": 60, "newsapi": 60})
+    settings.update(overrides)
+    return SearchCache(path, **settings)
+
+
+def test_normalized_query_shares_entry():
+    """Case and whitespace differences hit the same entry; parameters do not"""
+    cache = _cache()
+    cache.put("serp_google", "Gold price  TODAY", {"num": 5}, RESULTS)
+
+    assert cache.get("serp_google", "gold price today", {"num": 5}) == RESULTS
+    assert cache.get("serp_google", "gold price today", {"num": 10}) is None
+    assert cache.get("serp_google", "gold price today", {"num": 5, "tbs": "qdr:d"}) is None
+    assert cache.stats()["hits"] == 1
+    print("✓ Normalized query hit, different params missed")
+
+
+def test_entries_expire_per_endpoint():
+    """Each endpoint uses its own TTL"""
+    cache = _cache(ttls={"serp_news": 0.05, "serp_google": 60})
+    cache.put("serp_news", "election results", {}, RESULTS)
+    cache.put("serp_google", "election results", {}, RESULTS)
+    time.sleep(0.1)
+
+    assert cache.get("serp_news", "election results", {}) is None
+    assert cache.get("serp_google", "election results", {}) == RESULTS
+
+
+def test_size_cap_evicts_least_recently_used():
+    """Past max_entries the least recently read entry goes first"""
+    cache = _cache(max_entries=2)
+    cache.put("serp_google", "first", {}, RESULTS)
+    time.sleep(0.01)
+    cache.put("serp_google", "second", {}, RESULTS)
+    time.sleep(0.01)
+    cache.get("serp_google", "first", {})
+    time.sleep(0.01)
+    cache.put("serp_google", "third", {}, RESULTS)
+
+    assert cache.get("serp_google", "second", {}) is None
+    assert cache.get("serp_google", "first", {}) == RESULTS
+    assert cache.stats()["evictions"] == 1
+    print("✓ LRU entry evicted")
+
+
+def test_survives_restart(tmp_path):
+    """Results written by one process are read by the next"""
+    path = str(tmp_path / "search_cache.db")
+    first = _cache(path)
+    first.put("newsapi", "rbi repo rate", {"language": "en"}, RESULTS)
+    first.close()
+
+    second = _cache(path)
+    assert second.get("newsapi", "rbi repo rate", {"language": "en"}) == RESULTS
+    second.close()
+
+
+def test_tools_skip_upstream_on_hit():
+    """Repeat searches are served from cache; errors are never stored"""
+    cache = _cache()
+    serp = SerpAPITool(search_cache=cache)
+    serp.api_key = "test"
+    calls = []
+
+    def fake_request(params, num_results):
+        calls.append(params["q"])
+        return [{"error": "SerpAPI error: quota"}] if "fail" in params["q"] else list(RESULTS)
+
+    serp._request_google_search = fake_request
+
+    assert serp.google_search("Gold price today") == RESULTS
+    assert serp.google_search("gold price today") == RESULTS
+    serp.google_search("fail query")
+    serp.google_search("fail query")
+
+    assert calls == ["Gold price today", "fail query", "fail query"]
+    print("✓ SerpAPI hit served from cache")
+
+
+def test_news_params_exclude_credentials():
+    """API keys and the raw query never become part of the stored parameters"""
+    news = NewsAPITool(search_cache=_cache())
+    news.api_key = "secret"
+    seen = []
+    news._request_search_news = lambda params: seen.append(cacheable_params(params)) or list(RESULTS)
+
+    news.search_news("rbi repo rate", from_date="2024-06-01", to_date="2024-06-07")
+
+    assert seen == [{"from": "2024-06-01", "to": "2024-06-07", "language": "en",
+                     "sortBy": "relevancy", "pageSize": 5}]
+
+
+if __name__ == "__main__":
+    import pathlib
+    import tempfile
+
+    test_normalized_query_shares_entry()
+    test_entries_expire_per_endpoint()
+    test_size_cap_evicts_least_recently_used()
+    test_survives_restart(pathlib.Path(tempfile.mkdtemp()))
+    test_tools_skip_upstream_on_hit()
+    test_news_params_exclude_credentials()
+
+    print("\n✅ All search cache tests passed!")
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Test Batch URL Ingestion and Domain Politeness
+"""
+import json
+import threading
+import time
+from fastapi.testclient import TestClient
+import api
+from core.domain_politeness import DomainPoliteness
+from core.url_batch import BatchRejected, UrlBatchRunner, interleave_by_domain
+from core.url_canonicalizer import normalize_url
+
+
+def test_domain_concurrency_and_spacing():
+    """One domain gets at most N fetches at once, spaced apart; other domains are unaffected"""
+    politeness = DomainPoliteness(max_concurrent=2, min_interval=0.05)
+    in_flight, peak, starts = {}, {}, {}
+    lock = threading.Lock()
+
+    def fetch(url):
+        with politeness.slot(url):
+            domain = politeness.domain_of(url)
+            with lock:
+                in_flight[domain] = in_flight.get(domain, 0) + 1
+                peak[domain] = max(peak.get(domain, 0), in_flight[domain])
+                starts.setdefault(domain, []).append(time.monotonic())
+            time.sleep(0.1)
+            with lock:
+                in_flight[domain] -= 1
+
+    urls = [f"https://www.reuters.com/a{i}" for i in range(5)] + ["https://m.reuters.com/b", "https://bbc.com/c"]
+    threads = [threading.Thread(target=fetch, args=(url,)) for url in urls]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert peak["reuters.com"] == 2
+    gaps = [b - a for a, b in zip(sorted(starts["reuters.com"]), sorted(starts["reuters.com"])[1:])]
+    assert min(gaps) >= 0.045
+    assert politeness.stats()["reuters.com"]["requests"] == 6
+    assert politeness.stats()["bbc.com"]["waited"] < 0.05
+    print("✓ Per-domain concurrency and spacing enforced")
+
+
+def test_interleave_by_domain():
+    """Fetch order alternates between publishers"""
+    urls = ["https://a.com/1", "https://a.com/2", "https://a.com/3", "https://b.com/1", "https://www.b.com/2"]
+    assert interleave_by_domain(urls) == [
+        "https://a.com/1", "https://b.com/1", "https://a.com/2", "https://www.b.com/2", "https://a.com/3"
+    ]
+
+
+class FakeRouter:
+    """InputRouter stand-in: two claims per article, failures for URLs containing 'broken'"""
+
+    def __init__(self):
+        self.fetched = []
+
+    def route(self, input_type, url):
+        self.fetched.append(url)
+        if "broken" in url:
+            return {"error": "We couldn't retrieve content from the provided link."}
+        return {
+            "input_type": "url",
+            "title": f"Title of {url}",
+            "claims": [f"Claim one from {url}", f"Claim two from {url}"],
+            "metadata": {"word_count": 100, "canonical_url": normalize_url(url)}
+        }
+
+
+def _runner(verify=None, max_active=2):
+    def default_verify(claim):
+        if "explode" in claim:
+            raise RuntimeError("LLM endpoint unreachable")
+        return {"result": f"Verdict: TRUE for {claim}", "verdict": None}
+
+    router = FakeRouter()
+    return UrlBatchRunner(verify=verify or default_verify, router=router, fetch_concurrency=4,
+                          verify_concurrency=2, max_active=max_active), router
+
+
+def _run(runner, urls, verify=True):
+    events = []
+    done = threading.Event()
+
+    def on_event(event, data):
+        events.append((event, data))
+        if event == "done":
+            done.set()
+
+    runner.start(urls, on_event, verify=verify)
+    assert done.wait(5)
+    return events
+
+
+def test_batch_dedupes_and_reports_each_url():
+    """Variants are fetched once; every unique URL yields one result, then done"""
+    runner, router = _runner()
+    events = _run(runner, [
+        "https://news.example.com/gold?utm_source=twitter",
+        "https://www.news.example.com/gold/",
+        "https://other.example.org/broken-link",
+        "https://other.example.org/explode",
+    ])
+
+    results = {data["url"]: data for event, data in events if event == "result"}
+    assert len(router.fetched) == 3
+    assert results["https://news.example.com/gold?utm_source=twitter"]["urls"] == [
+        "https://news.example.com/gold?utm_source=twitter", "https://www.news.example.com/gold/"
+    ]
+    claims = results["https://news.example.com/gold?utm_source=twitter"]["claims"]
+    assert [c["result"] for c in claims] == [f"Verdict: TRUE for {c['claim']}" for c in claims]
+    assert "error" in results["https://other.example.org/broken-link"]
+    assert all("error" in c for c in results["https://other.example.org/explode"]["claims"])
+
+    assert events[-1][0] == "done"
+    assert events[-1][1]["succeeded"] == 2 and events[-1][1]["failed"] == 1
+    assert runner.stats()["active"] == 0
+
+
+def test_extract_only_batch():
+    """verify=False returns extracted claims without calling the verifier"""
+    runner, _ = _runner(verify=lambda claim: (_ for _ in ()).throw(AssertionError("should not verify")))
+    events = _run(runner, ["https://news.example.com/a"], verify=False)
+
+    assert [event for event, _ in events] == ["article", "result", "done"]
+    assert events[1][1]["claims"][0] == {"claim": "Claim one from https://news.example.com/a"}
+
+
+def test_batches_beyond_limit_rejected():
+    """Only max_active batches run at once"""
+    release = threading.Event()
+    runner, _ = _runner(verify=lambda claim: release.wait(5) and {"result": "ok", "verdict": None}, max_active=1)
+    done = threading.Event()
+    runner.start(["https://a.com/1"], lambda event, data: event == "done" and done.set())
+
+    try:
+        runner.start(["https://b.com/1"], lambda event, data: None)
+        raise AssertionError("second batch should be rejected")
+    except BatchRejected:
+        pass
+    finally:
+        release.set()
+
+    assert done.wait(5)
+    assert runner.stats()["rejected"] == 1
+
+
+def _parse_events(body: str):
+    events = []
+    for block in body.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in block.splitlines())
+        events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+def test_endpoint_streams_results(monkeypatch):
+    """POST /verify/urls streams started, per-URL events and done"""
+    runner, _ = _runner()
+    monkeypatch.setattr(api, "url_batch_runner", runner)
+    client = TestClient(api.app)
+
+    response = client.post("/verify/urls", json={"urls": ["https://a.com/x", "https://a.com/x#top", " "]})
+
+    assert response.status_code == 200
+    names = [name for name, _ in _parse_events(response.text)]
+    assert names == ["started", "article", "result", "done"]
+    assert _parse_events(response.text)[0][1] == {"urls": 2, "unique": 1}
+
+
+def test_endpoint_rejects_oversized_batches(monkeypatch):
+    """Empty and too-large batches are refused up front"""
+    monkeypatch.setattr(api.config, "URL_BATCH_MAX_URLS", 2)
+    client = TestClient(api.app)
+
+    assert client.post("/verify/urls", json={"urls": []}).status_code == 400
+    assert client.post("/verify/urls", json={"urls": ["https://a.com/1", "https://a.com/2",
+                                                      "https://a.com/3"]}).status_code == 400
+
+
+if __name__ == "__main__":
+    print("Run with: python -m pytest tests/test_url_batch.py -v")
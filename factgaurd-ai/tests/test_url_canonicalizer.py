@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Test URL Canonicalization
+"""
+from io import BytesIO
+import pytest
+import requests
+from core.article_cache import ArticleCache
+from core.url_canonicalizer import UrlCanonicalizer, find_canonical_link, is_amp_or_mobile, normalize_url
+from tools.article_extractor import ArticleExtractorTool
+
+BODY = "Gold prices rose two percent on Monday after the central bank cut interest rates. " * 3
+
+
+@pytest.mark.parametrize("variant", [
+    "https://www.reuters.com/markets/gold-rallies/",
+    "HTTPS://Reuters.com/markets/gold-rallies?utm_source=twitter&utm_medium=social",
+    "https://m.reuters.com/markets/gold-rallies?fbclid=IwAR0abc#comments",
+    "https://amp.reuters.com/markets/gold-rallies/amp/?gclid=xyz",
+    "https://www.reuters.com/amp/markets/gold-rallies?outputType=amp",
+    "https://reuters.com:443//markets/gold-rallies",
+])
+def test_variants_share_a_key(variant):
+    """Tracking, mobile/AMP, slash, port and fragment variants normalize alike"""
+    assert normalize_url(variant) == "https://reuters.com/markets/gold-rallies"
+
+
+def test_meaningful_parts_kept():
+    """Content-selecting parameters, ports and paths are preserved (and sorted)"""
+    assert normalize_url("https://news.example.com/story?page=2&id=7&utm_campaign=x") == \
+        "https://news.example.com/story?id=7&page=2"
+    assert normalize_url("http://localhost:8080/a.amp.html") == "http://localhost:8080/a.html"
+    assert normalize_url("https://example.com/?outputType=json") == "https://example.com/?outputType=json"
+
+
+class RedirectHttp:
+    """HttpClient stand-in answering every GET as if redirected to target"""
+
+    def __init__(self, target=None):
+        self.target = target
+        self.calls = 0
+
+    def get(self, url, **kwargs):
+        self.calls += 1
+        if self.target is None:
+            raise requests.exceptions.ConnectionError("offline")
+        response = requests.Response()
+        response.status_code = 200
+        response.url = self.target
+        response.raw = BytesIO(b"")
+        return response
+
+
+def test_short_links_resolved_once():
+    """A shortener is followed once per short link, then served from memory"""
+    http = RedirectHttp("https://www.reuters.com/markets/gold-rallies/?utm_source=tw")
+    canonicalizer = UrlCanonicalizer(http_client=http)
+
+    for _ in range(3):
+        target = canonicalizer.resolve("https://bit.ly/3xYz")
+        assert canonicalizer.canonical_key(target) == "https://reuters.com/markets/gold-rallies"
+
+    assert http.calls == 1
+    assert canonicalizer.resolve("https://reuters.com/a") == "https://reuters.com/a"
+    assert http.calls == 1
+    print("✓ Short link resolved and memoized")
+
+
+def test_unresolvable_short_link_kept():
+    """A failed resolution falls back to the short link and is retried next time"""
+    http = RedirectHttp(None)
+    canonicalizer = UrlCanonicalizer(http_client=http)
+
+    assert canonicalizer.resolve("https://t.co/abc") == "https://t.co/abc"
+    canonicalizer.resolve("https://t.co/abc")
+    assert http.calls == 2
+
+
+def test_canonical_link_trusted_only_same_site():
+    """<link rel=canonical> aliases a page only to a URL on the same site"""
+    canonicalizer = UrlCanonicalizer(http_client=RedirectHttp())
+    amp = "https://amp.example-news.com/world/story-123"
+
+    assert find_canonical_link('<head><link rel="canonical" href="/world/story">', amp) == \
+        "https://amp.example-news.com/world/story"
+    assert find_canonical_link('<head></head><body><link rel="canonical" href="/x">', amp) is None
+
+    foreign = '<head><link rel="canonical" href="https://www.reuters.com/markets/gold"></head>'
+    assert canonicalizer.learn_canonical(amp, foreign) is None
+
+    own = '<head><link href="https://www.example-news.com/world/story" rel="canonical"></head>'
+    assert canonicalizer.learn_canonical(amp, own) == "https://example-news.com/world/story"
+    assert canonicalizer.canonical_key(amp + "?utm_source=x") == "https://example-news.com/world/story"
+
+
+def test_canonical_link_followed_only_from_amp_or_mobile():
+    """On shared hosts an ordinary page cannot alias itself to another user's article"""
+    canonicalizer = UrlCanonicalizer(http_client=RedirectHttp())
+    page = '<head><link rel="canonical" href="https://medium.com/@b/real-story"></head>'
+
+    assert canonicalizer.learn_canonical("https://medium.com/@a/post", page) is None
+    assert canonicalizer.canonical_key("https://medium.com/@a/post") == "https://medium.com/@a/post"
+
+    assert is_amp_or_mobile("https://m.example.com/story")
+    assert is_amp_or_mobile("https://example.com/amp/story")
+    assert is_amp_or_mobile("https://example.com/story.amp.html")
+    assert is_amp_or_mobile("https://example.com/story?outputType=amp")
+    assert not is_amp_or_mobile("https://www.example.com/story?outputType=json")
+    assert not is_amp_or_mobile("https://example.com/ampersand")
+
+
+class PageHttp:
+    """HttpClient stand-in serving one HTML page per URL"""
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.fetched = []
+
+    def get(self, url, **kwargs):
+        self.fetched.append(url)
+        response = requests.Response()
+        response.status_code = 200
+        response.headers["Content-Type"] = "text/html"
+        response.raw = BytesIO(self.pages[url].encode())
+        response.url = url
+        return response
+
+
+def test_amp_variants_share_cache_entry():
+    """An article fetched via its AMP URL is reused for the plain URL and tracking variants"""
+    http = PageHttp({
+        "https://news.example.com/amp/s/gold-story": (
+            '<html><head><title>Gold</title><link rel="canonical" href="https://www.example.com/gold-story">'
+            f'</head><body><article><p>{BODY}</p></article></body></html>'
+        )
+    })
+    tool = ArticleExtractorTool(
+        http_client=http,
+        article_cache=ArticleCache(":memory:", max_entries=10, default_ttl=60, max_ttl=3600),
+        canonicalizer=UrlCanonicalizer(http_client=http)
+    )
+
+    first = tool.extract_article("https://news.example.com/amp/s/gold-story")
+    assert first["canonical_url"] == "https://news.example.com/s/gold-story"
+
+    # The canonical link points at another host (example.com), so only URL normalization applies
+    again = tool.extract_article("https://news.example.com/s/gold-story/?utm_source=whatsapp")
+    assert again["content"] == first["content"]
+    assert http.fetched == ["https://news.example.com/amp/s/gold-story"]
+
+
+def test_declared_canonical_shared_across_variants():
+    """AMP variants reuse the main version's own entry; the AMP copy is never stored under it"""
+    amp = "https://amp.example.com/markets/gold-story.amp.html"
+    main = "https://www.example.com/markets/gold-story-2024"
+    http = PageHttp({
+        amp: (
+            '<html><head><title>Gold</title><link rel="canonical" href="/markets/gold-story-2024">'
+            f'</head><body><article><p>{BODY}</p></article></body></html>'
+        ),
+        main: f'<html><head><title>Gold</title></head><body><article><p>{BODY} Full.</p></article></body></html>'
+    })
+    tool = ArticleExtractorTool(
+        http_client=http,
+        article_cache=ArticleCache(":memory:", max_entries=10, default_ttl=60, max_ttl=3600),
+        canonicalizer=UrlCanonicalizer(http_client=http)
+    )
+
+    first = tool.extract_article(amp)
+    assert first["canonical_url"] == "https://example.com/markets/gold-story-2024"
+    assert tool.extract_article(amp)["content"] == first["content"]
+    assert http.fetched == [amp]
+
+    # The main URL is fetched itself; afterwards AMP variants are answered from its entry
+    full = tool.extract_article(main)
+    assert full["content"].endswith("Full.")
+    assert tool.extract_article(amp + "?utm_medium=social")["content"] == full["content"]
+    assert http.fetched == [amp, main]
+
+
+def test_page_cannot_plant_content_for_another_url():
+    """A page naming another same-site URL as canonical does not fill that URL's cache entry"""
+    http = PageHttp({
+        "https://medium.com/@a/post": (
+            '<html><head><link rel="canonical" href="https://medium.com/@b/real-story"></head>'
+            f'<body><article><p>{BODY} Planted.</p></article></body></html>'
+        ),
+        "https://medium.com/@b/real-story": f'<html><body><article><p>{BODY} Genuine.</p></article></body></html>'
+    })
+    tool = ArticleExtractorTool(
+        http_client=http,
+        article_cache=ArticleCache(":memory:", max_entries=10, default_ttl=60, max_ttl=3600),
+        canonicalizer=UrlCanonicalizer(http_client=http)
+    )
+
+    tool.extract_article("https://medium.com/@a/post")
+    assert tool.extract_article("https://medium.com/@b/real-story")["content"].endswith("Genuine.")
+    assert http.fetched == ["https://medium.com/@a/post", "https://medium.com/@b/real-story"]
+
+
+if __name__ == "__main__":
+    print("Run with: python -m pytest tests/test_url_canonicalizer.py -v")
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Test Verdict Cache
+"""
+import time
+from core.verdict_cache import VerdictCache, normalize_claim
+from schemas.claim_schema import RoutingDecision
+
+
+def _routing(intent, time_sensitive=False):
+    return RoutingDecision(
+        intent=intent,
+        time_sensitive=time_sensitive,
+        required_agents=[],
+        reasoning="test"
+    )
+
+
+def _cache(**overrides):
+    settings = dict(max_size=10, finance_ttl=600, news_ttl=10800,
+                    general_ttl=259200, time_sensitive_ttl=3600)
+    settings.update(overrides)
+    return VerdictCache(**settings)
+
+
+def test_normalization():
+    """Case, punctuation and whitespace differences share a key"""
+    assert normalize_claim("Gold price is UP today!") == normalize_claim("  gold   price is up today ")
+    assert normalize_claim("Gold, silver.") == "gold silver"
+    print("✓ Claims normalized")
+
+
+def test_numbers_keep_distinct_keys():
+    """Decimal points, thousands separators and percent signs are part of the key"""
+    assert normalize_claim("Inflation is 3.5% this year.") == "inflation is 3.5% this year"
+    assert normalize_claim("Inflation is 3.5% this year") != normalize_claim("Inflation is 35% this year")
+    assert normalize_claim("It costs $2,000") != normalize_claim("It costs $20.00")
+    assert normalize_claim("Gold hit $2,000.") == "gold hit $2,000"
+
+
+def test_currency_and_sign_keep_distinct_keys():
+    """Currency symbols and minus signs before numbers are part of the key"""
+    assert normalize_claim("Gold costs $2,000 per ounce") != normalize_claim("Gold costs ₹2,000 per ounce")
+    assert normalize_claim("Sensex fell -3% today") != normalize_claim("Sensex fell 3% today")
+    assert normalize_claim("COVID-19 cases rose") == "covid19 cases rose"
+
+
+def test_url_variants_share_a_verdict():
+    """Pasted links differing only in tracking parameters, AMP path or slash hit one entry"""
+    cache = _cache()
+    cache.put("https://www.reuters.com/markets/gold-rallies/?utm_source=twitter", "VERIFIED", _routing("news"))
+
+    assert cache.get("https://reuters.com/amp/markets/gold-rallies?fbclid=IwAR0abc") == "VERIFIED"
+    assert cache.get("www.reuters.com/markets/gold-rallies") == "VERIFIED"
+    assert cache.get("https://reuters.com/markets/gold-falls") is None
+    assert cache.stats()["hits"] == 2
+
+
+def test_hit_and_miss_counters():
+    """Repeated claim is served from cache and counted"""
+    cache = _cache()
+
+    assert cache.get("The Eiffel Tower is in Paris") is None
+    cache.put("The Eiffel Tower is in Paris", "Verdict: SUPPORTED", _routing("general"))
+    assert cache.get("the eiffel tower is in paris.") == "Verdict: SUPPORTED"
+
+    stats = cache.stats()
+    print(f"✓ Stats: {stats}")
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["size"] == 1
+
+
+def test_ttl_by_intent():
+    """Finance expires in minutes, news in hours, general in days"""
+    cache = _cache()
+
+    assert cache.ttl_for(_routing("finance")) == 600
+    assert cache.ttl_for(_routing("mixed")) == 600
+    assert cache.ttl_for(_routing("news")) == 10800
+    assert cache.ttl_for(_routing("general")) == 259200
+    assert cache.ttl_for(_routing("general", time_sensitive=True)) == 3600
+    assert cache.ttl_for(_routing("finance", time_sensitive=True)) == 600
+    print("✓ TTLs derived from routing")
+
+
+def test_expiry():
+    """Expired entries are misses"""
+    cache = _cache(finance_ttl=0.05)
+
+    cache.put("Gold is up today", "Verdict: SUPPORTED", _routing("finance"))
+    assert cache.get("Gold is up today") is not None
+    time.sleep(0.1)
+    assert cache.get("Gold is up today") is None
+    assert cache.stats()["size"] == 0
+    print("✓ Expired entries dropped")
+
+
+def test_lru_eviction():
+    """Least recently used entry is evicted first"""
+    cache = _cache(max_size=2)
+
+    cache.put("claim one is here", "1", _routing("general"))
+    cache.put("claim two is here", "2", _routing("general"))
+    cache.get("claim one is here")
+    cache.put("claim three is here", "3", _routing("general"))
+
+    assert cache.get("claim two is here") is None
+    assert cache.get("claim one is here") == "1"
+    assert cache.get("claim three is here") == "3"
+    assert cache.stats()["evictions"] == 1
+    print("✓ LRU eviction")
+
+
+if __name__ == "__main__":
+    test_normalization()
+    test_hit_and_miss_counters()
+    test_ttl_by_intent()
+    test_expiry()
+    test_lru_eviction()
+
+    print("\n✅ All verdict cache tests passed!")
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Test Structured Verdict Parsing
+"""
+import pytest
+from fact_verifier import FactVerifier
+from schemas.verdict_schema import parse_verdict_json
+from config import config
+
+
+VALID_OUTPUT = """```json
+{
+    "verdict": "VERIFIED",
+    "confidence": 0.92,
+    "summary": "Multiple outlets confirm the delivery figure.",
+    "evidence": [
+        {"source_name": "Reuters", "source_type": "News", "content": "Tesla delivered 1.81M cars", "date": "2024-01-02"},
+        "Tesla investor relations"
+    ],
+    "contradictions": []
+}
+```"""
+
+
+class FakePipeline:
+    """Consensus stand-in that replays canned outputs and records feedback"""
+
+    def __init__(self, outputs):
+        self.outputs = list(outputs)
+        self.feedback = []
+
+    def build_consensus(self, claim, routing_reasoning, evidence_summary, format_feedback=""):
+        self.feedback.append(format_feedback)
+        return self.outputs.pop(0)
+
+
+def _verifier_with(outputs):
+    verifier = FactVerifier()
+    pipeline = FakePipeline(outputs)
+    verifier._pipeline = lambda: pipeline
+    return verifier, pipeline
+
+
+def test_parse_fenced_json():
+    """JSON wrapped in a markdown fence validates into a VerdictResult"""
+    verdict = parse_verdict_json(VALID_OUTPUT)
+
+    assert verdict.verdict == "VERIFIED"
+    assert verdict.confidence == 0.92
+    assert verdict.evidence[0].source_name == "Reuters"
+    assert verdict.evidence[1].source_type == "Cited source"
+    print("✓ Fenced JSON parsed")
+
+
+def test_prompt_labels_and_confidence_strings():
+    """Legacy verdict labels and 'High (0.95)' / '85%' confidences are accepted"""
+    supported = parse_verdict_json('{"verdict": "supported", "confidence": "High (0.95)", "summary": "ok"}')
+    false = parse_verdict_json('{"verdict": "FALSE", "confidence": "85%", "summary": "no"}')
+
+    assert supported.verdict == "VERIFIED"
+    assert supported.confidence == 0.95
+    assert false.verdict == "CONTRADICTED"
+    assert false.confidence == 0.85
+    print("✓ Aliases and confidence strings normalized")
+
+
+@pytest.mark.parametrize("text", [
+    "Verdict: SUPPORTED\nConfidence: High (0.9)",
+    '{"verdict": "MAYBE", "confidence": 0.5, "summary": "?"}',
+    '{"verdict": "VERIFIED", "confidence": 0.5',
+])
+def test_invalid_output_raises(text):
+    """Prose, unknown verdicts and truncated JSON are rejected"""
+    with pytest.raises(ValueError):
+        parse_verdict_json(text)
+
+
+def test_build_verdict_retries_with_feedback():
+    """An invalid first answer triggers one corrective retry"""
+    verifier, pipeline = _verifier_with(["Verdict: SUPPORTED", VALID_OUTPUT])
+    routing = verifier.parse_routing_decision("")
+
+    verdict, raw = verifier._build_verdict("Tesla delivered 1.8M cars", routing, "evidence")
+
+    assert verdict is not None and verdict.verdict == "VERIFIED"
+    assert raw == VALID_OUTPUT
+    assert pipeline.feedback[0] == ""
+    assert "rejected" in pipeline.feedback[1]
+    print("✓ Retry recovered a valid verdict")
+
+
+def test_build_verdict_gives_up():
+    """After CONSENSUS_MAX_ATTEMPTS failures the raw text is returned for fallback parsing"""
+    attempts = config.CONSENSUS_MAX_ATTEMPTS
+    verifier, pipeline = _verifier_with(["not json"] * attempts)
+    routing = verifier.parse_routing_decision("")
+
+    verdict, raw = verifier._build_verdict("claim", routing, "evidence")
+
+    assert verdict is None
+    assert raw == "not json"
+    assert len(pipeline.feedback) == attempts
+    print("✓ Gave up after configured attempts")
+
+
+def test_render_verdict_layout():
+    """Rendered text keeps the Verdict / Confidence / Summary / Sources layout"""
+    verifier = FactVerifier()
+    text = verifier._render_verdict(parse_verdict_json(VALID_OUTPUT))
+
+    assert "Verdict: SUPPORTED" in text
+    assert "Confidence: High (0.92)" in text
+    assert "- Reuters — News (2024-01-02)" in text
+    assert text.index("Summary:") < text.index("Sources:")
+    print("✓ Verdict rendered")
+
+
+if __name__ == "__main__":
+    test_parse_fenced_json()
+    test_prompt_labels_and_confidence_strings()
+    test_build_verdict_retries_with_feedback()
+    test_build_verdict_gives_up()
+    test_render_verdict_layout()
+
+    print("\n✅ All verdict parsing tests passed!")
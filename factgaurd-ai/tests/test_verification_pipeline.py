@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Test Prebuilt Verification Pipeline
+"""
+from core.verification_pipeline import VerificationPipeline
+
+
+def test_crews_are_built_once():
+    """Binding a new claim reuses the same Crew and Task objects"""
+    pipeline = VerificationPipeline()
+    crew = pipeline.planning_crew
+    task = crew.tasks[0]
+
+    crew._interpolate_inputs({"claim": "Gold is up today"})
+    crew._interpolate_inputs({"claim": "Silver fell 3% this week"})
+
+    assert pipeline.planning_crew is crew
+    assert crew.tasks[0] is task
+    assert "Silver fell 3% this week" in task.description
+    assert "Gold is up today" not in task.description
+    print("✓ Planning crew reused across claims")
+
+
+def test_planning_prompt_keeps_json_example():
+    """Literal JSON braces in the planner prompt survive interpolation"""
+    pipeline = VerificationPipeline()
+    pipeline.planning_crew._interpolate_inputs({"claim": "Tesla stock hit a record high"})
+    description = pipeline.planning_crew.tasks[0].description
+
+    assert '"intent": "finance"' in description
+    assert "{\n" in description
+    print("✓ JSON example preserved")
+
+
+def test_consensus_binds_evidence():
+    """Consensus crew receives claim, routing reasoning and evidence"""
+    pipeline = VerificationPipeline()
+    pipeline.consensus_crew._interpolate_inputs({
+        "claim": "The Eiffel Tower is in Paris",
+        "routing_reasoning": "General geography claim",
+        "evidence_summary": "Wikipedia: The Eiffel Tower is located in Paris, France.",
+        "format_feedback": ""
+    })
+    description = pipeline.consensus_crew.tasks[0].description
+
+    assert "The Eiffel Tower is in Paris" in description
+    assert "General geography claim" in description
+    assert "Wikipedia: The Eiffel Tower" in description
+    print("✓ Consensus inputs bound")
+
+
+if __name__ == "__main__":
+    test_crews_are_built_once()
+    test_planning_prompt_keeps_json_example()
+    test_consensus_binds_evidence()
+
+    print("\n✅ All verification pipeline tests passed!")
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Test Server-Sent Events Progress Stream
+"""
+import json
+from fastapi.testclient import TestClient
+import api
+
+
+def _parse_events(body: str):
+    """Split an SSE body into (event, data) pairs"""
+    events = []
+    for block in body.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in block.splitlines())
+        events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+def test_stream_emits_stage_events():
+    """Each pipeline stage arrives as its own event, ending with done"""
+    def fake_verify_claim(claim, skip_validation=False, on_event=None):
+        on_event("routing", {"intent": "finance", "required_agents": ["finance_agent"]})
+        on_event("evidence", {"agent": "finance_agent", "status": "ok", "evidence": "XAU up 1%"})
+        on_event("consensus", {"evidence_count": 1})
+        on_event("verdict", {"result": "Verdict: SUPPORTED", "cached": False})
+        return "Verdict: SUPPORTED"
+
+    original = api.fact_verifier.verify_claim
+    api.fact_verifier.verify_claim = fake_verify_claim
+    try:
+        client = TestClient(api.app)
+        response = client.post("/verify/stream", json={"claim": "Gold is up today"})
+    finally:
+        api.fact_verifier.verify_claim = original
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+
+    events = _parse_events(response.text)
+    names = [name for name, _ in events]
+    print(f"✓ Events: {names}")
+    assert names == ["started", "routing", "evidence", "consensus", "verdict", "done"]
+    assert events[2][1]["agent"] == "finance_agent"
+
+
+def test_stream_reports_errors():
+    """A pipeline exception becomes an error event, not a dropped connection"""
+    def failing_verify_claim(claim, skip_validation=False, on_event=None):
+        raise RuntimeError("LLM endpoint unreachable")
+
+    original = api.fact_verifier.verify_claim
+    api.fact_verifier.verify_claim = failing_verify_claim
+    try:
+        client = TestClient(api.app)
+        response = client.post("/verify/stream", json={"claim": "Gold is up today"})
+    finally:
+        api.fact_verifier.verify_claim = original
+
+    events = _parse_events(response.text)
+    assert [name for name, _ in events] == ["started", "error", "done"]
+    assert "unreachable" in events[1][1]["detail"]
+    print("✓ Error event delivered")
+
+
+def test_stream_requires_input():
+    """Empty requests are rejected up front"""
+    client = TestClient(api.app)
+    response = client.post("/verify/stream", json={})
+    assert response.status_code == 400
+
+
+if __name__ == "__main__":
+    test_stream_emits_stage_events()
+    test_stream_reports_errors()
+    test_stream_requires_input()
+
+    print("\n✅ All streaming tests passed!")
@@ -5,9 +5,11 @@ Initialize tools package
 from tools.alpha_vantage import AlphaVantageTool
 from tools.news_api import NewsAPITool
 from tools.serp_api import SerpAPITool
+from tools.evidence_sweep import EvidenceSweepTool
 
 __all__ = [
     'AlphaVantageTool',
     'NewsAPITool',
-    'SerpAPITool'
+    'SerpAPITool',
+    'EvidenceSweepTool'
 ]
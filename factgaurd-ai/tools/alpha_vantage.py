@@ -1,14 +1,24 @@
-import requests
 from typing import Dict, Optional
 from config import config
+from core.http_client import HttpClient, get_http_client
+from core.metrics import instrument_tool
+from core.quote_cache import QuoteCache
+from core.single_flight import SingleFlight
 
 class AlphaVantageTool:
     """Tool for fetching financial data from Alpha Vantage API"""
     
-    def __init__(self):
+    def __init__(self, http_client: Optional[HttpClient] = None, quote_cache: Optional[QuoteCache] = None):
         self.api_key = config.ALPHA_VANTAGE_KEY
         self.base_url = config.ALPHA_VANTAGE_BASE_URL
+        self.http = http_client or get_http_client()
         self.usd_to_inr = config.USD_TO_INR_RATE
+        # The free tier allows a handful of calls per minute - share and reuse them
+        self.quote_cache = quote_cache or QuoteCache(
+            open_ttl=config.QUOTE_CACHE_TTL_OPEN,
+            closed_ttl=config.QUOTE_CACHE_TTL_CLOSED
+        )
+        self.flights = SingleFlight()
     
     def _format_price(self, usd_price: str) -> str:
         """Convert USD price to INR and format as '₹INR (USD $amount)'"""
@@ -19,6 +29,31 @@ class AlphaVantageTool:
         except (ValueError, TypeError):
             return usd_price
     
+    def _coalesced(self, key: tuple, market: str, fetch) -> Optional[Dict]:
+        """
+        Serve a quote from cache, or fetch it once for all concurrent callers
+        
+        Args:
+            key: Cache / in-flight key, e.g. ('quote', 'TSLA')
+            market: 'equity' or 'forex' - decides the cache TTL
+            fetch: Zero-argument callable hitting Alpha Vantage
+        
+        Returns:
+            A copy of the quote dictionary (errors are returned but never cached)
+        """
+        cached = self.quote_cache.get(key)
+        if cached is not None:
+            return dict(cached)
+        
+        def load():
+            result = fetch()
+            if result and "error" not in result:
+                self.quote_cache.put(key, result, market)
+            return result
+        
+        result = self.flights.do(key, load)
+        return dict(result) if result is not None else None
+    
     def get_stock_quote(self, symbol: str) -> Optional[Dict]:
         """
         Get real-time stock quote for a given symbol
@@ -29,6 +64,12 @@ class AlphaVantageTool:
         Returns:
             Dictionary with stock data or None if error
         """
+        symbol = symbol.upper()
+        return self._coalesced(("quote", symbol), "equity", lambda: self._request_stock_quote(symbol))
+    
+    @instrument_tool("alpha_vantage", method="get_stock_quote")
+    def _request_stock_quote(self, symbol: str) -> Optional[Dict]:
+        """Fetch a GLOBAL_QUOTE from Alpha Vantage (uncached)"""
         if not self.api_key:
             return {"error": "Alpha Vantage API key not configured"}
         
@@ -39,7 +80,7 @@ class AlphaVantageTool:
         }
         
         try:
-            response = requests.get(self.base_url, params=params, timeout=30)
+            response = self.http.get(self.base_url, params=params)
             response.raise_for_status()
             data = response.json()
             
@@ -94,6 +135,12 @@ class AlphaVantageTool:
         Returns:
             Dictionary with forex data or None if error
         """
+        pair = (from_currency.upper(), to_currency.upper())
+        return self._coalesced(("forex",) + pair, "forex", lambda: self._request_forex_rate(*pair))
+    
+    @instrument_tool("alpha_vantage", method="get_forex_rate")
+    def _request_forex_rate(self, from_currency: str, to_currency: str) -> Optional[Dict]:
+        """Fetch a CURRENCY_EXCHANGE_RATE from Alpha Vantage (uncached)"""
         if not self.api_key:
             return {"error": "Alpha Vantage API key not configured"}
         
@@ -105,7 +152,7 @@ class AlphaVantageTool:
         }
         
         try:
-            response = requests.get(self.base_url, params=params, timeout=30)
+            response = self.http.get(self.base_url, params=params)
             response.raise_for_status()
             data = response.json()
             
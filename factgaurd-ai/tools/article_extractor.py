@@ -3,24 +3,76 @@ Article Extractor Tool
 Fetches and extracts clean text content from article URLs
 """
 import requests
-from bs4 import BeautifulSoup
-from typing import Dict, Optional
+import sqlite3
+from contextlib import nullcontext
+from typing import Dict, Mapping, Optional, Tuple
 import re
 from urllib.parse import urlparse
+from config import config
 from schemas.response_messages import (
     network_issue, 
     timeout_issue,
+    not_an_article_link,
     classify_url_issue
 )
+from core.article_cache import ArticleCache, get_article_cache
+from core.deadline import DeadlineExceeded, current_deadline
+from core.domain_politeness import DomainPoliteness
+from core.html_extractor import get_extractor
+from core.http_client import HttpClient, get_http_client
+from core.metrics import instrument_tool
+from core.url_canonicalizer import UrlCanonicalizer, get_url_canonicalizer, normalize_url
+
+
+# Content types parsed as articles; a missing Content-Type is sniffed by the parser
+HTML_CONTENT_TYPES = ("text/html", "application/xhtml+xml")
+CHUNK_SIZE = 64 * 1024
+# Streaming stops this far past the close of the first top-level <article> holding at least
+# ARTICLE_MIN_TEXT bytes of text - nav teasers and template strings are too small to count
+ARTICLE_TAG = re.compile(rb'<(/?)article[\s>/]', re.IGNORECASE)
+ARTICLE_MIN_TEXT = 1024
+ARTICLE_TAIL_BYTES = 64 * 1024
+
+
+class NotAnArticle(Exception):
+    """Response is not an HTML page within the size cap"""
 
 
 class ArticleExtractorTool:
     """Tool for extracting readable text from article URLs"""
     
-    def __init__(self, timeout: int = 30):
+    def __init__(
+        self,
+        timeout: Optional[float] = None,
+        http_client: Optional[HttpClient] = None,
+        max_bytes: Optional[int] = None,
+        extractor: Optional[str] = None,
+        article_cache: Optional[ArticleCache] = None,
+        canonicalizer: Optional[UrlCanonicalizer] = None,
+        politeness: Optional[DomainPoliteness] = None
+    ):
+        """
+        Args:
+            timeout: Request timeout override; defaults to the HTTP client's per-host timeout
+            http_client: Pooled client to fetch with; defaults to the shared one
+            max_bytes: Most body bytes read per page; defaults to config.ARTICLE_MAX_BYTES
+            extractor: HTML extraction backend ('lxml', 'soup' or 'auto'); defaults to config.HTML_EXTRACTOR
+            article_cache: Extracted-article cache; defaults to the shared one (None when disabled)
+            canonicalizer: Maps URL variants and short links to cache keys; defaults to the shared one
+            politeness: Per-domain fetch limits; cache hits never wait on them (default: unlimited)
+        """
         self.timeout = timeout
+        self.http = http_client or get_http_client()
+        self.max_bytes = max_bytes or config.ARTICLE_MAX_BYTES
+        self.extractor = get_extractor(extractor or config.HTML_EXTRACTOR)
+        if article_cache is None and config.ARTICLE_CACHE_MAX_ENTRIES > 0:
+            article_cache = get_article_cache()
+        self.article_cache = article_cache
+        self.canonicalizer = canonicalizer or get_url_canonicalizer()
+        self.politeness = politeness
         self.headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+            'Accept': 'text/html,application/xhtml+xml;q=0.9,*/*;q=0.1'
         }
     
     def is_valid_url(self, url: str) -> bool:
@@ -31,6 +83,7 @@ class ArticleExtractorTool:
         except:
             return False
     
+    @instrument_tool("article_extractor")
     def extract_article(self, url: str) -> Dict[str, str]:
         """
         Extract article content from URL
@@ -45,47 +98,35 @@ class ArticleExtractorTool:
         if not self.is_valid_url(url):
             return {"error": f"Invalid URL format: {url}"}
         
+        # Expand short links, then key the cache on the canonical form of the target
+        target = self.canonicalizer.resolve(url)
+        key = self.canonicalizer.canonical_key(target)
+        cached = self._cache_call("lookup", key)
+        if cached and cached["fresh"]:
+            return self._article(url, key, cached["title"], cached["content"])
+        
+        # Content is only ever stored under the key of the URL actually fetched; a learned
+        # AMP alias is just a lookup shortcut to the main version's own entry
+        fetched_key = normalize_url(target)
+        if fetched_key != key:
+            cached = self._cache_call("lookup", fetched_key)
+            if cached and cached["fresh"]:
+                return self._article(url, key, cached["title"], cached["content"])
+        
         try:
-            # Fetch HTML
-            response = requests.get(url, headers=self.headers, timeout=self.timeout)
-            response.raise_for_status()
+            # Fetch HTML, revalidating a stale cached copy if there is one
+            conditional = ArticleCache.conditional_headers(cached)
+            html, response_headers = self.fetch_html(target, conditional)
+            if html is None and cached:
+                # 304 Not Modified - the cached extraction is still current
+                self._cache_call("refresh", fetched_key, response_headers)
+                return self._article(url, key, cached["title"], cached["content"])
             
-            # Parse HTML
-            soup = BeautifulSoup(response.text, 'html.parser')
+            # AMP and mobile pages name their main version in <link rel="canonical">
+            canonical = self.canonicalizer.learn_canonical(target, html)
             
-            # Remove unwanted elements
-            for element in soup(['script', 'style', 'nav', 'footer', 'aside', 
-                                'header', 'iframe', 'noscript', 'form']):
-                element.decompose()
-            
-            # Extract title
-            title = soup.find('title')
-            title_text = title.get_text().strip() if title else "No title"
-            
-            # Extract main content - try common article containers
-            article_text = ""
-            
-            # Try semantic HTML5 tags first
-            article = soup.find('article')
-            if article:
-                article_text = article.get_text(separator=' ', strip=True)
-            else:
-                # Try common content class names
-                content_selectors = [
-                    'main', '[role="main"]', '.article-content', '.post-content',
-                    '.entry-content', '.content', '#content', '.article-body'
-                ]
-                
-                for selector in content_selectors:
-                    content = soup.select_one(selector)
-                    if content:
-                        article_text = content.get_text(separator=' ', strip=True)
-                        break
-                
-                # Fallback: get all paragraphs
-                if not article_text:
-                    paragraphs = soup.find_all('p')
-                    article_text = ' '.join([p.get_text(strip=True) for p in paragraphs])
+            # Extract title and main content (<article>, content containers, then all <p>)
+            title_text, article_text = self.extractor.extract(html)
             
             # Clean extracted text
             article_text = self._clean_text(article_text)
@@ -95,14 +136,12 @@ class ArticleExtractorTool:
                 # Use smart classification - likely a social media link or restricted content
                 return {"error": classify_url_issue(url)}
             
-            return {
-                "url": url,
-                "title": title_text,
-                "content": article_text,
-                "word_count": len(article_text.split()),
-                "source": "Article Extractor"
-            }
+            article = self._article(url, canonical or key, title_text, article_text)
+            self._cache_call("store", fetched_key, article, response_headers)
+            return article
             
+        except NotAnArticle:
+            return {"error": not_an_article_link()}
         except requests.exceptions.Timeout:
             return {"error": timeout_issue()}
         except requests.exceptions.ConnectionError:
@@ -115,6 +154,123 @@ class ArticleExtractorTool:
             # Generic error - try to classify based on URL
             return {"error": classify_url_issue(url, error_type=str(e))}
     
+    def fetch_html(self, url: str, conditional: Optional[Dict[str, str]] = None):
+        """
+        Stream a page's HTML, refusing non-HTML or oversized responses before reading them
+        
+        Args:
+            url: Page URL
+            conditional: If-None-Match / If-Modified-Since headers for revalidation
+            
+        Returns:
+            (html, response headers). html is decoded text when the response declares a
+            charset, otherwise raw bytes for the parser to sniff (<meta charset>), and
+            None for 304 Not Modified
+            
+        Raises:
+            NotAnArticle: Content-Type is not HTML or Content-Length exceeds max_bytes
+            requests.exceptions.RequestException: Fetch failed (HTTPError for 4xx/5xx)
+        """
+        headers = dict(self.headers, **(conditional or {}))
+        with self.politeness.slot(url) if self.politeness else nullcontext():
+            response = self.http.get(url, headers=headers, timeout=self.timeout, stream=True)
+            try:
+                response.raise_for_status()
+                if response.status_code == 304:
+                    return None, response.headers
+                mime_type, charset = self._parse_content_type(response.headers.get('Content-Type', ''))
+                if mime_type and mime_type not in HTML_CONTENT_TYPES:
+                    raise NotAnArticle(f"{url} is {mime_type}")
+                
+                declared = response.headers.get('Content-Length', '')
+                if declared.isdigit() and int(declared) > self.max_bytes:
+                    raise NotAnArticle(f"{url} is {declared} bytes")
+                
+                body = self._read_capped(response)
+            finally:
+                # Hands the connection back to the pool, or drops it if the body was cut short
+                response.close()
+        
+        if charset:
+            try:
+                return body.decode(charset, errors='replace'), response.headers
+            except LookupError:
+                pass
+        return body, response.headers
+    
+    @staticmethod
+    def _article(url: str, canonical_url: str, title: str, content: str) -> Dict[str, str]:
+        return {
+            "url": url,
+            "canonical_url": canonical_url,
+            "title": title,
+            "content": content,
+            "word_count": len(content.split()),
+            "source": "Article Extractor"
+        }
+    
+    def _cache_call(self, method: str, *args):
+        """Call an article cache method; a broken cache must never fail the extraction"""
+        if self.article_cache is None:
+            return None
+        try:
+            return getattr(self.article_cache, method)(*args)
+        except (sqlite3.Error, ValueError) as e:
+            print(f"⚠️ Article cache {method} failed: {str(e)}")
+            return None
+    
+    def _read_capped(self, response: requests.Response) -> bytes:
+        """Read the body in chunks until max_bytes, shortly after the main <article>, or EOF"""
+        deadline = current_deadline()
+        body = bytearray()
+        scan = {"pos": 0, "depth": 0, "open": 0, "stop_at": None}
+        for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+            body.extend(chunk)
+            if len(body) >= self.max_bytes:
+                del body[self.max_bytes:]
+                break
+            if scan["stop_at"] is None:
+                self._scan_articles(body, scan)
+            if scan["stop_at"] is not None and len(body) >= scan["stop_at"]:
+                break
+            # A server dripping bytes never trips the per-read timeout, so check the budget here
+            if deadline is not None and deadline.expired():
+                raise DeadlineExceeded(f"Request deadline exceeded while reading {response.url}")
+        return bytes(body)
+    
+    @staticmethod
+    def _scan_articles(body: bytearray, scan: Dict[str, Optional[int]]):
+        """
+        Track <article> nesting over newly read bytes and set scan['stop_at'] once a
+        top-level article with enough text has closed
+        """
+        for match in ARTICLE_TAG.finditer(body, scan["pos"]):
+            scan["pos"] = match.end()
+            if not match.group(1):
+                if scan["depth"] == 0:
+                    scan["open"] = match.start()
+                scan["depth"] += 1
+            elif scan["depth"] > 0:
+                scan["depth"] -= 1
+                if scan["depth"] == 0:
+                    text = re.sub(rb'<[^>]*>|\s+', b'', bytes(body[scan["open"]:match.start()]))
+                    if len(text) >= ARTICLE_MIN_TEXT:
+                        scan["stop_at"] = match.end() + ARTICLE_TAIL_BYTES
+                        return
+        # A tag cut off by the chunk boundary starts in the last few bytes; rescan those next time
+        scan["pos"] = max(scan["pos"], len(body) - len(b'</article>'))
+    
+    @staticmethod
+    def _parse_content_type(header: str) -> Tuple[str, Optional[str]]:
+        """Split a Content-Type header into (mime type, charset)"""
+        mime_type, *params = header.split(';')
+        charset = None
+        for param in params:
+            key, _, value = param.partition('=')
+            if key.strip().lower() == 'charset' and value.strip():
+                charset = value.strip().strip('"\'')
+        return mime_type.strip().lower(), charset
+    
     def _clean_text(self, text: str) -> str:
         """Clean and normalize extracted text"""
         # Remove excessive whitespace
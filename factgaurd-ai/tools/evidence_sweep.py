@@ -0,0 +1,122 @@
+"""
+Evidence Sweep Tool
+Runs NewsAPI, Google organic, Google News and fact-check searches concurrently
+and merges them into one deduplicated result set
+"""
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+from urllib.parse import urlparse
+from tools.news_api import NewsAPITool
+from tools.serp_api import SerpAPITool
+
+
+def _url_key(url: str) -> str:
+    """Loose URL identity for de-duplication (scheme, www, query and trailing slash ignored)"""
+    parsed = urlparse(url.strip().lower())
+    host = parsed.netloc[4:] if parsed.netloc.startswith("www.") else parsed.netloc
+    return f"{host}{parsed.path.rstrip('/')}"
+
+
+class EvidenceSweepTool:
+    """One-call search fan-out for the News Agent"""
+
+    def __init__(self, news_client: Optional[NewsAPITool] = None,
+                 serp_client: Optional[SerpAPITool] = None, max_results: int = 10):
+        """
+        Args:
+            news_client: NewsAPI client (defaults to a new one on the shared HTTP pool)
+            serp_client: SerpAPI client (defaults to a new one on the shared HTTP pool)
+            max_results: Cap on merged results returned
+        """
+        self.news_client = news_client or NewsAPITool()
+        self.serp_client = serp_client or SerpAPITool()
+        self.max_results = max_results
+
+    async def sweep_async(self, claim: str, num_results: int = 5) -> List[Dict]:
+        """
+        Run every search channel concurrently and merge the results
+
+        Args:
+            claim: Claim or query to search for
+            num_results: Results requested from each channel
+
+        Returns:
+            Deduplicated results, most corroborated first, each listing the channels that found it
+        """
+        channels = {
+            "newsapi": self.news_client.search_news_async(claim, page_size=num_results),
+            "google": self.serp_client.google_search_async(claim, num_results),
+            "google_news": self.serp_client.search_news_async(claim, num_results),
+            "fact_check": self.serp_client.google_search_async(f'fact check "{claim}"', num_results),
+        }
+        responses = await asyncio.gather(*channels.values(), return_exceptions=True)
+
+        merged: Dict[str, Dict] = {}
+        for channel, response in zip(channels, responses):
+            if isinstance(response, Exception):
+                print(f"⚠️ Evidence sweep channel '{channel}' failed: {str(response)}")
+                continue
+            for item in response or []:
+                if "error" in item:
+                    continue
+                self._merge(merged, channel, item)
+
+        # Stable sort keeps channel order among equally corroborated results
+        results = sorted(merged.values(), key=lambda r: len(r["found_by"]), reverse=True)
+        return results[:self.max_results]
+
+    def sweep(self, claim: str, num_results: int = 5) -> List[Dict]:
+        """Blocking sweep for synchronous callers (CrewAI tools run in worker threads)"""
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.sweep_async(claim, num_results))
+
+        # Already inside an event loop - run the sweep on its own loop in a helper thread
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            return pool.submit(asyncio.run, self.sweep_async(claim, num_results)).result()
+
+    @staticmethod
+    def _merge(merged: Dict[str, Dict], channel: str, item: Dict):
+        url = item.get("link") or item.get("url") or ""
+        key = _url_key(url) if url else f"title:{item.get('title', '').strip().lower()}"
+        snippet = item.get("snippet") or item.get("description") or ""
+        date = item.get("date") or item.get("published_at") or ""
+
+        existing = merged.get(key)
+        if existing is None:
+            merged[key] = {
+                "title": item.get("title", ""),
+                "url": url,
+                "source": item.get("source", "Unknown"),
+                "date": "" if date == "Unknown" else date,
+                "snippet": snippet,
+                "found_by": [channel]
+            }
+            return
+
+        if channel not in existing["found_by"]:
+            existing["found_by"].append(channel)
+        if not existing["snippet"] and snippet:
+            existing["snippet"] = snippet
+        if not existing["date"] and date and date != "Unknown":
+            existing["date"] = date
+
+    @staticmethod
+    def format_results(claim: str, results: List[Dict]) -> str:
+        """Render merged results for the agent"""
+        if not results:
+            return f"No news, web or fact-check results found for: {claim}"
+
+        output = [f"### Evidence Sweep ({len(results)} unique results)\n"]
+        for result in results:
+            output.append(f"**{result['title'] or 'No title'}**")
+            output.append(f"Source: {result['source']} - {result['url'] or 'No link'}")
+            if result["date"]:
+                output.append(f"Date: {result['date']}")
+            if result["snippet"]:
+                output.append(f"Snippet: {result['snippet']}")
+            output.append(f"Found by: {', '.join(result['found_by'])}")
+            output.append("---")
+        return "\n".join(output)
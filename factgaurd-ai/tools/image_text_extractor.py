@@ -8,6 +8,7 @@ import os
 from typing import Dict, Optional
 import re
 from schemas.response_messages import ocr_issue, tesseract_missing
+from core.metrics import instrument_tool
 
 
 class ImageTextExtractorTool:
@@ -61,6 +62,7 @@ class ImageTextExtractorTool:
             print(f"DEBUG: Image verification failed for {file_path}: {e}")
             return False
     
+    @instrument_tool("ocr")
     def extract_text(self, image_path: str) -> Dict[str, str]:
         """
         Extract text from image using OCR
@@ -1,14 +1,19 @@
-import requests
+import asyncio
 from typing import List, Dict, Optional
 from datetime import datetime, timedelta
 from config import config
+from core.http_client import HttpClient, get_http_client
+from core.metrics import instrument_tool
+from core.search_cache import SearchCache, cacheable_params, get_search_cache
 
 class NewsAPITool:
     """Tool for fetching news articles from NewsAPI"""
     
-    def __init__(self):
+    def __init__(self, http_client: Optional[HttpClient] = None, search_cache: Optional[SearchCache] = None):
         self.api_key = config.NEWS_API_KEY
         self.base_url = config.NEWS_API_BASE_URL
+        self.http = http_client or get_http_client()
+        self.search_cache = search_cache or get_search_cache()
     
     def search_news(
         self, 
@@ -52,8 +57,16 @@ class NewsAPITool:
             "apiKey": self.api_key
         }
         
+        return self.search_cache.get_or_fetch(
+            "newsapi", query, cacheable_params(params),
+            lambda: self._request_search_news(params)
+        )
+    
+    @instrument_tool("news_api", method="search_news")
+    def _request_search_news(self, params: Dict) -> List[Dict]:
+        """Run a NewsAPI /everything search (uncached)"""
         try:
-            response = requests.get(self.base_url, params=params, timeout=30)
+            response = self.http.get(self.base_url, params=params)
             response.raise_for_status()
             data = response.json()
             
@@ -77,6 +90,10 @@ class NewsAPITool:
         except Exception as e:
             return [{"error": f"NewsAPI request failed: {str(e)}"}]
     
+    async def search_news_async(self, query: str, **kwargs) -> List[Dict]:
+        """Awaitable search_news - runs on a worker thread so several searches can overlap"""
+        return await asyncio.to_thread(self.search_news, query, **kwargs)
+    
     def verify_claim_with_news(self, claim: str) -> Dict:
         """
         Verify a claim by searching for relevant news articles
@@ -1,13 +1,18 @@
-import requests
+import asyncio
 from typing import List, Dict, Optional
 from config import config
+from core.http_client import HttpClient, get_http_client
+from core.metrics import instrument_tool
+from core.search_cache import SearchCache, cacheable_params, get_search_cache
 
 class SerpAPITool:
     """Tool for Google search results via SerpAPI"""
     
-    def __init__(self):
+    def __init__(self, http_client: Optional[HttpClient] = None, search_cache: Optional[SearchCache] = None):
         self.api_key = config.SERP_API_KEY
         self.base_url = config.SERP_API_BASE_URL
+        self.http = http_client or get_http_client()
+        self.search_cache = search_cache or get_search_cache()
     
     def google_search(
         self, 
@@ -39,8 +44,16 @@ class SerpAPITool:
         if time_period:
             params["tbs"] = f"qdr:{time_period}"
         
+        return self.search_cache.get_or_fetch(
+            "serp_google", query, cacheable_params(params),
+            lambda: self._request_google_search(params, num_results)
+        )
+    
+    @instrument_tool("serp_api", method="google_search")
+    def _request_google_search(self, params: Dict, num_results: int) -> List[Dict]:
+        """Run a SerpAPI Google search (uncached)"""
         try:
-            response = requests.get(self.base_url, params=params, timeout=30)
+            response = self.http.get(self.base_url, params=params)
             response.raise_for_status()
             data = response.json()
             
@@ -84,8 +97,16 @@ class SerpAPITool:
             "tbm": "nws"  # News search
         }
         
+        return self.search_cache.get_or_fetch(
+            "serp_news", query, cacheable_params(params),
+            lambda: self._request_search_news(params, num_results)
+        )
+    
+    @instrument_tool("serp_api", method="search_news")
+    def _request_search_news(self, params: Dict, num_results: int) -> List[Dict]:
+        """Run a SerpAPI Google News search (uncached)"""
         try:
-            response = requests.get(self.base_url, params=params, timeout=30)
+            response = self.http.get(self.base_url, params=params)
             response.raise_for_status()
             data = response.json()
             
@@ -103,11 +124,24 @@ class SerpAPITool:
                 return results if results else [{"error": "No news results found"}]
             else:
                 # Fallback to organic results if news_results not available
-                return self.google_search(query, num_results)
+                return self.google_search(params["q"], num_results)
         
         except Exception as e:
             return [{"error": f"SerpAPI news search failed: {str(e)}"}]
     
+    async def google_search_async(
+        self,
+        query: str,
+        num_results: int = 5,
+        time_period: Optional[str] = None
+    ) -> List[Dict]:
+        """Awaitable google_search - runs on a worker thread so several searches can overlap"""
+        return await asyncio.to_thread(self.google_search, query, num_results, time_period)
+    
+    async def search_news_async(self, query: str, num_results: int = 5) -> List[Dict]:
+        """Awaitable search_news - runs on a worker thread so several searches can overlap"""
+        return await asyncio.to_thread(self.search_news, query, num_results)
+    
     def verify_claim_with_search(self, claim: str) -> Dict:
         """
         Verify a claim using Google search results
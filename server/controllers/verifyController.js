@@ -1,6 +1,94 @@
 
 import Verification from '../models/Verification.js';
 
+const POSITIVE_VERDICTS = ['VERIFIED', 'PARTIALLY TRUE'];
+
+// Map the AI service's VerdictResult onto the shape stored and returned to the frontend
+const fromStructuredVerdict = (verdict) => {
+    let status = 'INCONCLUSIVE';
+    if (verdict.verdict === 'CONTRADICTED') {
+        status = 'CONTRADICTED';
+    } else if (POSITIVE_VERDICTS.includes(verdict.verdict)) {
+        status = 'VERIFIED';
+    }
+
+    const score = Number(verdict.confidence);
+    const level = score >= 0.8 ? 'High' : score >= 0.5 ? 'Medium' : 'Low';
+    const confidence = Number.isFinite(score) ? `${level} (${score.toFixed(2)})` : 'N/A';
+
+    const sources = (verdict.evidence || []).map(source => ({
+        source: source.source_name,
+        title: source.content || source.source_type,
+        date: source.date || "N/A",
+        url: source.url || null
+    }));
+
+    return { status, confidence, sources };
+};
+
+// Fallback for responses without a structured verdict
+const parseTextReport = (aiReport) => {
+    // Robust parsing of the text report
+    let status = "INCONCLUSIVE";
+    let confidence = "N/A";
+
+    // Extract Verdict
+    const verdictMatch = aiReport.match(/Verdict:\s*([A-Z\s]+)/i);
+    if (verdictMatch) {
+        const rawVerdict = verdictMatch[1].toUpperCase().trim();
+
+        // Check NEGATIVE verdicts first to catch "Verified False" etc.
+        if (['CONTRADICTED', 'FALSE', 'FAKE', 'DEBUNKED', 'UNSUPPORTED', 'NOT FACTUAL', 'INCORRECT'].some(v => rawVerdict.includes(v))) {
+            status = 'CONTRADICTED';
+        }
+        // Then check POSITIVE verdicts
+        else if (['VERIFIED', 'SUPPORTED', 'TRUE', 'PARTIALLY TRUE', 'FACTUAL', 'CORRECT'].some(v => rawVerdict.includes(v))) {
+            status = 'VERIFIED';
+        }
+    }
+
+    // Extract Confidence
+    const confidenceMatch = aiReport.match(/Confidence:\s*(.+)/i);
+    if (confidenceMatch) {
+        confidence = confidenceMatch[1].trim();
+    }
+
+    // Extract Sources
+    const sourcesMatch = aiReport.split(/Sources:/i)[1];
+    let structuredSources = [];
+
+    if (sourcesMatch) {
+        const lines = sourcesMatch.split('\n').filter(line => line.trim().length > 0);
+        structuredSources = lines.map(line => {
+            // Try to parse standard format: "1. Source: Title (Date)"
+            // Regex: Number dot Space (Source): (Title) (Date)
+            const match = line.match(/^\d+\.\s*([^:]+):\s*"?([^"(]+)"?\s*(?:\(([^)]+)\))?/);
+
+            if (match) {
+                return {
+                    source: match[1].trim(),
+                    title: match[2].trim(),
+                    date: match[3] ? match[3].trim() : "Recent",
+                    url: null // URL extraction would require more advanced parsing or metadata from Python
+                };
+            }
+
+            // Fallback for less structured lines
+            const cleanLine = line.replace(/^\d+\.\s*/, '').trim();
+            if (cleanLine.length < 5) return null; // Skip garbage
+
+            return {
+                source: "External Source",
+                title: cleanLine,
+                date: "N/A",
+                url: null
+            };
+        }).filter(Boolean); // Remove nulls
+    }
+
+    return { status, confidence, sources: structuredSources };
+};
+
 export const verifyClaim = async (req, res) => {
     try {
         console.log("Received verification request:", req.body);
@@ -46,62 +134,15 @@ export const verifyClaim = async (req, res) => {
 
             const aiReport = (data && data.result) ? String(data.result) : "No report generated.";
 
-            // Robust parsing of the text report
             let status = "INCONCLUSIVE";
             let confidence = "N/A";
-
-            // Extract Verdict
-            const verdictMatch = aiReport.match(/Verdict:\s*([A-Z\s]+)/i);
-            if (verdictMatch) {
-                const rawVerdict = verdictMatch[1].toUpperCase().trim();
-
-                // Check NEGATIVE verdicts first to catch "Verified False" etc.
-                if (['CONTRADICTED', 'FALSE', 'FAKE', 'DEBUNKED', 'UNSUPPORTED', 'NOT FACTUAL', 'INCORRECT'].some(v => rawVerdict.includes(v))) {
-                    status = 'CONTRADICTED';
-                }
-                // Then check POSITIVE verdicts
-                else if (['VERIFIED', 'SUPPORTED', 'TRUE', 'PARTIALLY TRUE', 'FACTUAL', 'CORRECT'].some(v => rawVerdict.includes(v))) {
-                    status = 'VERIFIED';
-                }
-            }
-
-            // Extract Confidence
-            const confidenceMatch = aiReport.match(/Confidence:\s*(.+)/i);
-            if (confidenceMatch) {
-                confidence = confidenceMatch[1].trim();
-            }
-
-            // Extract Sources
-            const sourcesMatch = aiReport.split(/Sources:/i)[1];
             let structuredSources = [];
 
-            if (sourcesMatch) {
-                const lines = sourcesMatch.split('\n').filter(line => line.trim().length > 0);
-                structuredSources = lines.map(line => {
-                    // Try to parse standard format: "1. Source: Title (Date)"
-                    // Regex: Number dot Space (Source): (Title) (Date)
-                    const match = line.match(/^\d+\.\s*([^:]+):\s*"?([^"(]+)"?\s*(?:\(([^)]+)\))?/);
-
-                    if (match) {
-                        return {
-                            source: match[1].trim(),
-                            title: match[2].trim(),
-                            date: match[3] ? match[3].trim() : "Recent",
-                            url: null // URL extraction would require more advanced parsing or metadata from Python
-                        };
-                    }
-
-                    // Fallback for less structured lines
-                    const cleanLine = line.replace(/^\d+\.\s*/, '').trim();
-                    if (cleanLine.length < 5) return null; // Skip garbage
-
-                    return {
-                        source: "External Source",
-                        title: cleanLine,
-                        date: "N/A",
-                        url: null
-                    };
-                }).filter(Boolean); // Remove nulls
+            if (data && data.verdict) {
+                // Structured verdict from the AI service - no text scraping needed
+                ({ status, confidence, sources: structuredSources } = fromStructuredVerdict(data.verdict));
+            } else {
+                ({ status, confidence, sources: structuredSources } = parseTextReport(aiReport));
             }
 
             const result = {